@@ -2,6 +2,6 @@
 #                         __init__.py
 #     Exposes the package-level updater entrypoint import.
 
-from .controller import run_update
+from .controller import run_batch, run_daemon, run_update
 
-__all__ = ["run_update"]
+__all__ = ["run_batch", "run_daemon", "run_update"]
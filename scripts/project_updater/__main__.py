@@ -2,7 +2,29 @@
 #                         __main__.py
 #     Runs the updater package when executed as a module.
 
-from .controller import run_update
+import argparse
+from .controller import run_batch, run_daemon, run_update
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m project_updater",
+        description="Regenerate the generated sections of the profile README.",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--batch", metavar="MANIFEST", help="update every user listed in a JSON batch manifest")
+    mode.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running, polling GitHub and regenerating sections when the resume or config files change",
+    )
+    args = parser.parse_args()
+
+    if args.batch:
+        run_batch(args.batch)
+    elif args.daemon:
+        run_daemon()
+    else:
+        run_update()
 
 if __name__ == "__main__":
-    run_update()
+    main()
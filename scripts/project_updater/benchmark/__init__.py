@@ -0,0 +1,7 @@
+#------------------------------------------------------------
+#                         __init__.py
+#     Exposes the offline benchmark harness entrypoints.
+
+from .runner import run_fixture_benchmark, run_synthetic_benchmarks
+
+__all__ = ["run_fixture_benchmark", "run_synthetic_benchmarks"]
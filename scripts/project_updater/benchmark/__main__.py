@@ -0,0 +1,63 @@
+#------------------------------------------------------------
+#                         __main__.py
+#     Runs the offline benchmark suite from the command line.
+
+import argparse
+import os
+from ..config import (
+    DEFAULT_GITHUB_USERNAME,
+    ENV_GITHUB_TOKEN,
+    ENV_GITHUB_USERNAME,
+    resolve_github_api_base_url,
+)
+from ..models import UpdateConfig
+from .fixtures import load_fixtures, record_fixtures, write_fixtures
+from .runner import (
+    RESULT_TABLE_HEADER,
+    format_result_row,
+    run_fixture_benchmark,
+    run_synthetic_benchmarks,
+    write_results,
+)
+
+DEFAULT_SCALES = "10,100,1000,5000"
+DEFAULT_LATENCY_MS = 20
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m project_updater.benchmark",
+        description="Replay GitHub fixtures through a local stand-in and time run_update end to end.",
+    )
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="comma-separated synthetic repo counts")
+    parser.add_argument("--fixtures", help="replay a fixture directory instead of synthetic data")
+    parser.add_argument("--record", metavar="DIR", help="record fixtures from the live API into DIR and exit")
+    parser.add_argument("--latency-ms", type=int, default=DEFAULT_LATENCY_MS, help="simulated per-request latency")
+    parser.add_argument("--workers", type=int, help="override ENRICHMENT_WORKERS for the runs")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show updater output")
+    args = parser.parse_args()
+
+    if args.record:
+        config = UpdateConfig(
+            github_username=os.environ.get(ENV_GITHUB_USERNAME, DEFAULT_GITHUB_USERNAME),
+            github_token=os.environ.get(ENV_GITHUB_TOKEN, ""),
+            api_base_url=resolve_github_api_base_url(),
+        )
+        fixtures = record_fixtures(config)
+        write_fixtures(fixtures, args.record)
+        print(f"Recorded {len(fixtures.repos)} repositories into {args.record}")
+        return
+
+    print(RESULT_TABLE_HEADER)
+    if args.fixtures:
+        results = [run_fixture_benchmark(load_fixtures(args.fixtures), args.latency_ms, args.workers, args.verbose)]
+        print(format_result_row(results[0]))
+    else:
+        scales = [int(item) for item in args.scales.split(",") if item.strip()]
+        results = run_synthetic_benchmarks(scales, args.latency_ms, args.workers, args.verbose)
+
+    if args.json:
+        write_results(results, args.json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#------------------------------------------------------------
+#                     fixture_server.py
+#        Serves benchmark fixtures through a local HTTP
+#            stand-in for the GitHub REST API.
+
+import base64
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from .fixtures import BenchmarkFixtures
+
+LISTING_PATH_PATTERN = re.compile(r"^/(?:user|users/[^/]+)/repos$")
+README_PATH_PATTERN = re.compile(r"^/repos/([^/]+/[^/]+)/readme$")
+LANGUAGES_PATH_PATTERN = re.compile(r"^/repos/([^/]+/[^/]+)/languages$")
+CONTRIBUTORS_PATH_PATTERN = re.compile(r"^/repos/([^/]+/[^/]+)/contributors$")
+GRAPHQL_PATH = "/graphql"
+GRAPHQL_ALIAS_PATTERN = re.compile(r"\b(r(\d+)): repository\(owner: \$o\2, name: \$n\2\)")
+
+FIXTURE_HOST = "127.0.0.1"
+FIXTURE_RATE_LIMIT = 1_000_000
+FIXTURE_RATE_LIMIT_WINDOW_SECONDS = 3600
+DEFAULT_PER_PAGE = 30
+RAW_MEDIA_TYPE = "application/vnd.github.raw"
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+RAW_CONTENT_TYPE = "text/plain; charset=utf-8"
+
+class FixtureServer:
+
+    # This function does prepare a stand-in server for a fixture set.
+    # It precomputes the pushed-order listing served by repo endpoints.
+    def __init__(self, fixtures: BenchmarkFixtures, latency_ms: int = 0):
+        self.fixtures = fixtures
+        self.latency_seconds = max(0, latency_ms) / 1000
+        self.listing = sorted(fixtures.repos, key=lambda repo: repo.get("pushed_at") or "", reverse=True)
+        self.request_count = 0
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+        self.base_url = ""
+
+    # This function does start serving on an ephemeral localhost port.
+    # It returns the base URL to use as GITHUB_API_URL.
+    def start(self) -> str:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def do_POST(self):
+                server._handle(self)
+
+            def log_message(self, *args):
+                return None
+
+        self.httpd = ThreadingHTTPServer((FIXTURE_HOST, 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://{FIXTURE_HOST}:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self) -> None:
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+        parsed = urlparse(handler.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        raw = RAW_MEDIA_TYPE in (handler.headers.get("Accept") or "")
+        if handler.command == "POST":
+            length = int(handler.headers.get("Content-Length") or 0)
+            status, payload, extra_headers = self._graphql(parsed.path, handler.rfile.read(length))
+        else:
+            status, payload, extra_headers = self._route(parsed.path, query, raw)
+
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        with self.lock:
+            self.request_count += 1
+            remaining = max(0, FIXTURE_RATE_LIMIT - self.request_count)
+
+        headers = {
+            "Content-Type": RAW_CONTENT_TYPE if isinstance(payload, bytes) else JSON_CONTENT_TYPE,
+            "ETag": etag,
+            "X-RateLimit-Limit": str(FIXTURE_RATE_LIMIT),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(time.time()) + FIXTURE_RATE_LIMIT_WINDOW_SECONDS),
+            "X-RateLimit-Resource": "core",
+            **extra_headers,
+        }
+        if status == 200 and handler.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+        with self.lock:
+            self.bytes_sent += len(body)
+
+    def _route(self, path: str, query: Dict[str, str], raw: bool = False) -> Tuple[int, object, Dict[str, str]]:
+        if LISTING_PATH_PATTERN.match(path):
+            return self._listing_page(path, query)
+
+        match = README_PATH_PATTERN.match(path)
+        if match:
+            text = self.fixtures.readmes.get(match.group(1))
+            if text is None:
+                return 404, {"message": "Not Found"}, {}
+            if raw:
+                return 200, text.encode("utf-8"), {}
+            content = base64.b64encode(text.encode("utf-8")).decode("ascii")
+            return 200, {"content": content, "encoding": "base64"}, {}
+
+        match = LANGUAGES_PATH_PATTERN.match(path)
+        if match:
+            return 200, self.fixtures.languages.get(match.group(1), {}), {}
+
+        match = CONTRIBUTORS_PATH_PATTERN.match(path)
+        if match:
+            count = self.fixtures.contributors.get(match.group(1), 0)
+            if count <= 1:
+                return 200, [{"login": "contributor-1"}] * count, {}
+            link = f'<{self.base_url}{path}?per_page=1&anon=true&page={count}>; rel="last"'
+            return 200, [{"login": "contributor-1"}], {"Link": link}
+
+        return 404, {"message": "Not Found"}, {}
+
+    # This function does answer batched contributor-count GraphQL queries.
+    # It reports each fixture repo's contributor count as mentionableUsers.totalCount.
+    def _graphql(self, path: str, body: bytes) -> Tuple[int, object, Dict[str, str]]:
+        if path != GRAPHQL_PATH:
+            return 404, {"message": "Not Found"}, {}
+        try:
+            request = json.loads(body.decode("utf-8"))
+        except ValueError:
+            return 400, {"message": "Problems parsing JSON"}, {}
+
+        variables = request.get("variables") or {}
+        data = {}
+        for alias, index in GRAPHQL_ALIAS_PATTERN.findall(request.get("query") or ""):
+            full_name = f"{variables.get('o' + index)}/{variables.get('n' + index)}"
+            count = self.fixtures.contributors.get(full_name)
+            data[alias] = None if count is None else {"mentionableUsers": {"totalCount": count}}
+        return 200, {"data": data}, {"X-RateLimit-Resource": "graphql"}
+
+    def _listing_page(self, path: str, query: Dict[str, str]) -> Tuple[int, List[dict], Dict[str, str]]:
+        per_page = int(query.get("per_page", DEFAULT_PER_PAGE))
+        page = int(query.get("page", 1))
+        last_page = max(1, -(-len(self.listing) // per_page))
+        items = [
+            {**repo, "languages_url": f"{self.base_url}/repos/{repo.get('full_name')}/languages"}
+            for repo in self.listing[(page - 1) * per_page:page * per_page]
+        ]
+
+        headers: Dict[str, str] = {}
+        if last_page > 1:
+            page_url = f"{self.base_url}{path}?per_page={per_page}&page={{page}}"
+            links = []
+            if page < last_page:
+                links.append(f'<{page_url.format(page=page + 1)}>; rel="next"')
+            links.append(f'<{page_url.format(page=last_page)}>; rel="last"')
+            headers["Link"] = ", ".join(links)
+        return 200, items, headers
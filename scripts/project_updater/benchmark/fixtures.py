@@ -0,0 +1,164 @@
+#------------------------------------------------------------
+#                        fixtures.py
+#        Generates, loads, records, and saves GitHub API
+#              fixtures used by the benchmark.
+
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from ..models import UpdateConfig
+from ..services.github_service import GitHubService, build_repo_record
+
+REPOS_FILENAME = "repos.json"
+CONTRIBUTORS_FILENAME = "contributors.json"
+READMES_DIRNAME = "readmes"
+LANGUAGES_DIRNAME = "languages"
+README_FIXTURE_SUFFIX = ".md"
+LANGUAGES_FIXTURE_SUFFIX = ".json"
+
+SYNTHETIC_SEED = 20240101
+SYNTHETIC_ORGANIZATIONS = ("bench-org", "course-team", "open-source-lab")
+SYNTHETIC_LANGUAGES = ("Python", "TypeScript", "JavaScript", "C#", "Java", "Go", "Rust", "C++", "HTML", "CSS")
+SYNTHETIC_FRAMEWORKS = ("React", "Django", "Flask", "Docker", "Kubernetes", "GraphQL", "Unity", "Express", "Vue")
+SYNTHETIC_SENTENCES = (
+    "{name} is a {language} application that provides a fast dashboard for tracking team progress.",
+    "It implements a modular pipeline built with {framework} and a small REST layer.",
+    "The tool allows contributors to analyze results and export reports in several formats.",
+    "This project builds on {framework} to simulate realistic workloads for testing.",
+    "Installation instructions and the license are listed below for reference.",
+    "A platform for experimenting with {language} services and {framework} deployments.",
+)
+SYNTHETIC_README_LINES = 40
+SYNTHETIC_RECENT_SHARE = 0.2
+SYNTHETIC_HISTORY_DAYS = 730
+
+@dataclass
+class BenchmarkFixtures:
+    repos: List[dict]
+    readmes: Dict[str, str] = field(default_factory=dict)
+    languages: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    contributors: Dict[str, int] = field(default_factory=dict)
+
+# This function does build a deterministic synthetic account.
+# It mixes owned and organization repos with READMEs, languages, and contributors.
+def generate_fixtures(repo_count: int, username: str, seed: int = SYNTHETIC_SEED) -> BenchmarkFixtures:
+    randomizer = random.Random(seed + repo_count)
+    now = datetime.now(timezone.utc)
+    fixtures = BenchmarkFixtures(repos=[])
+
+    for index in range(repo_count):
+        owner = username if randomizer.random() < 0.7 else randomizer.choice(SYNTHETIC_ORGANIZATIONS)
+        name = f"bench-repo-{index:05d}"
+        full_name = f"{owner}/{name}"
+        primary = randomizer.choice(SYNTHETIC_LANGUAGES)
+        # Draw a framework even though it is unused, so the seeded stream stays stable.
+        randomizer.choice(SYNTHETIC_FRAMEWORKS)
+        if randomizer.random() < SYNTHETIC_RECENT_SHARE:
+            pushed_at = now - timedelta(days=randomizer.randint(0, 20))
+        else:
+            pushed_at = now - timedelta(days=randomizer.randint(40, SYNTHETIC_HISTORY_DAYS))
+
+        fixtures.repos.append(
+            {
+                "id": 100000 + index,
+                "name": name,
+                "full_name": full_name,
+                "html_url": f"https://github.com/{full_name}",
+                "description": (
+                    f"{name} provides a {primary} tool for analyzing benchmark data sets quickly and safely."
+                    if randomizer.random() < 0.5
+                    else None
+                ),
+                "private": randomizer.random() < 0.1,
+                "pushed_at": pushed_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "size": randomizer.randint(10, 50000),
+                "stargazers_count": randomizer.randint(0, 50),
+                "forks_count": randomizer.randint(0, 10),
+                "language": primary,
+                "languages_url": f"https://api.github.com/repos/{full_name}/languages",
+                "owner": {"login": owner, "type": "User" if owner == username else "Organization"},
+            }
+        )
+
+        lines = [f"# {name}", f"![badge](https://img.shields.io/badge/{primary}-blue)"]
+        for _ in range(SYNTHETIC_README_LINES):
+            template = randomizer.choice(SYNTHETIC_SENTENCES)
+            lines.append(template.format(name=name, language=primary, framework=randomizer.choice(SYNTHETIC_FRAMEWORKS)))
+        fixtures.readmes[full_name] = "\n\n".join(lines)
+
+        languages = {primary: randomizer.randint(5000, 500000)}
+        for extra in randomizer.sample(SYNTHETIC_LANGUAGES, 2):
+            languages.setdefault(extra, randomizer.randint(100, 20000))
+        fixtures.languages[full_name] = languages
+        fixtures.contributors[full_name] = randomizer.randint(1, 12)
+
+    return fixtures
+
+# This function does load fixtures from a fixture directory.
+# It expects repos.json plus optional readmes/, languages/, and contributors.json.
+def load_fixtures(directory: str) -> BenchmarkFixtures:
+    with open(os.path.join(directory, REPOS_FILENAME), "r", encoding="utf-8") as file_handle:
+        fixtures = BenchmarkFixtures(repos=json.load(file_handle))
+
+    contributors_path = os.path.join(directory, CONTRIBUTORS_FILENAME)
+    if os.path.exists(contributors_path):
+        with open(contributors_path, "r", encoding="utf-8") as file_handle:
+            fixtures.contributors = {str(key): int(value) for key, value in json.load(file_handle).items()}
+
+    for repo in fixtures.repos:
+        full_name = repo.get("full_name") or ""
+        readme_path = os.path.join(directory, READMES_DIRNAME, f"{full_name}{README_FIXTURE_SUFFIX}")
+        if os.path.exists(readme_path):
+            with open(readme_path, "r", encoding="utf-8") as file_handle:
+                fixtures.readmes[full_name] = file_handle.read()
+        languages_path = os.path.join(directory, LANGUAGES_DIRNAME, f"{full_name}{LANGUAGES_FIXTURE_SUFFIX}")
+        if os.path.exists(languages_path):
+            with open(languages_path, "r", encoding="utf-8") as file_handle:
+                fixtures.languages[full_name] = json.load(file_handle)
+
+    return fixtures
+
+# This function does write fixtures in the directory layout load_fixtures reads.
+# It creates per-owner subdirectories for README and language files.
+def write_fixtures(fixtures: BenchmarkFixtures, directory: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, REPOS_FILENAME), "w", encoding="utf-8") as file_handle:
+        json.dump(fixtures.repos, file_handle, indent=2)
+    with open(os.path.join(directory, CONTRIBUTORS_FILENAME), "w", encoding="utf-8") as file_handle:
+        json.dump(fixtures.contributors, file_handle, indent=2, sort_keys=True)
+
+    for full_name, text in fixtures.readmes.items():
+        path = os.path.join(directory, READMES_DIRNAME, f"{full_name}{README_FIXTURE_SUFFIX}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file_handle:
+            file_handle.write(text)
+    for full_name, languages in fixtures.languages.items():
+        path = os.path.join(directory, LANGUAGES_DIRNAME, f"{full_name}{LANGUAGES_FIXTURE_SUFFIX}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file_handle:
+            json.dump(languages, file_handle, indent=2)
+
+# This function does record fixtures from the live GitHub API.
+# It captures the raw listing, README markdown, language maps, and contributor counts.
+def record_fixtures(config: UpdateConfig) -> BenchmarkFixtures:
+    github_service = GitHubService(config)
+    fixtures = BenchmarkFixtures(repos=github_service.fetch_repo_payloads())
+
+    for repo in fixtures.repos:
+        full_name = repo.get("full_name") or ""
+        if not full_name:
+            continue
+
+        readme_text = github_service.fetch_readme_markdown(full_name)
+        if readme_text:
+            fixtures.readmes[full_name] = readme_text
+
+        record = build_repo_record(repo)
+        fixtures.languages[full_name] = dict(github_service.fetch_language_usage(record))
+        fixtures.contributors[full_name] = github_service.fetch_contributor_count(record)
+
+    github_service.close()
+    return fixtures
@@ -0,0 +1,177 @@
+#------------------------------------------------------------
+#                         runner.py
+#        Runs the updater end to end against fixture
+#          servers and reports time, requests, memory.
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..config import (
+    CONTRIBUTOR_STORE_FILENAME,
+    ENV_DISABLE_HTTP_CACHE,
+    ENV_ENRICHMENT_WORKERS,
+    ENV_GITHUB_API_BACKEND,
+    ENV_GITHUB_API_URL,
+    ENV_GITHUB_MAX_REPO_PAGES,
+    ENV_GITHUB_TOKEN,
+    ENV_GITHUB_USERNAME,
+    ENV_INCREMENTAL_UPDATE,
+    ENV_METRICS_REPORT_PATH,
+    ENV_README_PATH,
+    GITHUB_API_BACKEND_REST,
+    GITHUB_REPOS_PER_PAGE,
+    INCREMENTAL_STATE_FILENAME,
+    README_PATH,
+    RESUME_CACHE_FILENAME,
+)
+from ..controller import load_update_config, run_update
+from ..models import UpdateConfig
+from .fixture_server import FixtureServer
+from .fixtures import BenchmarkFixtures, generate_fixtures
+
+BENCHMARK_USERNAME = "bench-user"
+BENCHMARK_TOKEN = "benchmark-token"
+RESULT_TABLE_HEADER = f"{'Repos':>8}{'Wall s':>10}{'Requests':>10}{'KB sent':>10}{'Peak MB':>10}"
+
+@dataclass
+class BenchmarkResult:
+    repos: int
+    wall_seconds: float
+    request_count: int
+    kilobytes_sent: float
+    peak_memory_mb: float
+
+# This function does temporarily override environment variables.
+# It restores the previous values when the block exits.
+@contextlib.contextmanager
+def _patched_environ(values: Dict[str, str]) -> Iterator[None]:
+    previous = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+# This function does run one end-to-end update against a fixture set.
+# It times a plain pass and measures peak traced memory in a second pass, so tracing never inflates wall time.
+def run_fixture_benchmark(
+    fixtures: BenchmarkFixtures,
+    latency_ms: int,
+    workers: Optional[int] = None,
+    verbose: bool = False,
+) -> BenchmarkResult:
+    wall_seconds, request_count, bytes_sent, _ = _run_benchmark_pass(fixtures, latency_ms, workers, verbose, trace_memory=False)
+    _, _, _, peak_bytes = _run_benchmark_pass(fixtures, latency_ms, workers, verbose=False, trace_memory=True)
+    return BenchmarkResult(
+        repos=len(fixtures.repos),
+        wall_seconds=round(wall_seconds, 3),
+        request_count=request_count,
+        kilobytes_sent=round(bytes_sent / 1024, 1),
+        peak_memory_mb=round(peak_bytes / (1024 * 1024), 2),
+    )
+
+# This function does run the updater once against a fresh stand-in server.
+# It keeps every file the run reads or writes inside a temporary directory and returns time, traffic, and peak memory.
+def _run_benchmark_pass(
+    fixtures: BenchmarkFixtures,
+    latency_ms: int,
+    workers: Optional[int],
+    verbose: bool,
+    trace_memory: bool,
+) -> Tuple[float, int, int, int]:
+    server = FixtureServer(fixtures, latency_ms=latency_ms)
+    base_url = server.start()
+    work_dir = tempfile.mkdtemp(prefix="updater-benchmark-")
+    readme_path = os.path.join(work_dir, "README.md")
+    shutil.copyfile(README_PATH, readme_path)
+
+    environment = {
+        ENV_GITHUB_API_URL: base_url,
+        ENV_GITHUB_TOKEN: BENCHMARK_TOKEN,
+        ENV_GITHUB_USERNAME: BENCHMARK_USERNAME,
+        ENV_GITHUB_API_BACKEND: GITHUB_API_BACKEND_REST,
+        ENV_GITHUB_MAX_REPO_PAGES: str(max(1, -(-len(fixtures.repos) // GITHUB_REPOS_PER_PAGE))),
+        ENV_README_PATH: readme_path,
+        ENV_DISABLE_HTTP_CACHE: "1",
+        ENV_INCREMENTAL_UPDATE: "0",
+        ENV_METRICS_REPORT_PATH: "",
+    }
+    if workers:
+        environment[ENV_ENRICHMENT_WORKERS] = str(workers)
+
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    peak_bytes = 0
+    try:
+        with _patched_environ(environment), output:
+            config = _build_isolated_config(work_dir)
+            if trace_memory:
+                tracemalloc.start()
+            started = time.perf_counter()
+            run_update(config)
+            wall_seconds = time.perf_counter() - started
+            if trace_memory:
+                _, peak_bytes = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+    finally:
+        server.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return wall_seconds, server.request_count, server.bytes_sent, peak_bytes
+
+# This function does point every cache and input file of a run at the work directory.
+# It copies the resume there so parsing is still measured without touching the real tree.
+def _build_isolated_config(work_dir: str) -> UpdateConfig:
+    config = load_update_config()
+    resume_path = ""
+    if os.path.exists(config.resume_path):
+        resume_path = os.path.join(work_dir, os.path.basename(config.resume_path))
+        shutil.copyfile(config.resume_path, resume_path)
+    return replace(
+        config,
+        resume_path=resume_path,
+        resume_cache_path=os.path.join(work_dir, RESUME_CACHE_FILENAME),
+        state_path=os.path.join(work_dir, INCREMENTAL_STATE_FILENAME),
+        contributor_store_path=os.path.join(work_dir, CONTRIBUTOR_STORE_FILENAME),
+        http_cache_path="",
+    )
+
+# This function does benchmark synthetic accounts at several scales.
+# It generates deterministic fixtures for each repo count.
+def run_synthetic_benchmarks(
+    scales: List[int],
+    latency_ms: int,
+    workers: Optional[int] = None,
+    verbose: bool = False,
+) -> List[BenchmarkResult]:
+    results = []
+    for scale in scales:
+        fixtures = generate_fixtures(scale, BENCHMARK_USERNAME)
+        results.append(run_fixture_benchmark(fixtures, latency_ms, workers, verbose))
+        print(format_result_row(results[-1]), flush=True)
+    return results
+
+def format_result_row(result: BenchmarkResult) -> str:
+    return (
+        f"{result.repos:>8}{result.wall_seconds:>10.2f}{result.request_count:>10}"
+        f"{result.kilobytes_sent:>10.1f}{result.peak_memory_mb:>10.2f}"
+    )
+
+# This function does write benchmark results as JSON.
+# It is meant for CI to archive and compare between runs.
+def write_results(results: List[BenchmarkResult], path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file_handle:
+        json.dump([asdict(result) for result in results], file_handle, indent=2)
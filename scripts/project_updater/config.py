@@ -4,19 +4,49 @@
 
 import json
 import os
-from typing import Dict, Set
+from typing import Any, Dict, List, Set, Tuple
 
 # Environment variable names for configuration
 ENV_GITHUB_USERNAME = "GITHUB_USERNAME"
 ENV_GITHUB_TOKEN = "GITHUB_TOKEN"
 ENV_EXCLUDE_PRIVATE_REPOS = "EXCLUDE_PRIVATE_REPOS"
 ENV_RESUME_PATH = "RESUME_PATH"
+ENV_ENRICHMENT_WORKERS = "ENRICHMENT_WORKERS"
+ENV_ANALYSIS_WORKERS = "ANALYSIS_WORKERS"
+ENV_HTTP_CACHE_PATH = "HTTP_CACHE_PATH"
+ENV_DISABLE_HTTP_CACHE = "DISABLE_HTTP_CACHE"
+ENV_GITHUB_API_BACKEND = "GITHUB_API_BACKEND"
+ENV_INCREMENTAL_UPDATE = "INCREMENTAL_UPDATE"
+ENV_METRICS_REPORT_PATH = "METRICS_REPORT_PATH"
+ENV_README_PATH = "README_PATH"
+ENV_GITHUB_API_URL = "GITHUB_API_URL"
+ENV_GITHUB_MAX_REPO_PAGES = "GITHUB_MAX_REPO_PAGES"
+ENV_README_DRY_RUN = "README_DRY_RUN"
+ENV_DISABLE_README_STREAMING = "DISABLE_README_STREAMING"
+ENV_GITHUB_README_MAX_BYTES = "GITHUB_README_MAX_BYTES"
+ENV_GITHUB_OUTPUT = "GITHUB_OUTPUT"
+ENV_ASYNC_MAX_IN_FLIGHT = "ASYNC_MAX_IN_FLIGHT"
+ENV_CONTRIBUTOR_COUNT_STRATEGY = "CONTRIBUTOR_COUNT_STRATEGY"
+ENV_CONTRIBUTOR_COUNT_TTL_DAYS = "CONTRIBUTOR_COUNT_TTL_DAYS"
+ENV_DAEMON_POLL_SECONDS = "DAEMON_POLL_SECONDS"
+ENV_DAEMON_WATCH_SECONDS = "DAEMON_WATCH_SECONDS"
 
 # Default values for configuration parameters
 DEFAULT_GITHUB_USERNAME = "superbode"
 DEFAULT_RECENT_DAYS = 30
 DEFAULT_USES_CAP = 10
 DEFAULT_LANGUAGE_SUMMARY_TOP = 10
+DEFAULT_ENRICHMENT_WORKERS = 8
+DEFAULT_ANALYSIS_WORKERS = 0
+DEFAULT_ASYNC_MAX_IN_FLIGHT = 64
+DEFAULT_DAEMON_POLL_SECONDS = 300
+DEFAULT_DAEMON_WATCH_SECONDS = 2
+
+# GitHub API backends selectable through GITHUB_API_BACKEND.
+GITHUB_API_BACKEND_REST = "rest"
+GITHUB_API_BACKEND_GRAPHQL = "graphql"
+GITHUB_API_BACKEND_ASYNC = "async"
+DEFAULT_GITHUB_API_BACKEND = GITHUB_API_BACKEND_REST
 
 # Constants for GitHub API interaction and README formatting
 GITHUB_API_ACCEPT_HEADER = "application/vnd.github+json"
@@ -25,8 +55,29 @@ GITHUB_REPOS_PER_PAGE = 100
 GITHUB_MAX_REPO_PAGES = 10
 GITHUB_REQUEST_TIMEOUT_SECONDS = 30
 GITHUB_README_MAX_LINES = 30
+GITHUB_README_MAX_BYTES = 512 * 1024
+GITHUB_README_RAW_ACCEPT_HEADER = "application/vnd.github.raw"
+GITHUB_README_STREAM_CHUNK_BYTES = 8192
 GITHUB_CONTRIBUTOR_PER_PAGE = 1
 GITHUB_LANGUAGE_FALLBACK_BYTES = 1
+GITHUB_GRAPHQL_ENDPOINT = "/graphql"
+GITHUB_GRAPHQL_PAGE_SIZE = 50
+GITHUB_GRAPHQL_LANGUAGES_PER_REPO = 20
+GITHUB_GRAPHQL_CONTRIBUTOR_BATCH_SIZE = 50
+
+# Contributor count strategies selectable through CONTRIBUTOR_COUNT_STRATEGY.
+CONTRIBUTOR_COUNT_STRATEGY_REST = "rest"
+CONTRIBUTOR_COUNT_STRATEGY_GRAPHQL = "graphql"
+CONTRIBUTOR_COUNT_STRATEGY_STORED = "stored"
+DEFAULT_CONTRIBUTOR_COUNT_STRATEGY = CONTRIBUTOR_COUNT_STRATEGY_REST
+DEFAULT_CONTRIBUTOR_COUNT_TTL_DAYS = 7
+
+# Connection pooling and retry policy for GitHub API requests.
+GITHUB_POOL_CONNECTIONS = 4
+GITHUB_MAX_RETRIES = 4
+GITHUB_RETRY_BACKOFF_SECONDS = 1
+GITHUB_MAX_RETRY_WAIT_SECONDS = 120
+GITHUB_SECONDARY_RATE_LIMIT_WAIT_SECONDS = 60
 
 # The minimum repository size (in KB) to consider.
 MIN_PROFILE_REPO_SIZE = 50
@@ -63,26 +114,126 @@ OWNER_LABEL_USER_TEMPLATE = "Owner ({owner})"
 
 # The message shown when no GITHUB_TOKEN is provided.
 NO_GITHUB_TOKEN_MESSAGE = "No GITHUB_TOKEN found - only public repos will be shown"
+DEFAULT_BATCH_WORKERS = 4
+BATCH_PATH_FIELDS = ("readme_path", "resume_path", "config_dir", "state_path", "resume_cache_path", "contributor_store_path")
+BATCH_MANIFEST_ERROR_TEMPLATE = "Batch manifest {path!r} must be a JSON object with a \"users\" list"
+BATCH_UNKNOWN_FIELD_WARNING_TEMPLATE = "WARNING: ignoring unknown batch manifest field {field!r} for {user!r}"
+BATCH_INVALID_FIELD_WARNING_TEMPLATE = "WARNING: skipping batch user {user!r}: manifest field {field!r} expects {expected}, got {value!r}"
+README_UNCHANGED_MESSAGE_TEMPLATE = "{readme} is already up to date; skipping write."
+README_DRY_RUN_MESSAGE_TEMPLATE = "Dry run: {readme} would change ({sections}); nothing was written."
 
 # Directory paths for the project and configuration files.
 SCRIPTS_DIR = os.path.dirname(os.path.dirname(__file__))
 ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
 README_PATH = os.path.join(ROOT_DIR, "README.md")
 CONFIG_DIR = os.path.join(SCRIPTS_DIR, "config")
-DESCRIPTION_OVERRIDES_PATH = os.path.join(CONFIG_DIR, "repo_description_overrides.json")
-IGNORE_REPOS_PATH = os.path.join(CONFIG_DIR, "repo_ignore_list.json")
-IGNORE_LANGUAGES_PATH = os.path.join(CONFIG_DIR, "language_ignore_list.json")
-SKILL_ICON_OVERRIDES_PATH = os.path.join(CONFIG_DIR, "skill_icon_overrides.json")
+DESCRIPTION_OVERRIDES_FILENAME = "repo_description_overrides.json"
+IGNORE_REPOS_FILENAME = "repo_ignore_list.json"
+IGNORE_LANGUAGES_FILENAME = "language_ignore_list.json"
+SKILL_ICON_OVERRIDES_FILENAME = "skill_icon_overrides.json"
+DESCRIPTION_OVERRIDES_PATH = os.path.join(CONFIG_DIR, DESCRIPTION_OVERRIDES_FILENAME)
+IGNORE_REPOS_PATH = os.path.join(CONFIG_DIR, IGNORE_REPOS_FILENAME)
+IGNORE_LANGUAGES_PATH = os.path.join(CONFIG_DIR, IGNORE_LANGUAGES_FILENAME)
+SKILL_ICON_OVERRIDES_PATH = os.path.join(CONFIG_DIR, SKILL_ICON_OVERRIDES_FILENAME)
 DEFAULT_RESUME_FILENAME = "Bode Hooker Resume.pdf"
+CACHE_DIR = os.path.join(SCRIPTS_DIR, ".cache")
+HTTP_CACHE_PATH = os.path.join(CACHE_DIR, "http_cache.json")
+INCREMENTAL_STATE_FILENAME = "incremental_state.json"
+RESUME_CACHE_FILENAME = "resume_snapshot.json"
+INCREMENTAL_STATE_PATH = os.path.join(CACHE_DIR, INCREMENTAL_STATE_FILENAME)
+RESUME_CACHE_PATH = os.path.join(CACHE_DIR, RESUME_CACHE_FILENAME)
+BATCH_USER_CACHE_DIR = os.path.join(CACHE_DIR, "users")
+CONTRIBUTOR_STORE_FILENAME = "contributor_counts.json"
+CONTRIBUTOR_STORE_PATH = os.path.join(CACHE_DIR, CONTRIBUTOR_STORE_FILENAME)
+
+# Values accepted as "on" for boolean environment flags.
+TRUTHY_ENV_VALUES = {"1", "true", "yes", "on"}
 
 def resolve_resume_path() -> str:
     configured = os.environ.get(ENV_RESUME_PATH, "").strip()
     if configured:
-        if os.path.isabs(configured):
-            return configured
-        return os.path.join(ROOT_DIR, configured)
+        return resolve_root_relative_path(configured)
     return os.path.join(ROOT_DIR, DEFAULT_RESUME_FILENAME)
 
+# This function does resolve the README file that receives generated sections.
+# It defaults to the repository root README.md.
+def resolve_readme_path() -> str:
+    configured = os.environ.get(ENV_README_PATH, "").strip()
+    if configured:
+        return resolve_root_relative_path(configured)
+    return README_PATH
+
+# This function does resolve the GitHub API base URL.
+# It honors GITHUB_API_URL (set by GitHub Actions) and strips trailing slashes.
+def resolve_github_api_base_url() -> str:
+    configured = os.environ.get(ENV_GITHUB_API_URL, "").strip().rstrip("/")
+    return configured or GITHUB_API_BASE_URL
+
+# This function does resolve a configured path against the repository root.
+# It leaves absolute paths unchanged.
+def resolve_root_relative_path(configured: str) -> str:
+    if os.path.isabs(configured):
+        return configured
+    return os.path.join(ROOT_DIR, configured)
+
+# This function does resolve the persistent HTTP cache location.
+# It returns an empty path when caching is disabled.
+def resolve_http_cache_path() -> str:
+    if resolve_env_flag(ENV_DISABLE_HTTP_CACHE):
+        return ""
+    configured = os.environ.get(ENV_HTTP_CACHE_PATH, "").strip()
+    if configured:
+        return resolve_root_relative_path(configured)
+    return HTTP_CACHE_PATH
+
+# This function does resolve where the JSON metrics report is written.
+# It returns an empty path when no report was requested.
+def resolve_metrics_report_path() -> str:
+    configured = os.environ.get(ENV_METRICS_REPORT_PATH, "").strip()
+    if not configured:
+        return ""
+    return resolve_root_relative_path(configured)
+
+# This function does resolve which GitHub API backend to use.
+# It falls back to REST for unknown values.
+def resolve_github_api_backend() -> str:
+    configured = os.environ.get(ENV_GITHUB_API_BACKEND, "").strip().lower()
+    if configured in (GITHUB_API_BACKEND_REST, GITHUB_API_BACKEND_GRAPHQL, GITHUB_API_BACKEND_ASYNC):
+        return configured
+    return DEFAULT_GITHUB_API_BACKEND
+
+# This function does resolve how contributor counts are obtained.
+# It falls back to the REST strategy for unknown values.
+def resolve_contributor_count_strategy() -> str:
+    configured = os.environ.get(ENV_CONTRIBUTOR_COUNT_STRATEGY, "").strip().lower()
+    if configured in (
+        CONTRIBUTOR_COUNT_STRATEGY_REST,
+        CONTRIBUTOR_COUNT_STRATEGY_GRAPHQL,
+        CONTRIBUTOR_COUNT_STRATEGY_STORED,
+    ):
+        return configured
+    return DEFAULT_CONTRIBUTOR_COUNT_STRATEGY
+
+# This function does read a boolean flag from the environment.
+# It treats common truthy spellings as enabled.
+def resolve_env_flag(name: str, default: bool = False) -> bool:
+    configured = os.environ.get(name, "").strip().lower()
+    if not configured:
+        return default
+    return configured in TRUTHY_ENV_VALUES
+
+# This function does read a bounded integer from the environment.
+# It falls back to the default when the value is missing or invalid.
+def resolve_env_int(name: str, default: int, minimum: int = 0) -> int:
+    configured = os.environ.get(name, "").strip()
+    if not configured:
+        return default
+    try:
+        value = int(configured)
+    except ValueError:
+        return default
+    return max(minimum, value)
+
 # This function does load JSON content from disk safely.
 # It returns None when the file is missing or invalid.
 def _load_json(path: str):
@@ -94,10 +245,43 @@ def _load_json(path: str):
     except Exception:
         return None
 
+# This function does parse the comma-separated private repo exclusion list.
+# It returns normalized lowercase repo names.
+def resolve_excluded_private_repos() -> List[str]:
+    return [item.strip().lower() for item in os.environ.get(ENV_EXCLUDE_PRIVATE_REPOS, "").split(",") if item.strip()]
+
+# This function does load a multi-user batch manifest.
+# It merges shared defaults into each user entry, resolves paths and token env names.
+def load_batch_manifest(path: str) -> Tuple[int, List[Dict[str, Any]]]:
+    data = _load_json(path)
+    if not isinstance(data, dict) or not isinstance(data.get("users"), list):
+        raise ValueError(BATCH_MANIFEST_ERROR_TEMPLATE.format(path=path))
+
+    defaults = data.get("defaults") if isinstance(data.get("defaults"), dict) else {}
+    entries: List[Dict[str, Any]] = []
+    for raw_entry in data["users"]:
+        if not isinstance(raw_entry, dict):
+            continue
+        entry = {**defaults, **raw_entry}
+        token_env = str(entry.pop("github_token_env", "") or "").strip()
+        if token_env:
+            entry["github_token"] = os.environ.get(token_env, "")
+        for field_name in BATCH_PATH_FIELDS:
+            if entry.get(field_name):
+                entry[field_name] = resolve_root_relative_path(str(entry[field_name]))
+        if isinstance(entry.get("excluded_private_repos"), list):
+            entry["excluded_private_repos"] = [
+                str(item).strip().lower() for item in entry["excluded_private_repos"] if str(item).strip()
+            ]
+        entries.append(entry)
+
+    workers = data.get("workers", DEFAULT_BATCH_WORKERS)
+    return (workers if isinstance(workers, int) and workers > 0 else DEFAULT_BATCH_WORKERS), entries
+
 # This function does load repository description overrides.
 # It normalizes keys to lowercase for case-insensitive matching.
-def load_description_overrides() -> Dict[str, str]:
-    data = _load_json(DESCRIPTION_OVERRIDES_PATH)
+def load_description_overrides(config_dir: str = CONFIG_DIR) -> Dict[str, str]:
+    data = _load_json(os.path.join(config_dir, DESCRIPTION_OVERRIDES_FILENAME))
     if not isinstance(data, dict):
         return {}
     return {
@@ -108,24 +292,24 @@ def load_description_overrides() -> Dict[str, str]:
 
 # This function does load the repository ignore list.
 # It returns normalized lowercase names as a set.
-def load_ignored_repos() -> Set[str]:
-    data = _load_json(IGNORE_REPOS_PATH)
+def load_ignored_repos(config_dir: str = CONFIG_DIR) -> Set[str]:
+    data = _load_json(os.path.join(config_dir, IGNORE_REPOS_FILENAME))
     if not isinstance(data, list):
         return set()
     return {str(item).strip().lower() for item in data if str(item).strip()}
 
 # This function does load the language ignore list.
 # It returns normalized lowercase language names as a set.
-def load_ignored_languages() -> Set[str]:
-    data = _load_json(IGNORE_LANGUAGES_PATH)
+def load_ignored_languages(config_dir: str = CONFIG_DIR) -> Set[str]:
+    data = _load_json(os.path.join(config_dir, IGNORE_LANGUAGES_FILENAME))
     if not isinstance(data, list):
         return set()
     return {str(item).strip().lower() for item in data if str(item).strip()}
 
 # This function does load skill icon override mappings.
 # It returns normalized lowercase source -> icon id maps for languages and tools.
-def load_skill_icon_overrides() -> Dict[str, Dict[str, str]]:
-    data = _load_json(SKILL_ICON_OVERRIDES_PATH)
+def load_skill_icon_overrides(config_dir: str = CONFIG_DIR) -> Dict[str, Dict[str, str]]:
+    data = _load_json(os.path.join(config_dir, SKILL_ICON_OVERRIDES_FILENAME))
     if not isinstance(data, dict):
         return {"languages": {}, "tools": {}}
 
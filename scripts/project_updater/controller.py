@@ -3,26 +3,63 @@
 #           Coordinates repository processing and
 #                  README section updates.
 
+import asyncio
+import contextlib
+import glob
 import os
 import re
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import fields, replace
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Tuple
+from typing import ContextManager, Dict, Iterable, List, Optional, Set, Tuple
 from .config import (
+    BATCH_INVALID_FIELD_WARNING_TEMPLATE,
+    BATCH_UNKNOWN_FIELD_WARNING_TEMPLATE,
+    BATCH_USER_CACHE_DIR,
     CURRENT_PROJECTS_END_MARKER,
     CURRENT_PROJECTS_START_MARKER,
     DEFAULT_OWNER_TYPE,
     DEFAULT_GITHUB_USERNAME,
     DEFAULT_LANGUAGE_SUMMARY_TOP,
     DEFAULT_RECENT_DAYS,
+    DEFAULT_ANALYSIS_WORKERS,
+    DEFAULT_ASYNC_MAX_IN_FLIGHT,
+    DEFAULT_CONTRIBUTOR_COUNT_TTL_DAYS,
+    DEFAULT_DAEMON_POLL_SECONDS,
+    DEFAULT_DAEMON_WATCH_SECONDS,
+    DEFAULT_ENRICHMENT_WORKERS,
     DEFAULT_USES_CAP,
+    DESCRIPTION_OVERRIDES_FILENAME,
     EMPTY_CURRENT_PROJECTS_MESSAGE,
     EMPTY_PAST_PROJECTS_MESSAGE,
     EMPTY_RESUME_EXPERIENCE_MESSAGE,
     EMPTY_OTHER_TOOLS_MESSAGE,
     EMPTY_RESUME_SKILLS_MESSAGE,
-    ENV_EXCLUDE_PRIVATE_REPOS,
+    GITHUB_MAX_REPO_PAGES,
+    GITHUB_README_MAX_BYTES,
+    GITHUB_API_BACKEND_ASYNC,
+    GITHUB_API_BACKEND_GRAPHQL,
+    ENV_ANALYSIS_WORKERS,
+    ENV_ASYNC_MAX_IN_FLIGHT,
+    ENV_CONTRIBUTOR_COUNT_TTL_DAYS,
+    ENV_DAEMON_POLL_SECONDS,
+    ENV_DAEMON_WATCH_SECONDS,
+    ENV_DISABLE_README_STREAMING,
+    ENV_ENRICHMENT_WORKERS,
+    ENV_GITHUB_MAX_REPO_PAGES,
+    ENV_GITHUB_README_MAX_BYTES,
     ENV_GITHUB_TOKEN,
     ENV_GITHUB_USERNAME,
+    ENV_GITHUB_OUTPUT,
+    ENV_INCREMENTAL_UPDATE,
+    ENV_README_DRY_RUN,
+    IGNORE_LANGUAGES_FILENAME,
+    IGNORE_REPOS_FILENAME,
+    INCREMENTAL_STATE_FILENAME,
+    RESUME_CACHE_FILENAME,
     LANGUAGE_SUMMARY_END_MARKER,
     LANGUAGE_SUMMARY_START_MARKER,
     MIN_PROFILE_REPO_SIZE,
@@ -34,25 +71,62 @@ from .config import (
     OWNER_TYPE_ORGANIZATION,
     PAST_PROJECTS_END_MARKER,
     PAST_PROJECTS_START_MARKER,
-    README_PATH,
     RESUME_EXPERIENCE_END_MARKER,
     RESUME_EXPERIENCE_START_MARKER,
     RESUME_SKILLS_END_MARKER,
     RESUME_SKILLS_START_MARKER,
+    README_DRY_RUN_MESSAGE_TEMPLATE,
+    README_UNCHANGED_MESSAGE_TEMPLATE,
     ROLE_COLLABORATOR,
     ROLE_OWNER,
+    SKILL_ICON_OVERRIDES_FILENAME,
+    TRUTHY_ENV_VALUES,
     UNKNOWN_OWNER_LABEL,
     load_description_overrides,
     load_ignored_languages,
     load_ignored_repos,
+    load_batch_manifest,
     load_skill_icon_overrides,
+    resolve_contributor_count_strategy,
+    resolve_env_flag,
+    resolve_excluded_private_repos,
+    resolve_env_int,
+    resolve_github_api_backend,
+    resolve_github_api_base_url,
+    resolve_http_cache_path,
+    resolve_metrics_report_path,
+    resolve_readme_path,
     resolve_resume_path,
+    resolve_root_relative_path,
+)
+from .models import ReadmeWriteResult, RepoAnalysis, RepoEnrichment, RepoPresentation, RepoRecord, ResumeSnapshot, UpdateConfig
+from .services.analysis_service import TextAnalysisPool
+from .services.async_github_service import ASYNC_CLIENT_AVAILABLE, ASYNC_CLIENT_MISSING_WARNING, AsyncGitHubService
+from .services.description_service import compose_languages
+from .services.enrichment_cache_service import ENRICHMENT_LANGUAGES
+from .services.github_graphql_service import GitHubGraphQLService
+from .services.github_service import GitHubService, GitHubServiceBase
+from .services.readme_service import (
+    find_present_sections,
+    load_readme,
+    replace_sections,
+    section_name,
+    write_readme_update,
+)
+from .services.metrics_service import RunMetrics
+from .services.rate_limit_service import (
+    REQUEST_PRIORITY_CURRENT,
+    REQUEST_PRIORITY_LANGUAGE_TOTALS,
+    REQUEST_PRIORITY_PAST,
 )
-from .models import RepoPresentation, UpdateConfig
-from .services.description_service import clean_text, select_description, select_languages
-from .services.github_service import GitHubService
-from .services.readme_service import load_readme, remove_duplicate_sections, replace_section, save_readme
 from .services.resume_service import extract_resume_snapshot
+from .services.state_service import (
+    build_state_entry,
+    build_state_fingerprint,
+    load_incremental_state,
+    lookup_unchanged,
+    save_incremental_state,
+)
 from .views.markdown_view import (
     render_language_summary,
     render_other_tools,
@@ -61,6 +135,54 @@ from .views.markdown_view import (
     render_skill_icons,
 )
 
+GENERATED_SECTION_MARKERS = [
+    (LANGUAGE_SUMMARY_START_MARKER, LANGUAGE_SUMMARY_END_MARKER),
+    (CURRENT_PROJECTS_START_MARKER, CURRENT_PROJECTS_END_MARKER),
+    (PAST_PROJECTS_START_MARKER, PAST_PROJECTS_END_MARKER),
+    (RESUME_EXPERIENCE_START_MARKER, RESUME_EXPERIENCE_END_MARKER),
+    (RESUME_SKILLS_START_MARKER, RESUME_SKILLS_END_MARKER),
+    (OTHER_TOOLS_START_MARKER, OTHER_TOOLS_END_MARKER),
+]
+SECTION_SOURCE_REPO_LISTING = "repo listing"
+SECTION_SOURCE_CURRENT_PROJECTS = "current projects"
+SECTION_SOURCE_PAST_PROJECTS = "past projects"
+SECTION_SOURCE_LANGUAGE_TOTALS = "language totals"
+SECTION_SOURCE_RESUME = "resume"
+SECTION_SOURCE_SKILL_ICONS = "skill icons"
+SECTION_DEPENDENCIES = {
+    LANGUAGE_SUMMARY_START_MARKER: (SECTION_SOURCE_LANGUAGE_TOTALS,),
+    CURRENT_PROJECTS_START_MARKER: (SECTION_SOURCE_CURRENT_PROJECTS,),
+    PAST_PROJECTS_START_MARKER: (SECTION_SOURCE_PAST_PROJECTS,),
+    RESUME_EXPERIENCE_START_MARKER: (SECTION_SOURCE_RESUME,),
+    RESUME_SKILLS_START_MARKER: (SECTION_SOURCE_LANGUAGE_TOTALS, SECTION_SOURCE_RESUME, SECTION_SOURCE_SKILL_ICONS),
+    OTHER_TOOLS_START_MARKER: (SECTION_SOURCE_RESUME, SECTION_SOURCE_SKILL_ICONS),
+}
+SECTION_SOURCE_DEPENDENCIES = {
+    SECTION_SOURCE_CURRENT_PROJECTS: (SECTION_SOURCE_REPO_LISTING,),
+    SECTION_SOURCE_PAST_PROJECTS: (SECTION_SOURCE_REPO_LISTING,),
+    SECTION_SOURCE_LANGUAGE_TOTALS: (SECTION_SOURCE_REPO_LISTING,),
+}
+SECTION_SKIPPED_WARNING_TEMPLATE = "WARNING: marker pair not found: {marker!r}; skipping its section"
+DAEMON_CONFIG_FILE_SOURCES = {
+    DESCRIPTION_OVERRIDES_FILENAME: (SECTION_SOURCE_CURRENT_PROJECTS, SECTION_SOURCE_PAST_PROJECTS),
+    IGNORE_REPOS_FILENAME: (SECTION_SOURCE_REPO_LISTING,),
+    IGNORE_LANGUAGES_FILENAME: (SECTION_SOURCE_LANGUAGE_TOTALS,),
+    SKILL_ICON_OVERRIDES_FILENAME: (SECTION_SOURCE_SKILL_ICONS,),
+}
+DAEMON_START_MESSAGE_TEMPLATE = (
+    "Daemon mode: polling GitHub every {poll}s and checking {files} watched files every {watch}s (Ctrl+C to stop)"
+)
+DAEMON_ASYNC_BACKEND_MESSAGE = "Daemon mode keeps one threaded REST client warm; GITHUB_API_BACKEND=async is ignored"
+DAEMON_POLL_MESSAGE = "Polling GitHub for repository changes …"
+DAEMON_CHANGE_MESSAGE_TEMPLATE = "Detected changes in {files}; regenerating {sections}"
+DAEMON_UPDATE_FAILED_WARNING_TEMPLATE = "WARNING: daemon update failed: {error}"
+DAEMON_STOP_MESSAGE = "Daemon stopped"
+BATCH_START_MESSAGE_TEMPLATE = "Batch update: {users} users with {workers} concurrent workers"
+BATCH_DONE_MESSAGE_TEMPLATE = "Batch update finished: {updated}/{users} READMEs changed"
+BATCH_EMPTY_MESSAGE = "Batch manifest lists no users - nothing to update"
+BATCH_MISSING_USERNAME_WARNING = "WARNING: skipping batch manifest entry without github_username"
+BATCH_USER_FAILED_WARNING_TEMPLATE = "WARNING: batch update failed for {user}: {error}"
+MISSING_PUSHED_AT = datetime.min.replace(tzinfo=timezone.utc)
 COURSE_TEAM_SIGNATURE_PATTERN = re.compile(r"cpsc\s*([0-9]{3,4}).*?team\s*([0-9]+)", re.IGNORECASE)
 
 def _canonical_repo_key(repo_name: str) -> str:
@@ -80,25 +202,128 @@ def _repo_specificity_score(repo_name: str) -> int:
     normalized = (repo_name or "").strip().lower()
     return len(re.sub(r"[^a-z0-9]", "", normalized))
 
+# This function does create the GitHub service for the configured backend.
+# It keeps the REST implementation as the default and fallback.
+def _create_github_service(
+    config: UpdateConfig,
+    metrics: RunMetrics,
+    shared: Optional[GitHubService] = None,
+    pool_size: int = 0,
+) -> GitHubService:
+    if config.api_backend == GITHUB_API_BACKEND_GRAPHQL:
+        return GitHubGraphQLService(config, metrics, shared, pool_size)
+    return GitHubService(config, metrics, shared, pool_size)
+
+# This function does fetch README, language, and contributor data for repositories.
+# It fans requests out in priority order, shares in-flight work between accounts, and returns results in input order.
+def _enrich_repos(
+    repos: List[RepoRecord],
+    priorities: List[int],
+    github_service: GitHubService,
+    max_workers: int,
+    analysis_pool: TextAnalysisPool,
+    overrides: Dict[str, str],
+) -> List[Tuple[RepoEnrichment, RepoAnalysis]]:
+    if not repos:
+        return []
+
+    submission_order = sorted(range(len(repos)), key=lambda index: priorities[index])
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+
+        def start_enrichment(index: int) -> "Future[RepoEnrichment]":
+            repo, priority = repos[index], priorities[index]
+            return _gather_enrichment(
+                executor.submit(github_service.fetch_readme_text, repo, priority),
+                executor.submit(github_service.fetch_language_usage, repo, priority),
+                executor.submit(github_service.fetch_contributor_count, repo, priority),
+            )
+
+        futures = {
+            index: _analyze_when_enriched(
+                github_service.enrichment_cache.claim(repos[index], lambda index=index: start_enrichment(index)),
+                repos[index],
+                analysis_pool,
+                overrides,
+            )
+            for index in submission_order
+        }
+        return [futures[index].result() for index in range(len(repos))]
+
+# This function does queue a repo's text analysis as soon as its fetches finish.
+# It runs on whichever thread completes the enrichment, so analysis overlaps with the remaining I/O.
+def _analyze_when_enriched(
+    enrichment_future: "Future[RepoEnrichment]",
+    repo: RepoRecord,
+    analysis_pool: TextAnalysisPool,
+    overrides: Dict[str, str],
+) -> "Future[Tuple[RepoEnrichment, RepoAnalysis]]":
+    combined: "Future[Tuple[RepoEnrichment, RepoAnalysis]]" = Future()
+
+    def on_analyzed(enrichment: RepoEnrichment, analysis_future: "Future[RepoAnalysis]") -> None:
+        try:
+            combined.set_result((enrichment, analysis_future.result()))
+        except Exception as error:
+            combined.set_exception(error)
+
+    def on_enriched(done: "Future[RepoEnrichment]") -> None:
+        try:
+            enrichment = done.result()
+            analysis_future = analysis_pool.submit(repo, enrichment.readme_text, overrides)
+        except Exception as error:
+            combined.set_exception(error)
+            return
+        analysis_future.add_done_callback(lambda finished: on_analyzed(enrichment, finished))
+
+    enrichment_future.add_done_callback(on_enriched)
+    return combined
+
+# This function does combine the three per-repo fetches into one future.
+# It resolves once all parts finish, without blocking a worker thread.
+def _gather_enrichment(
+    readme_future: "Future[str]",
+    language_future: "Future[List[Tuple[str, int]]]",
+    contributor_future: "Future[int]",
+) -> "Future[RepoEnrichment]":
+    combined: "Future[RepoEnrichment]" = Future()
+    parts = (readme_future, language_future, contributor_future)
+    remaining = [len(parts)]
+    lock = threading.Lock()
+
+    def on_part_done(_: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        try:
+            combined.set_result(
+                RepoEnrichment(
+                    readme_text=readme_future.result(),
+                    language_usage=language_future.result(),
+                    contributors=contributor_future.result(),
+                )
+            )
+        except Exception as error:
+            combined.set_exception(error)
+
+    for part in parts:
+        part.add_done_callback(on_part_done)
+    return combined
+
 # This function does build a display-ready repository object.
 # It combines summary, language, contributor, and ownership metadata.
 def _build_repo_presentation(
-    repo: dict,
-    github_service: GitHubService,
-    overrides: Dict[str, str],
+    repo: RepoRecord,
+    enrichment: RepoEnrichment,
+    analysis: RepoAnalysis,
     uses_cap: int,
     username: str,
 ) -> RepoPresentation:
-    readme_text = github_service.fetch_readme_text(repo["full_name"])
-    context_text = clean_text(" ".join(part for part in [repo.get("description") or "", readme_text] if part))
+    summary = analysis.summary
+    languages = compose_languages(enrichment.language_usage, analysis.framework_usage, uses_cap)
+    contributors = enrichment.contributors
 
-    summary = select_description(repo, context_text, overrides)
-    language_usage = github_service.fetch_language_usage(repo)
-    languages = select_languages(language_usage, context_text, uses_cap)
-    contributors = github_service.fetch_contributor_count(repo)
-
-    owner = (repo.get("owner") or {}).get("login") or UNKNOWN_OWNER_LABEL
-    owner_type = (repo.get("owner") or {}).get("type") or DEFAULT_OWNER_TYPE
+    owner = repo.owner_login or UNKNOWN_OWNER_LABEL
+    owner_type = repo.owner_type or DEFAULT_OWNER_TYPE
     owner_label = (
         OWNER_LABEL_ORGANIZATION_TEMPLATE.format(owner=owner)
         if owner_type.lower() == OWNER_TYPE_ORGANIZATION
@@ -107,8 +332,8 @@ def _build_repo_presentation(
     role = ROLE_OWNER if owner.lower() == username.lower() else ROLE_COLLABORATOR
 
     return RepoPresentation(
-        name=repo["name"],
-        url=repo["html_url"],
+        name=repo.name,
+        url=repo.html_url,
         summary=summary,
         languages=languages,
         contributors=contributors,
@@ -116,17 +341,115 @@ def _build_repo_presentation(
         role=role,
     )
 
+# This function does build presentations for every repo in order.
+# It reuses saved presentations for unchanged repos and enriches the rest.
+def _build_repo_presentations(
+    repos: List[RepoRecord],
+    priorities: List[int],
+    github_service: GitHubService,
+    overrides: Dict[str, str],
+    config: UpdateConfig,
+    previous_state: Dict[str, dict],
+    shared_analysis_pool: Optional[TextAnalysisPool] = None,
+) -> Tuple[List[RepoPresentation], Dict[str, dict]]:
+    presentations, language_usages, stale_indexes = _reuse_saved_presentations(repos, github_service, previous_state)
+    print(f"Enriching {len(stale_indexes)} repos with {config.enrichment_workers} workers …")
+    stale_repos = [repos[index] for index in stale_indexes]
+    stale_priorities = [priorities[index] for index in stale_indexes]
+    github_service.prime_contributor_counts(stale_repos)
+    with _open_analysis_pool(config, overrides, bool(stale_repos), shared_analysis_pool) as analysis_pool:
+        enrichments = _enrich_repos(
+            stale_repos,
+            stale_priorities,
+            github_service,
+            config.enrichment_workers,
+            analysis_pool,
+            overrides,
+        )
+    return _finish_repo_presentations(repos, presentations, language_usages, stale_indexes, enrichments, github_service, config)
+
+# This function does provide the text analysis pool for one run.
+# It lends out a batch's shared pool unclosed, or starts a private one only when repos need analysis.
+def _open_analysis_pool(
+    config: UpdateConfig,
+    overrides: Dict[str, str],
+    needed: bool,
+    shared_analysis_pool: Optional[TextAnalysisPool],
+) -> ContextManager[TextAnalysisPool]:
+    if shared_analysis_pool is not None:
+        return contextlib.nullcontext(shared_analysis_pool)
+    return TextAnalysisPool(config.analysis_workers if needed else 0, overrides)
+
+# This function does fill in presentations saved by the previous incremental run.
+# It primes the enrichment cache with their language usage and returns the indexes still to enrich.
+def _reuse_saved_presentations(
+    repos: List[RepoRecord],
+    github_service: GitHubServiceBase,
+    previous_state: Dict[str, dict],
+) -> Tuple[List[Optional[RepoPresentation]], List[List[Tuple[str, int]]], List[int]]:
+    presentations: List[Optional[RepoPresentation]] = [None] * len(repos)
+    language_usages: List[List[Tuple[str, int]]] = [[] for _ in repos]
+    stale_indexes: List[int] = []
+
+    for index, repo in enumerate(repos):
+        reused = lookup_unchanged(previous_state, repo) if repo.id is not None else None
+        if reused is None:
+            stale_indexes.append(index)
+            continue
+        presentations[index], language_usages[index] = reused
+        github_service.enrichment_cache.store(repo, ENRICHMENT_LANGUAGES, language_usages[index])
+
+    if previous_state:
+        print(f"Reusing {len(repos) - len(stale_indexes)} unchanged repos from incremental state")
+    return presentations, language_usages, stale_indexes
+
+# This function does build presentations for freshly enriched repos.
+# It returns every presentation in order with the next incremental state.
+def _finish_repo_presentations(
+    repos: List[RepoRecord],
+    presentations: List[Optional[RepoPresentation]],
+    language_usages: List[List[Tuple[str, int]]],
+    stale_indexes: List[int],
+    enrichments: List[Tuple[RepoEnrichment, RepoAnalysis]],
+    github_service: GitHubServiceBase,
+    config: UpdateConfig,
+) -> Tuple[List[RepoPresentation], Dict[str, dict]]:
+    for index, (enrichment, analysis) in zip(stale_indexes, enrichments):
+        presentations[index] = _build_repo_presentation(
+            repos[index],
+            enrichment,
+            analysis,
+            config.uses_cap,
+            config.github_username,
+        )
+        language_usages[index] = enrichment.language_usage
+
+    next_state = {
+        str(repo.id): build_state_entry(repo, presentation, language_usage)
+        for repo, presentation, language_usage in zip(repos, presentations, language_usages)
+        if repo.id is not None and repo.full_name not in github_service.degraded_repos
+    }
+    return presentations, next_state
+
 # This function does aggregate language byte totals across repositories.
 # It filters ignored languages and returns the top ranked entries.
 def _aggregate_language_totals(
-    repos: List[dict],
+    repos: List[RepoRecord],
     github_service: GitHubService,
     ignored_languages: set,
     top_n: int,
+) -> List[Tuple[str, int]]:
+    usages = [github_service.fetch_language_usage(repo, REQUEST_PRIORITY_LANGUAGE_TOTALS) for repo in repos]
+    return _rank_language_totals(usages, ignored_languages, top_n)
+
+def _rank_language_totals(
+    usages: List[List[Tuple[str, int]]],
+    ignored_languages: set,
+    top_n: int,
 ) -> List[Tuple[str, int]]:
     totals: Dict[str, int] = {}
-    for repo in repos:
-        for language, byte_count in github_service.fetch_language_usage(repo):
+    for usage in usages:
+        for language, byte_count in usage:
             if not language:
                 continue
             if language.strip().lower() in ignored_languages:
@@ -136,79 +459,43 @@ def _aggregate_language_totals(
     ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
     return ranked[:top_n]
 
-# This function does execute the full update workflow end-to-end.
-# It fetches repos, prepares sections, and writes the README output.
-def run_update() -> None:
-    config = UpdateConfig(
-        github_username=os.environ.get(ENV_GITHUB_USERNAME, DEFAULT_GITHUB_USERNAME),
-        github_token=os.environ.get(ENV_GITHUB_TOKEN, ""),
-        recent_days=DEFAULT_RECENT_DAYS,
-        uses_cap=DEFAULT_USES_CAP,
-        language_summary_top=DEFAULT_LANGUAGE_SUMMARY_TOP,
-    )
-
-    overrides = load_description_overrides()
-    ignored_repos = load_ignored_repos()
-    ignored_languages = load_ignored_languages()
-    skill_icon_overrides = load_skill_icon_overrides()
-    excluded_private_repos = {
-        item.strip().lower()
-        for item in os.environ.get(ENV_EXCLUDE_PRIVATE_REPOS, "").split(",")
-        if item.strip()
-    }
-
-    print(f"Fetching {'public and private' if config.github_token else 'public'} repos for {config.github_username} …")
-    if overrides:
-        print(f"Loaded description overrides: {len(overrides)}")
-    if ignored_repos:
-        print(f"Loaded ignored repos: {len(ignored_repos)}")
-    if ignored_languages:
-        print(f"Loaded ignored languages: {len(ignored_languages)}")
-    if skill_icon_overrides.get("languages") or skill_icon_overrides.get("tools"):
-        print(
-            "Loaded skill icon overrides: "
-            f"{len(skill_icon_overrides.get('languages', {}))} language, "
-            f"{len(skill_icon_overrides.get('tools', {}))} tool"
-        )
-    if excluded_private_repos:
-        print(f"Loaded excluded private repos: {len(excluded_private_repos)}")
-    if not config.github_token:
-        print(NO_GITHUB_TOKEN_MESSAGE)
-
-    resume_path = resolve_resume_path()
-    print(f"Resume source: {resume_path}")
-
-    github_service = GitHubService(config)
-    all_repos = github_service.fetch_repos()
-    print(f"\nRaw API response: {len(all_repos)} repositories")
-
+# This function does drop excluded, ignored, and placeholder repositories.
+# It logs each skipped repository by name.
+def _filter_repos(
+    repos: List[RepoRecord],
+    username: str,
+    ignored_repos: Set[str],
+    excluded_private_repos: Set[str],
+) -> List[RepoRecord]:
     filtered_repos = []
-    for repo in all_repos:
-        repo_name = (repo.get("name") or "").strip().lower()
-        if repo.get("private") and repo_name in excluded_private_repos:
-            print(f"Skipping excluded private repo: {repo.get('name')}")
+    for repo in repos:
+        repo_name = repo.name.strip().lower()
+        if repo.private and repo_name in excluded_private_repos:
+            print(f"Skipping excluded private repo: {repo.name}")
             continue
         if repo_name in ignored_repos:
-            print(f"Skipping ignored repo: {repo.get('name')}")
+            print(f"Skipping ignored repo: {repo.name}")
             continue
 
         if (
-            repo["name"] == config.github_username
-            and repo.get("stargazers_count", 0) == 0
-            and repo.get("forks_count", 0) == 0
-            and not (repo.get("description") or "").strip()
-            and repo.get("size", 0) < MIN_PROFILE_REPO_SIZE
+            repo.name == username
+            and repo.stars == 0
+            and repo.forks == 0
+            and not repo.description.strip()
+            and repo.size < MIN_PROFILE_REPO_SIZE
         ):
-            print(f"Skipping minimal profile repo: {repo['name']}")
+            print(f"Skipping minimal profile repo: {repo.name}")
             continue
 
         filtered_repos.append(repo)
+    return filtered_repos
 
-    print(f"After filtering: {len(filtered_repos)} repositories included")
-
-    deduped = {}
-    for repo in filtered_repos:
-        key = _canonical_repo_key(repo.get("name") or "")
+# This function does collapse repositories that share a canonical key.
+# It keeps the most specific name, then the most recently pushed repo.
+def _dedupe_repos(repos: List[RepoRecord]) -> List[RepoRecord]:
+    deduped: Dict[str, RepoRecord] = {}
+    for repo in repos:
+        key = _canonical_repo_key(repo.name)
         if not key:
             continue
         existing = deduped.get(key)
@@ -216,94 +503,682 @@ def run_update() -> None:
             deduped[key] = repo
             continue
 
-        incoming_specificity = _repo_specificity_score(repo.get("name") or "")
-        existing_specificity = _repo_specificity_score(existing.get("name") or "")
+        incoming_specificity = _repo_specificity_score(repo.name)
+        existing_specificity = _repo_specificity_score(existing.name)
 
         if incoming_specificity > existing_specificity:
             deduped[key] = repo
             continue
 
-        if incoming_specificity == existing_specificity and repo.get("pushed_at", "") > existing.get("pushed_at", ""):
+        if incoming_specificity == existing_specificity and _pushed_at_key(repo) > _pushed_at_key(existing):
             deduped[key] = repo
 
-    all_repos = list(deduped.values())
-    all_repos.sort(key=lambda item: item["pushed_at"], reverse=True)
-    print(f"After deduplication: {len(all_repos)} repositories included")
+    unique_repos = list(deduped.values())
+    unique_repos.sort(key=_pushed_at_key, reverse=True)
+    return unique_repos
+
+def _pushed_at_key(repo: RepoRecord) -> datetime:
+    return repo.pushed_at or MISSING_PUSHED_AT
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=config.recent_days)
+# This function does split repositories into current and past groups.
+# It orders each group by size and then recency.
+def _split_repos_by_recency(repos: List[RepoRecord], recent_days: int) -> Tuple[List[RepoRecord], List[RepoRecord]]:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=recent_days)
     current_repos_raw = []
     past_repos_raw = []
-    for repo in all_repos:
-        pushed_date = datetime.fromisoformat(repo["pushed_at"].replace("Z", "+00:00"))
-        if pushed_date >= cutoff:
+    for repo in repos:
+        if _pushed_at_key(repo) >= cutoff:
             current_repos_raw.append(repo)
         else:
             past_repos_raw.append(repo)
 
-    size_then_recency_key = lambda repo: (int(repo.get("size", 0) or 0), repo.get("pushed_at", ""))
+    size_then_recency_key = lambda repo: (repo.size, _pushed_at_key(repo))
     current_repos_raw.sort(key=size_then_recency_key, reverse=True)
     past_repos_raw.sort(key=size_then_recency_key, reverse=True)
+    return current_repos_raw, past_repos_raw
 
-    print(f"  Found {len(all_repos)} total repositories")
-    print(f"  Current (updated within {config.recent_days} days): {len(current_repos_raw)} repos")
-    print(f"  Past: {len(past_repos_raw)} repos")
-
-    current_repos = [
-        _build_repo_presentation(repo, github_service, overrides, config.uses_cap, config.github_username)
-        for repo in current_repos_raw
-    ]
-    past_repos = [
-        _build_repo_presentation(repo, github_service, overrides, config.uses_cap, config.github_username)
-        for repo in past_repos_raw
-    ]
-
-    language_totals = _aggregate_language_totals(all_repos, github_service, ignored_languages, config.language_summary_top)
-    language_summary = render_language_summary(language_totals)
-    resume_snapshot = extract_resume_snapshot(resume_path)
-
-    readme = load_readme(README_PATH)
-    readme = replace_section(readme, LANGUAGE_SUMMARY_START_MARKER, LANGUAGE_SUMMARY_END_MARKER, language_summary)
-    readme = replace_section(
-        readme,
-        CURRENT_PROJECTS_START_MARKER,
-        CURRENT_PROJECTS_END_MARKER,
-        render_repo_section(current_repos, EMPTY_CURRENT_PROJECTS_MESSAGE),
-    )
-    readme = replace_section(
-        readme,
-        PAST_PROJECTS_START_MARKER,
-        PAST_PROJECTS_END_MARKER,
-        render_repo_section(past_repos, EMPTY_PAST_PROJECTS_MESSAGE),
-    )
-    readme = replace_section(
-        readme,
-        RESUME_EXPERIENCE_START_MARKER,
-        RESUME_EXPERIENCE_END_MARKER,
-        render_resume_experience(resume_snapshot.experiences, EMPTY_RESUME_EXPERIENCE_MESSAGE),
-    )
-    readme = replace_section(
-        readme,
-        RESUME_SKILLS_START_MARKER,
-        RESUME_SKILLS_END_MARKER,
-        render_skill_icons(language_totals, resume_snapshot.skills, skill_icon_overrides, EMPTY_RESUME_SKILLS_MESSAGE),
-    )
-    readme = replace_section(
-        readme,
-        OTHER_TOOLS_START_MARKER,
-        OTHER_TOOLS_END_MARKER,
-        render_other_tools(resume_snapshot.skills, skill_icon_overrides, EMPTY_OTHER_TOOLS_MESSAGE),
-    )
-
-    readme = remove_duplicate_sections(
-        readme,
-        [
+# This function does render the generated sections present in the README.
+# It renders only the planned sections and removes duplicated generated headings.
+def _rewrite_readme(
+    readme_path: str,
+    present_sections: Set[str],
+    language_totals: List[Tuple[str, int]],
+    current_repos: List[RepoPresentation],
+    past_repos: List[RepoPresentation],
+    resume_snapshot: ResumeSnapshot,
+    skill_icon_overrides: Dict[str, Dict[str, str]],
+    dry_run: bool = False,
+) -> ReadmeWriteResult:
+    renderers = [
+        (
             LANGUAGE_SUMMARY_START_MARKER,
+            LANGUAGE_SUMMARY_END_MARKER,
+            lambda: render_language_summary(language_totals),
+        ),
+        (
             CURRENT_PROJECTS_START_MARKER,
+            CURRENT_PROJECTS_END_MARKER,
+            lambda: render_repo_section(current_repos, EMPTY_CURRENT_PROJECTS_MESSAGE),
+        ),
+        (
             PAST_PROJECTS_START_MARKER,
+            PAST_PROJECTS_END_MARKER,
+            lambda: render_repo_section(past_repos, EMPTY_PAST_PROJECTS_MESSAGE),
+        ),
+        (
+            RESUME_EXPERIENCE_START_MARKER,
+            RESUME_EXPERIENCE_END_MARKER,
+            lambda: render_resume_experience(resume_snapshot.experiences, EMPTY_RESUME_EXPERIENCE_MESSAGE),
+        ),
+        (
             RESUME_SKILLS_START_MARKER,
+            RESUME_SKILLS_END_MARKER,
+            lambda: render_skill_icons(language_totals, resume_snapshot.skills, skill_icon_overrides, EMPTY_RESUME_SKILLS_MESSAGE),
+        ),
+        (
             OTHER_TOOLS_START_MARKER,
-            RESUME_EXPERIENCE_START_MARKER,
-        ],
+            OTHER_TOOLS_END_MARKER,
+            lambda: render_other_tools(resume_snapshot.skills, skill_icon_overrides, EMPTY_OTHER_TOOLS_MESSAGE),
+        ),
+    ]
+    original = load_readme(readme_path)
+    readme = replace_sections(
+        original,
+        [(start_marker, end_marker, render()) for start_marker, end_marker, render in renderers if start_marker in present_sections],
+        [start_marker for start_marker, _ in GENERATED_SECTION_MARKERS],
+    )
+    return write_readme_update(readme_path, original, readme, GENERATED_SECTION_MARKERS, dry_run)
+
+# This function does decide which data sources the README's sections need.
+# It scans for marker pairs first, optionally limited to some sections, so absent sections cost no requests or parsing.
+def _plan_section_sources(readme_path: str, sections: Optional[Set[str]] = None) -> Tuple[Set[str], Set[str]]:
+    requested = [pair for pair in GENERATED_SECTION_MARKERS if sections is None or pair[0] in sections]
+    present_sections = find_present_sections(load_readme(readme_path), requested)
+    for start_marker, _ in requested:
+        if start_marker not in present_sections:
+            print(SECTION_SKIPPED_WARNING_TEMPLATE.format(marker=start_marker), file=sys.stderr)
+    return present_sections, _resolve_section_sources(present_sections)
+
+# This function does walk the section dependency graph.
+# It returns every data source the given sections need, directly or through another source.
+def _resolve_section_sources(start_markers: Iterable[str]) -> Set[str]:
+    sources: Set[str] = set()
+    pending = [source for start_marker in start_markers for source in SECTION_DEPENDENCIES[start_marker]]
+    while pending:
+        source = pending.pop()
+        if source not in sources:
+            sources.add(source)
+            pending.extend(SECTION_SOURCE_DEPENDENCIES.get(source, ()))
+    return sources
+
+# This function does expose README change results to later CI steps.
+# It appends changed/changed_sections to GITHUB_OUTPUT when that file is set.
+def _publish_change_outputs(results: List[ReadmeWriteResult]) -> None:
+    output_path = os.environ.get(ENV_GITHUB_OUTPUT, "").strip()
+    if not output_path:
+        return
+    changed = any(result.changed for result in results)
+    changed_sections = dict.fromkeys(section for result in results for section in result.changed_sections)
+    with open(output_path, "a", encoding="utf-8") as file_handle:
+        file_handle.write(f"changed={'true' if changed else 'false'}\n")
+        file_handle.write(f"changed_sections={','.join(changed_sections)}\n")
+
+# This function does build the runtime configuration from the environment.
+# It is the single-user default and the base that batch manifest entries override.
+def load_update_config() -> UpdateConfig:
+    return UpdateConfig(
+        github_username=os.environ.get(ENV_GITHUB_USERNAME, DEFAULT_GITHUB_USERNAME),
+        github_token=os.environ.get(ENV_GITHUB_TOKEN, ""),
+        recent_days=DEFAULT_RECENT_DAYS,
+        uses_cap=DEFAULT_USES_CAP,
+        language_summary_top=DEFAULT_LANGUAGE_SUMMARY_TOP,
+        enrichment_workers=resolve_env_int(ENV_ENRICHMENT_WORKERS, DEFAULT_ENRICHMENT_WORKERS, minimum=1),
+        analysis_workers=resolve_env_int(ENV_ANALYSIS_WORKERS, DEFAULT_ANALYSIS_WORKERS),
+        http_cache_path=resolve_http_cache_path(),
+        api_backend=resolve_github_api_backend(),
+        incremental=resolve_env_flag(ENV_INCREMENTAL_UPDATE),
+        metrics_report_path=resolve_metrics_report_path(),
+        api_base_url=resolve_github_api_base_url(),
+        max_repo_pages=resolve_env_int(ENV_GITHUB_MAX_REPO_PAGES, GITHUB_MAX_REPO_PAGES, minimum=1),
+        readme_path=resolve_readme_path(),
+        resume_path=resolve_resume_path(),
+        dry_run=resolve_env_flag(ENV_README_DRY_RUN),
+        readme_streaming=not resolve_env_flag(ENV_DISABLE_README_STREAMING),
+        readme_max_bytes=resolve_env_int(ENV_GITHUB_README_MAX_BYTES, GITHUB_README_MAX_BYTES, minimum=1),
+        async_max_in_flight=resolve_env_int(ENV_ASYNC_MAX_IN_FLIGHT, DEFAULT_ASYNC_MAX_IN_FLIGHT, minimum=1),
+        contributor_count_strategy=resolve_contributor_count_strategy(),
+        contributor_count_ttl_days=resolve_env_int(ENV_CONTRIBUTOR_COUNT_TTL_DAYS, DEFAULT_CONTRIBUTOR_COUNT_TTL_DAYS, minimum=1),
+        excluded_private_repos=resolve_excluded_private_repos(),
+    )
+
+# This function does execute the full update workflow end-to-end.
+# It fetches repos, prepares sections, and writes the README output.
+def run_update(
+    config: Optional[UpdateConfig] = None,
+    github_service: Optional[GitHubService] = None,
+    sections: Optional[Set[str]] = None,
+    analysis_pool: Optional[TextAnalysisPool] = None,
+) -> ReadmeWriteResult:
+    config = config or load_update_config()
+    if config.api_backend == GITHUB_API_BACKEND_ASYNC and github_service is None:
+        if ASYNC_CLIENT_AVAILABLE:
+            return asyncio.run(run_update_async(config, sections=sections))
+        print(ASYNC_CLIENT_MISSING_WARNING)
+
+    owns_service = github_service is None
+    overrides, ignored_repos, ignored_languages, skill_icon_overrides = _load_run_inputs(config)
+    present_sections, sources = _plan_section_sources(config.readme_path, sections)
+
+    if github_service is None and SECTION_SOURCE_REPO_LISTING in sources:
+        github_service = _create_github_service(config, RunMetrics())
+    metrics = github_service.metrics if github_service is not None else RunMetrics()
+    current_repos: List[RepoPresentation] = []
+    past_repos: List[RepoPresentation] = []
+    language_totals: List[Tuple[str, int]] = []
+    if SECTION_SOURCE_REPO_LISTING in sources:
+        try:
+            with metrics.phase("repo listing"):
+                all_repos = github_service.fetch_repos()
+            print(f"\nRaw API response: {len(all_repos)} repositories")
+
+            with metrics.phase("filtering"):
+                all_repos, current_repos_raw, past_repos_raw = _select_repos(all_repos, config, ignored_repos, sources)
+
+            if current_repos_raw or past_repos_raw:
+                state_fingerprint = build_state_fingerprint(overrides, config.uses_cap, config.github_username)
+                previous_state = load_incremental_state(config.state_path, state_fingerprint) if config.incremental else {}
+                with metrics.phase("enrichment"):
+                    presentations, next_state = _build_repo_presentations(
+                        current_repos_raw + past_repos_raw,
+                        [REQUEST_PRIORITY_CURRENT] * len(current_repos_raw) + [REQUEST_PRIORITY_PAST] * len(past_repos_raw),
+                        github_service,
+                        overrides,
+                        config,
+                        previous_state,
+                        analysis_pool,
+                    )
+                if config.incremental:
+                    save_incremental_state(config.state_path, state_fingerprint, next_state)
+                current_repos = presentations[:len(current_repos_raw)]
+                past_repos = presentations[len(current_repos_raw):]
+
+            if SECTION_SOURCE_LANGUAGE_TOTALS in sources:
+                with metrics.phase("language totals"):
+                    language_totals = _aggregate_language_totals(
+                        all_repos,
+                        github_service,
+                        ignored_languages,
+                        config.language_summary_top,
+                    )
+        finally:
+            if owns_service:
+                github_service.close()
+    resume_snapshot = _parse_resume_snapshot(config, metrics, sources)
+
+    return _finish_update(
+        config,
+        metrics,
+        present_sections,
+        current_repos,
+        past_repos,
+        language_totals,
+        resume_snapshot,
+        skill_icon_overrides,
+        owns_service,
+    )
+
+# This function does execute the update workflow on one asyncio event loop.
+# It bounds in-flight requests with a semaphore, analyzes each repo as its data lands, and parses the resume alongside enrichment.
+async def run_update_async(
+    config: Optional[UpdateConfig] = None,
+    github_service: Optional[AsyncGitHubService] = None,
+    sections: Optional[Set[str]] = None,
+    analysis_pool: Optional[TextAnalysisPool] = None,
+) -> ReadmeWriteResult:
+    config = config or load_update_config()
+    owns_service = github_service is None
+    overrides, ignored_repos, ignored_languages, skill_icon_overrides = _load_run_inputs(config)
+    present_sections, sources = _plan_section_sources(config.readme_path, sections)
+
+    if github_service is None and SECTION_SOURCE_REPO_LISTING in sources:
+        github_service = AsyncGitHubService(config, RunMetrics())
+    metrics = github_service.metrics if github_service is not None else RunMetrics()
+    current_repos: List[RepoPresentation] = []
+    past_repos: List[RepoPresentation] = []
+    language_totals: List[Tuple[str, int]] = []
+    resume_task = None
+    if SECTION_SOURCE_REPO_LISTING in sources:
+        try:
+            with metrics.phase("repo listing"):
+                all_repos = await github_service.fetch_repos()
+            print(f"\nRaw API response: {len(all_repos)} repositories")
+
+            with metrics.phase("filtering"):
+                all_repos, current_repos_raw, past_repos_raw = _select_repos(all_repos, config, ignored_repos, sources)
+
+            repos = current_repos_raw + past_repos_raw
+            priorities = [REQUEST_PRIORITY_CURRENT] * len(current_repos_raw) + [REQUEST_PRIORITY_PAST] * len(past_repos_raw)
+            state_fingerprint = build_state_fingerprint(overrides, config.uses_cap, config.github_username)
+            previous_state = load_incremental_state(config.state_path, state_fingerprint) if config.incremental and repos else {}
+            with metrics.phase("enrichment"):
+                presentations, language_usages, stale_indexes = _reuse_saved_presentations(repos, github_service, previous_state)
+                print(f"Enriching {len(stale_indexes)} repos with up to {config.async_max_in_flight} requests in flight …")
+                stale_repos = [repos[index] for index in stale_indexes]
+                await github_service.prime_contributor_counts(stale_repos)
+                with _open_analysis_pool(config, overrides, bool(stale_repos), analysis_pool) as run_analysis_pool:
+                    # Started after the analysis pool so its worker processes never fork from a busy thread.
+                    resume_task = asyncio.create_task(asyncio.to_thread(_parse_resume_snapshot, config, metrics, sources))
+                    enrichments = await _enrich_repos_async(
+                        stale_repos,
+                        [priorities[index] for index in stale_indexes],
+                        github_service,
+                        run_analysis_pool,
+                        overrides,
+                    )
+                presentations, next_state = _finish_repo_presentations(
+                    repos,
+                    presentations,
+                    language_usages,
+                    stale_indexes,
+                    enrichments,
+                    github_service,
+                    config,
+                )
+            if config.incremental and repos:
+                save_incremental_state(config.state_path, state_fingerprint, next_state)
+            current_repos = presentations[:len(current_repos_raw)]
+            past_repos = presentations[len(current_repos_raw):]
+
+            if SECTION_SOURCE_LANGUAGE_TOTALS in sources:
+                with metrics.phase("language totals"):
+                    usages = await asyncio.gather(
+                        *(github_service.fetch_language_usage(repo, REQUEST_PRIORITY_LANGUAGE_TOTALS) for repo in all_repos)
+                    )
+                    language_totals = _rank_language_totals(list(usages), ignored_languages, config.language_summary_top)
+        except BaseException:
+            # Settle the resume parse before re-raising so it is neither orphaned nor left with an unretrieved error.
+            if resume_task is not None:
+                resume_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await resume_task
+            raise
+        finally:
+            if owns_service:
+                await github_service.close()
+    resume_snapshot = await resume_task if resume_task is not None else _parse_resume_snapshot(config, metrics, sources)
+
+    return _finish_update(
+        config,
+        metrics,
+        present_sections,
+        current_repos,
+        past_repos,
+        language_totals,
+        resume_snapshot,
+        skill_icon_overrides,
+        owns_service,
     )
-    save_readme(README_PATH, readme)
-    print("README.md updated successfully.")
+
+# This function does enrich and analyze repositories as concurrent tasks.
+# It submits in priority order, shares in-flight work between duplicates, and returns results in input order.
+async def _enrich_repos_async(
+    repos: List[RepoRecord],
+    priorities: List[int],
+    github_service: AsyncGitHubService,
+    analysis_pool: TextAnalysisPool,
+    overrides: Dict[str, str],
+) -> List[Tuple[RepoEnrichment, RepoAnalysis]]:
+
+    async def enrich(repo: RepoRecord, priority: int) -> RepoEnrichment:
+        readme_text, language_usage, contributors = await asyncio.gather(
+            github_service.fetch_readme_text(repo, priority),
+            github_service.fetch_language_usage(repo, priority),
+            github_service.fetch_contributor_count(repo, priority),
+        )
+        return RepoEnrichment(readme_text=readme_text, language_usage=language_usage, contributors=contributors)
+
+    async def enrich_and_analyze(repo: RepoRecord, priority: int) -> Tuple[RepoEnrichment, RepoAnalysis]:
+        # Shielded because another batch user may be awaiting the same claimed task.
+        enrichment = await asyncio.shield(
+            github_service.enrichment_cache.claim(repo, lambda: asyncio.ensure_future(enrich(repo, priority)))
+        )
+        analysis = await asyncio.wrap_future(analysis_pool.submit(repo, enrichment.readme_text, overrides))
+        return enrichment, analysis
+
+    tasks: Dict[int, "asyncio.Task[Tuple[RepoEnrichment, RepoAnalysis]]"] = {}
+    for index in sorted(range(len(repos)), key=lambda index: priorities[index]):
+        tasks[index] = asyncio.ensure_future(enrich_and_analyze(repos[index], priorities[index]))
+    try:
+        return [await tasks[index] for index in range(len(repos))]
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+# This function does load the per-user JSON configs for a run.
+# It logs what was loaded before any request is sent.
+def _load_run_inputs(config: UpdateConfig) -> Tuple[Dict[str, str], Set[str], Set[str], Dict[str, Dict[str, str]]]:
+    overrides = load_description_overrides(config.config_dir)
+    ignored_repos = load_ignored_repos(config.config_dir)
+    ignored_languages = load_ignored_languages(config.config_dir)
+    skill_icon_overrides = load_skill_icon_overrides(config.config_dir)
+
+    print(f"Fetching {'public and private' if config.github_token else 'public'} repos for {config.github_username} …")
+    if overrides:
+        print(f"Loaded description overrides: {len(overrides)}")
+    if ignored_repos:
+        print(f"Loaded ignored repos: {len(ignored_repos)}")
+    if ignored_languages:
+        print(f"Loaded ignored languages: {len(ignored_languages)}")
+    if skill_icon_overrides.get("languages") or skill_icon_overrides.get("tools"):
+        print(
+            "Loaded skill icon overrides: "
+            f"{len(skill_icon_overrides.get('languages', {}))} language, "
+            f"{len(skill_icon_overrides.get('tools', {}))} tool"
+        )
+    if config.excluded_private_repos:
+        print(f"Loaded excluded private repos: {len(config.excluded_private_repos)}")
+    if not config.github_token:
+        print(NO_GITHUB_TOKEN_MESSAGE)
+
+    print(f"Resume source: {config.resume_path}")
+    return overrides, ignored_repos, ignored_languages, skill_icon_overrides
+
+# This function does filter, deduplicate, and split the listed repos.
+# It returns the kept repos with the current and past groups that planned sections need.
+def _select_repos(
+    all_repos: List[RepoRecord],
+    config: UpdateConfig,
+    ignored_repos: Set[str],
+    sources: Set[str],
+) -> Tuple[List[RepoRecord], List[RepoRecord], List[RepoRecord]]:
+    filtered_repos = _filter_repos(all_repos, config.github_username, ignored_repos, set(config.excluded_private_repos))
+    print(f"After filtering: {len(filtered_repos)} repositories included")
+    all_repos = _dedupe_repos(filtered_repos)
+    print(f"After deduplication: {len(all_repos)} repositories included")
+    current_repos_raw, past_repos_raw = _split_repos_by_recency(all_repos, config.recent_days)
+
+    print(f"  Found {len(all_repos)} total repositories")
+    print(f"  Current (updated within {config.recent_days} days): {len(current_repos_raw)} repos")
+    print(f"  Past: {len(past_repos_raw)} repos")
+    if SECTION_SOURCE_CURRENT_PROJECTS not in sources:
+        current_repos_raw = []
+    if SECTION_SOURCE_PAST_PROJECTS not in sources:
+        past_repos_raw = []
+    return all_repos, current_repos_raw, past_repos_raw
+
+# This function does parse the resume when a planned section needs it.
+# It returns an empty snapshot without opening the PDF otherwise.
+def _parse_resume_snapshot(config: UpdateConfig, metrics: RunMetrics, sources: Set[str]) -> ResumeSnapshot:
+    if SECTION_SOURCE_RESUME not in sources:
+        return ResumeSnapshot(experiences=[], skills={})
+    with metrics.phase("resume parsing"):
+        return extract_resume_snapshot(config.resume_path, config.resume_cache_path)
+
+# This function does render and write the README for a finished run.
+# It reports the outcome and, for standalone runs, publishes outputs and metrics.
+def _finish_update(
+    config: UpdateConfig,
+    metrics: RunMetrics,
+    present_sections: Set[str],
+    current_repos: List[RepoPresentation],
+    past_repos: List[RepoPresentation],
+    language_totals: List[Tuple[str, int]],
+    resume_snapshot: ResumeSnapshot,
+    skill_icon_overrides: Dict[str, Dict[str, str]],
+    standalone: bool,
+) -> ReadmeWriteResult:
+    with metrics.phase("readme rewrite"):
+        write_result = _rewrite_readme(
+            config.readme_path,
+            present_sections,
+            language_totals,
+            current_repos,
+            past_repos,
+            resume_snapshot,
+            skill_icon_overrides,
+            config.dry_run,
+        )
+    _report_write_result(write_result, config.dry_run)
+
+    if standalone:
+        _publish_change_outputs([write_result])
+        _report_metrics(metrics, config.metrics_report_path)
+    return write_result
+
+# This function does update every user listed in a batch manifest.
+# It runs users concurrently over one shared session, HTTP cache, metrics, and enrichment cache.
+def run_batch(manifest_path: str) -> List[ReadmeWriteResult]:
+    base_config = load_update_config()
+    workers, entries = load_batch_manifest(resolve_root_relative_path(manifest_path))
+    configs = [_build_batch_config(base_config, entry) for entry in entries]
+    configs = [config for config in configs if config is not None]
+    if not configs:
+        print(BATCH_EMPTY_MESSAGE)
+        return []
+
+    workers = min(workers, len(configs))
+    print(BATCH_START_MESSAGE_TEMPLATE.format(users=len(configs), workers=workers))
+    metrics = RunMetrics()
+    use_async = base_config.api_backend == GITHUB_API_BACKEND_ASYNC
+    if use_async and not ASYNC_CLIENT_AVAILABLE:
+        print(ASYNC_CLIENT_MISSING_WARNING)
+        use_async = False
+
+    # One analysis pool serves every user; it starts its worker processes here,
+    # before any batch or fetch thread exists to be forked mid-lock.
+    with TextAnalysisPool(max(config.analysis_workers for config in configs), {}) as analysis_pool:
+        if use_async:
+            outcomes = asyncio.run(_run_batch_async(configs, workers, metrics, analysis_pool))
+        else:
+            pool_size = workers * max(config.enrichment_workers for config in configs)
+            root_service = _create_github_service(configs[0], metrics, pool_size=pool_size)
+            services = [root_service] + [_create_github_service(config, metrics, shared=root_service) for config in configs[1:]]
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    outcomes = list(executor.map(_run_batch_entry, configs, services, [analysis_pool] * len(configs)))
+            finally:
+                root_service.close()
+
+    results = [result for result in outcomes if result is not None]
+    print(BATCH_DONE_MESSAGE_TEMPLATE.format(updated=sum(result.changed for result in results), users=len(configs)))
+    _publish_change_outputs(results)
+    _report_metrics(metrics, base_config.metrics_report_path)
+    return results
+
+# This function does run batch users as tasks on one event loop.
+# It shares one async client and semaphore and limits concurrent users to the manifest's workers.
+async def _run_batch_async(
+    configs: List[UpdateConfig],
+    workers: int,
+    metrics: RunMetrics,
+    analysis_pool: TextAnalysisPool,
+) -> List[Optional[ReadmeWriteResult]]:
+    root_service = AsyncGitHubService(configs[0], metrics)
+    services = [root_service] + [AsyncGitHubService(config, metrics, shared=root_service) for config in configs[1:]]
+    user_slots = asyncio.Semaphore(workers)
+
+    async def run_entry(config: UpdateConfig, github_service: AsyncGitHubService) -> Optional[ReadmeWriteResult]:
+        async with user_slots:
+            try:
+                return await run_update_async(config, github_service, analysis_pool=analysis_pool)
+            except Exception as error:
+                print(BATCH_USER_FAILED_WARNING_TEMPLATE.format(user=config.github_username, error=error))
+                return None
+
+    try:
+        return list(await asyncio.gather(*(run_entry(config, service) for config, service in zip(configs, services))))
+    finally:
+        await root_service.close()
+
+# This function does build one user's configuration from a manifest entry.
+# It layers the entry over the environment config and gives each user its own cache files.
+def _build_batch_config(base_config: UpdateConfig, entry: Dict[str, object]) -> Optional[UpdateConfig]:
+    username = str(entry.get("github_username") or "").strip()
+    if not username:
+        print(BATCH_MISSING_USERNAME_WARNING)
+        return None
+
+    field_types = {item.name: item.type for item in fields(UpdateConfig)}
+    for name in sorted(set(entry) - set(field_types)):
+        print(BATCH_UNKNOWN_FIELD_WARNING_TEMPLATE.format(field=name, user=username))
+    user_cache_dir = os.path.join(BATCH_USER_CACHE_DIR, username.lower())
+    values = {
+        "state_path": os.path.join(user_cache_dir, INCREMENTAL_STATE_FILENAME),
+        "resume_cache_path": os.path.join(user_cache_dir, RESUME_CACHE_FILENAME),
+        "metrics_report_path": "",
+    }
+    for name, value in entry.items():
+        if name not in field_types or name == "metrics_report_path":
+            continue
+        try:
+            values[name] = _coerce_batch_value(value, field_types[name])
+        except (TypeError, ValueError):
+            print(BATCH_INVALID_FIELD_WARNING_TEMPLATE.format(
+                user=username,
+                field=name,
+                expected=_describe_field_type(field_types[name]),
+                value=value,
+            ))
+            return None
+    return replace(base_config, **values)
+
+# This function does name a field type for a manifest warning.
+# It prints typing generics without their module prefix.
+def _describe_field_type(field_type: object) -> str:
+    return field_type.__name__ if isinstance(field_type, type) else str(field_type).replace("typing.", "")
+
+# This function does convert one manifest value to its UpdateConfig field type.
+# It accepts numeric and flag strings the way the environment does and raises for anything else.
+def _coerce_batch_value(value: object, field_type: object) -> object:
+    if field_type is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str):
+            return value.strip().lower() in TRUTHY_ENV_VALUES
+        raise TypeError(value)
+    if field_type is int:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise TypeError(value)
+        return int(value)
+    if field_type is str:
+        if isinstance(value, (dict, list)):
+            raise TypeError(value)
+        return "" if value is None else str(value)
+    if not isinstance(value, list) or any(isinstance(item, (dict, list)) for item in value):
+        raise TypeError(value)
+    return [str(item) for item in value]
+
+def _run_batch_entry(
+    config: UpdateConfig,
+    github_service: GitHubService,
+    analysis_pool: TextAnalysisPool,
+) -> Optional[ReadmeWriteResult]:
+    try:
+        return run_update(config, github_service, analysis_pool=analysis_pool)
+    except Exception as error:
+        print(BATCH_USER_FAILED_WARNING_TEMPLATE.format(user=config.github_username, error=error))
+        return None
+
+# This function does keep the README current from one long-running process.
+# It polls GitHub on a warm client and regenerates only the sections fed by a changed resume or config file.
+def run_daemon() -> None:
+    config = load_update_config()
+    poll_seconds = resolve_env_int(ENV_DAEMON_POLL_SECONDS, DEFAULT_DAEMON_POLL_SECONDS, minimum=1)
+    watch_seconds = resolve_env_int(ENV_DAEMON_WATCH_SECONDS, DEFAULT_DAEMON_WATCH_SECONDS, minimum=1)
+    if config.api_backend == GITHUB_API_BACKEND_ASYNC:
+        print(DAEMON_ASYNC_BACKEND_MESSAGE)
+
+    metrics = RunMetrics()
+    github_service = _create_github_service(config, metrics)
+    watched_files = _snapshot_watched_files(config)
+    print(DAEMON_START_MESSAGE_TEMPLATE.format(poll=poll_seconds, files=len(watched_files), watch=watch_seconds))
+    next_poll = 0.0
+    try:
+        while True:
+            if time.monotonic() >= next_poll:
+                next_poll = time.monotonic() + poll_seconds
+                print(DAEMON_POLL_MESSAGE)
+                github_service.begin_poll()
+                _run_daemon_update(config, github_service)
+                github_service.save_caches()
+                watched_files = _snapshot_watched_files(config)
+
+            time.sleep(watch_seconds)
+            current_files = _snapshot_watched_files(config)
+            changed_paths = sorted(
+                path for path in watched_files.keys() | current_files.keys() if watched_files.get(path) != current_files.get(path)
+            )
+            watched_files = current_files
+            if changed_paths:
+                sections = _sections_for_changed_files(config, changed_paths)
+                section_names = [section_name(start_marker) for start_marker, _ in GENERATED_SECTION_MARKERS if start_marker in sections]
+                print(
+                    DAEMON_CHANGE_MESSAGE_TEMPLATE.format(
+                        files=", ".join(os.path.basename(path) for path in changed_paths),
+                        sections=", ".join(section_names),
+                    )
+                )
+                _run_daemon_update(config, github_service, sections)
+    except KeyboardInterrupt:
+        print(DAEMON_STOP_MESSAGE)
+    finally:
+        github_service.close()
+        _report_metrics(metrics, config.metrics_report_path)
+
+def _run_daemon_update(config: UpdateConfig, github_service: GitHubService, sections: Optional[Set[str]] = None) -> None:
+    try:
+        run_update(config, github_service, sections)
+    except Exception as error:
+        print(DAEMON_UPDATE_FAILED_WARNING_TEMPLATE.format(error=error))
+
+# This function does record the modification times of the daemon's watched files.
+# It covers the resume and every JSON file in the config directory; missing files are left out.
+def _snapshot_watched_files(config: UpdateConfig) -> Dict[str, int]:
+    snapshot: Dict[str, int] = {}
+    for path in [config.resume_path] + sorted(glob.glob(os.path.join(config.config_dir, "*.json"))):
+        try:
+            snapshot[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return snapshot
+
+# This function does map changed watched files to the sections they feed.
+# It falls back to every section for config files without a known data source.
+def _sections_for_changed_files(config: UpdateConfig, changed_paths: List[str]) -> Set[str]:
+    sources: Set[str] = set()
+    for path in changed_paths:
+        if path == config.resume_path:
+            sources.add(SECTION_SOURCE_RESUME)
+            continue
+        file_sources = DAEMON_CONFIG_FILE_SOURCES.get(os.path.basename(path))
+        if file_sources is None:
+            return {start_marker for start_marker, _ in GENERATED_SECTION_MARKERS}
+        sources.update(file_sources)
+    return {
+        start_marker
+        for start_marker, _ in GENERATED_SECTION_MARKERS
+        if _resolve_section_sources([start_marker]) & sources
+    }
+
+# This function does print the outcome of one README write.
+# It shows the diff in dry-run mode and the changed sections otherwise.
+def _report_write_result(write_result: ReadmeWriteResult, dry_run: bool) -> None:
+    readme_name = os.path.basename(write_result.path)
+    if not write_result.changed:
+        print(README_UNCHANGED_MESSAGE_TEMPLATE.format(readme=readme_name))
+    elif dry_run:
+        changed_sections = ", ".join(write_result.changed_sections) or "outside generated sections"
+        print(README_DRY_RUN_MESSAGE_TEMPLATE.format(readme=readme_name, sections=changed_sections))
+        print(write_result.diff)
+    else:
+        print(f"{readme_name} updated successfully.")
+        if write_result.changed_sections:
+            print(f"Changed sections: {', '.join(write_result.changed_sections)}")
+
+def _report_metrics(metrics: RunMetrics, report_path: str) -> None:
+    print("\nRun metrics:")
+    print(metrics.render_summary())
+    if report_path:
+        metrics.write_report(report_path)
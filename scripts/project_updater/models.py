@@ -2,11 +2,47 @@
 #                          models.py
 #     Defines dataclasses used by the updater pipeline.
 
-from dataclasses import dataclass
-from typing import Dict, List
-from .config import DEFAULT_LANGUAGE_SUMMARY_TOP, DEFAULT_RECENT_DAYS, DEFAULT_USES_CAP
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from .config import (
+    CONFIG_DIR,
+    CONTRIBUTOR_STORE_PATH,
+    GITHUB_API_BASE_URL,
+    GITHUB_MAX_REPO_PAGES,
+    GITHUB_README_MAX_BYTES,
+    INCREMENTAL_STATE_PATH,
+    README_PATH,
+    RESUME_CACHE_PATH,
+    DEFAULT_ANALYSIS_WORKERS,
+    DEFAULT_ASYNC_MAX_IN_FLIGHT,
+    DEFAULT_CONTRIBUTOR_COUNT_STRATEGY,
+    DEFAULT_CONTRIBUTOR_COUNT_TTL_DAYS,
+    DEFAULT_ENRICHMENT_WORKERS,
+    DEFAULT_GITHUB_API_BACKEND,
+    DEFAULT_LANGUAGE_SUMMARY_TOP,
+    DEFAULT_RECENT_DAYS,
+    DEFAULT_USES_CAP,
+)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class RepoRecord:
+    id: Optional[int]
+    name: str
+    full_name: str
+    html_url: str
+    description: str
+    language: str
+    languages_url: str
+    owner_login: str
+    owner_type: str
+    pushed_at: Optional[datetime]
+    size: int
+    stars: int
+    forks: int
+    private: bool
+
+@dataclass(slots=True)
 class RepoPresentation:
     name: str
     url: str
@@ -23,6 +59,38 @@ class UpdateConfig:
     recent_days: int = DEFAULT_RECENT_DAYS
     uses_cap: int = DEFAULT_USES_CAP
     language_summary_top: int = DEFAULT_LANGUAGE_SUMMARY_TOP
+    enrichment_workers: int = DEFAULT_ENRICHMENT_WORKERS
+    analysis_workers: int = DEFAULT_ANALYSIS_WORKERS
+    async_max_in_flight: int = DEFAULT_ASYNC_MAX_IN_FLIGHT
+    contributor_count_strategy: str = DEFAULT_CONTRIBUTOR_COUNT_STRATEGY
+    contributor_count_ttl_days: int = DEFAULT_CONTRIBUTOR_COUNT_TTL_DAYS
+    contributor_store_path: str = CONTRIBUTOR_STORE_PATH
+    http_cache_path: str = ""
+    api_backend: str = DEFAULT_GITHUB_API_BACKEND
+    incremental: bool = False
+    metrics_report_path: str = ""
+    api_base_url: str = GITHUB_API_BASE_URL
+    max_repo_pages: int = GITHUB_MAX_REPO_PAGES
+    readme_path: str = README_PATH
+    resume_path: str = ""
+    dry_run: bool = False
+    readme_streaming: bool = True
+    readme_max_bytes: int = GITHUB_README_MAX_BYTES
+    config_dir: str = CONFIG_DIR
+    state_path: str = INCREMENTAL_STATE_PATH
+    resume_cache_path: str = RESUME_CACHE_PATH
+    excluded_private_repos: List[str] = field(default_factory=list)
+
+@dataclass
+class RepoEnrichment:
+    readme_text: str
+    language_usage: List[Tuple[str, int]]
+    contributors: int
+
+@dataclass
+class RepoAnalysis:
+    summary: str
+    framework_usage: List[Tuple[str, int]]
 
 @dataclass
 class ResumeExperienceEntry:
@@ -33,3 +101,11 @@ class ResumeExperienceEntry:
 class ResumeSnapshot:
     experiences: List[ResumeExperienceEntry]
     skills: Dict[str, List[str]]
+
+@dataclass
+class ReadmeWriteResult:
+    path: str
+    changed: bool
+    changed_sections: List[str] = field(default_factory=list)
+    written: bool = False
+    diff: str = ""
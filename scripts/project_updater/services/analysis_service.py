@@ -0,0 +1,76 @@
+#------------------------------------------------------------
+#                     analysis_service.py
+#        Runs summary selection and framework inference
+#         inline or across a pool of worker processes.
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional
+from ..models import RepoAnalysis, RepoRecord
+from .description_service import clean_text, infer_frameworks, select_description
+
+ANALYSIS_POOL_MESSAGE = "Analyzing repo text with {workers} worker processes"
+
+_worker_overrides: Dict[str, str] = {}
+
+# This function does analyze one repo's description and README text.
+# It returns the chosen summary and ranked framework counts.
+def analyze_repo_text(repo: RepoRecord, readme_text: str, overrides: Dict[str, str]) -> RepoAnalysis:
+    context_text = clean_text(" ".join(part for part in [repo.description, readme_text] if part))
+    return RepoAnalysis(
+        summary=select_description(repo, context_text, overrides),
+        framework_usage=infer_frameworks(context_text),
+    )
+
+def _init_worker(overrides: Dict[str, str]) -> None:
+    global _worker_overrides
+    _worker_overrides = overrides
+
+def _analyze_in_worker(repo: RepoRecord, readme_text: str) -> RepoAnalysis:
+    return analyze_repo_text(repo, readme_text, _worker_overrides)
+
+def _ping_worker() -> None:
+    return None
+
+class TextAnalysisPool:
+
+    # This function does prepare the analysis stage.
+    # It starts worker processes up front when workers > 0, otherwise analyzes inline.
+    def __init__(self, workers: int, overrides: Dict[str, str]):
+        self.overrides = overrides
+        self.executor: Optional[ProcessPoolExecutor] = None
+        if workers > 0:
+            print(ANALYSIS_POOL_MESSAGE.format(workers=workers))
+            self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(overrides,))
+            # Start the workers now, before any fetch threads exist to be forked mid-lock.
+            for future in [self.executor.submit(_ping_worker) for _ in range(workers)]:
+                future.result()
+
+    def __enter__(self) -> "TextAnalysisPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # This function does queue analysis for one repo.
+    # It analyzes immediately when no worker processes are configured, and ships other overrides with the task.
+    def submit(
+        self,
+        repo: RepoRecord,
+        readme_text: str,
+        overrides: Optional[Dict[str, str]] = None,
+    ) -> "Future[RepoAnalysis]":
+        if overrides is None:
+            overrides = self.overrides
+        if self.executor is not None:
+            if overrides is self.overrides:
+                return self.executor.submit(_analyze_in_worker, repo, readme_text)
+            return self.executor.submit(analyze_repo_text, repo, readme_text, overrides)
+
+        future: "Future[RepoAnalysis]" = Future()
+        future.set_result(analyze_repo_text(repo, readme_text, overrides))
+        return future
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
@@ -0,0 +1,302 @@
+#------------------------------------------------------------
+#                  async_github_service.py
+#        Fetches GitHub data on one asyncio event loop
+#          with a bounded number of requests in flight.
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from ..config import (
+    GITHUB_MAX_RETRIES,
+    GITHUB_MAX_RETRY_WAIT_SECONDS,
+    GITHUB_README_RAW_ACCEPT_HEADER,
+    GITHUB_README_STREAM_CHUNK_BYTES,
+    GITHUB_REPOS_PER_PAGE,
+    GITHUB_REQUEST_TIMEOUT_SECONDS,
+)
+from ..models import RepoRecord, UpdateConfig
+from .enrichment_cache_service import ENRICHMENT_LANGUAGES, ENRICHMENT_README
+from .github_service import (
+    HTTP_STATUS_NOT_MODIFIED,
+    HTTP_STATUS_OK,
+    HTTP_STATUS_TOO_MANY_REQUESTS,
+    REQUEST_CATEGORY_CONTRIBUTORS,
+    REQUEST_CATEGORY_GRAPHQL,
+    REQUEST_CATEGORY_LANGUAGES,
+    REQUEST_CATEGORY_README,
+    REQUEST_CATEGORY_REPOS,
+    RETRY_MESSAGE_TEMPLATE,
+    GitHubServiceBase,
+    ReadmeStreamCondenser,
+    build_repo_record,
+)
+from .metrics_service import RunMetrics
+from .rate_limit_service import REQUEST_PRIORITY_CURRENT, REQUEST_PRIORITY_LISTING
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+ASYNC_CLIENT_AVAILABLE = httpx is not None
+ASYNC_CLIENT_MISSING_WARNING = (
+    "WARNING: GITHUB_API_BACKEND=async requires httpx (pip install httpx); falling back to the threaded REST backend"
+)
+ASYNC_CLIENT_MESSAGE = "Using async REST client with up to {limit} requests in flight"
+
+class AsyncGitHubService(GitHubServiceBase):
+
+    # This function does initialize the async client and its request bound.
+    # It reuses the client, semaphore, caches, and metrics of a shared service when one is given.
+    def __init__(
+        self,
+        config: UpdateConfig,
+        metrics: Optional[RunMetrics] = None,
+        shared: Optional["AsyncGitHubService"] = None,
+    ):
+        super().__init__(config, metrics, shared)
+        if shared is not None:
+            self.client = shared.client
+            self.semaphore = shared.semaphore
+            return
+
+        max_in_flight = max(1, config.async_max_in_flight)
+        print(ASYNC_CLIENT_MESSAGE.format(limit=max_in_flight))
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight),
+            timeout=GITHUB_REQUEST_TIMEOUT_SECONDS,
+        )
+        self.semaphore = asyncio.Semaphore(max_in_flight)
+
+    # This function does persist cached responses and close the client.
+    # It is a no-op for services that borrow another service's client.
+    async def close(self) -> None:
+        if not self.owns_session:
+            return
+        self.save_caches()
+        await self.client.aclose()
+
+    # This function does issue a GET request with cache revalidation.
+    # It replays cached bodies on 304 and skips low-priority requests when the budget runs low.
+    async def _get(
+        self,
+        url: str,
+        category: str,
+        priority: int = REQUEST_PRIORITY_LISTING,
+        degraded_key: str = "",
+        accept: str = "",
+        body_reader: Optional[Callable[[Any], Awaitable[str]]] = None,
+    ):
+        request_headers, cache_key, entry, local_response = self._plan_get(url, category, priority, degraded_key, accept)
+        if local_response is not None:
+            return local_response
+
+        response = await self._send(url, request_headers, category, body_reader)
+        if response.status_code == HTTP_STATUS_NOT_MODIFIED and entry is not None:
+            return self._replay_cached(category, entry)
+
+        self._remember_response(cache_key, category, response)
+        return response
+
+    # This function does send one request while holding a semaphore slot.
+    # It retries transient failures and rate limits with backoff, sleeping outside the slot.
+    async def _send(
+        self,
+        url: str,
+        request_headers: Dict[str, str],
+        category: str,
+        body_reader: Optional[Callable[[Any], Awaitable[str]]] = None,
+        json_payload: Optional[dict] = None,
+    ):
+        attempt = 0
+        while True:
+            async with self.semaphore:
+                started = time.perf_counter()
+                try:
+                    response, text = await self._request(url, request_headers, body_reader, json_payload)
+                except httpx.TransportError:
+                    self.metrics.record_request(category, time.perf_counter() - started, 0, 0)
+                    if attempt >= GITHUB_MAX_RETRIES:
+                        raise
+                    response = None
+
+            if response is None:
+                attempt += 1
+                self.metrics.record_retry(category)
+                await asyncio.sleep(self._backoff_seconds(attempt))
+                continue
+
+            self.metrics.record_request(
+                category,
+                time.perf_counter() - started,
+                0 if body_reader is not None else len(response.content or b""),
+                response.status_code,
+            )
+            self.rate_limit.record(response.headers)
+
+            delay = self._retry_delay_seconds(response, attempt + 1)
+            if delay is None or attempt >= GITHUB_MAX_RETRIES or delay > GITHUB_MAX_RETRY_WAIT_SECONDS:
+                return self._buffered_response(response, text) if body_reader is not None else response
+
+            attempt += 1
+            self.metrics.record_retry(category)
+            print(
+                RETRY_MESSAGE_TEMPLATE.format(
+                    url=url,
+                    delay=delay,
+                    status=response.status_code,
+                    attempt=attempt,
+                    max_attempts=GITHUB_MAX_RETRIES,
+                )
+            )
+            await asyncio.sleep(delay)
+
+    # This function does perform one request and read its body.
+    # It streams successful bodies through the reader and buffers everything else.
+    async def _request(
+        self,
+        url: str,
+        request_headers: Dict[str, str],
+        body_reader: Optional[Callable[[Any], Awaitable[str]]],
+        json_payload: Optional[dict] = None,
+    ) -> Tuple[Any, str]:
+        if json_payload is not None:
+            return await self.client.post(url, headers=request_headers, json=json_payload), ""
+        if body_reader is None:
+            return await self.client.get(url, headers=request_headers), ""
+
+        request = self.client.build_request("GET", url, headers=request_headers)
+        response = await self.client.send(request, stream=True)
+        try:
+            if response.status_code == HTTP_STATUS_OK:
+                return response, await body_reader(response)
+            await response.aread()
+            return response, ""
+        finally:
+            await response.aclose()
+
+    # This function does fetch accessible repositories from GitHub.
+    # It reads the last page from the Link header and gathers the rest concurrently.
+    async def fetch_repos(self) -> List[RepoRecord]:
+        base_url = self._repo_listing_base_url()
+        first_page, link_header = await self._fetch_repo_page(base_url, 1)
+        pages: List[list] = [first_page]
+        if len(first_page) >= GITHUB_REPOS_PER_PAGE:
+            last_page = min(self._parse_last_page_from_link_header(link_header), self.config.max_repo_pages)
+            if last_page > 1:
+                results = await asyncio.gather(*(self._fetch_repo_page(base_url, page) for page in range(2, last_page + 1)))
+                pages.extend(data for data, _ in results)
+            else:
+                page = 2
+                while page <= self.config.max_repo_pages:
+                    data, _ = await self._fetch_repo_page(base_url, page)
+                    pages.append(data)
+                    if len(data) < GITHUB_REPOS_PER_PAGE:
+                        break
+                    page += 1
+
+        return self._merge_listing_pages(pages)
+
+    async def _fetch_repo_page(self, base_url: str, page: int) -> Tuple[list, str]:
+        url = self._repo_page_url(base_url, page)
+        return self._parse_repo_page(url, await self._get(url, REQUEST_CATEGORY_REPOS), build_repo_record)
+
+    # This function does fetch and condense repository README text.
+    # It streams raw markdown unless streaming is disabled and caches the text per repo version.
+    async def fetch_readme_text(self, repo: RepoRecord, priority: int = REQUEST_PRIORITY_CURRENT) -> str:
+        cached = self.enrichment_cache.lookup(repo, ENRICHMENT_README)
+        if cached is not None:
+            return cached
+
+        full_name = repo.full_name
+        if not full_name:
+            return ""
+
+        url = self._readme_url(full_name)
+        if self.config.readme_streaming:
+            response = await self._get(
+                url,
+                REQUEST_CATEGORY_README,
+                priority,
+                degraded_key=full_name,
+                accept=GITHUB_README_RAW_ACCEPT_HEADER,
+                body_reader=self._read_readme_stream,
+            )
+            text = response.text if response.status_code == HTTP_STATUS_OK else ""
+        else:
+            response = await self._get(url, REQUEST_CATEGORY_README, priority, degraded_key=full_name)
+            text = self._decode_readme_payload(response) if response.status_code == HTTP_STATUS_OK else ""
+
+        if response.status_code != HTTP_STATUS_TOO_MANY_REQUESTS:
+            self.enrichment_cache.store(repo, ENRICHMENT_README, text)
+        return text
+
+    # This function does condense a streamed raw README body.
+    # It stops reading once the line budget is met or the byte cap is reached.
+    async def _read_readme_stream(self, response) -> str:
+        condenser = ReadmeStreamCondenser(self.config.readme_max_bytes)
+        try:
+            async for chunk in response.aiter_bytes(chunk_size=GITHUB_README_STREAM_CHUNK_BYTES):
+                if chunk and condenser.feed(chunk):
+                    break
+            return condenser.finish()
+        finally:
+            self.metrics.record_bytes(REQUEST_CATEGORY_README, condenser.bytes_read)
+
+    # This function does fetch language usage for a repository.
+    # It caches results and falls back to the primary language.
+    async def fetch_language_usage(self, repo: RepoRecord, priority: int = REQUEST_PRIORITY_CURRENT) -> List[Tuple[str, int]]:
+        if repo.id is None:
+            return self._fallback_language_usage(repo)
+        cached = self.enrichment_cache.lookup(repo, ENRICHMENT_LANGUAGES)
+        if cached is not None:
+            return cached
+
+        if not repo.languages_url:
+            usage = self._fallback_language_usage(repo)
+            self.enrichment_cache.store(repo, ENRICHMENT_LANGUAGES, usage)
+            return usage
+
+        response = await self._get(repo.languages_url, REQUEST_CATEGORY_LANGUAGES, priority, degraded_key=repo.full_name)
+        usage, cacheable = self._parse_language_usage(repo, response)
+        if cacheable:
+            self.enrichment_cache.store(repo, ENRICHMENT_LANGUAGES, usage)
+        return usage
+
+    # This function does fetch contributor count for a repository.
+    # It uses link headers when available and caches results.
+    async def fetch_contributor_count(self, repo: RepoRecord, priority: int = REQUEST_PRIORITY_CURRENT) -> int:
+        if repo.id is None:
+            return 0
+
+        known = self._lookup_contributor_count(repo)
+        if known is not None:
+            return known
+
+        full_name = repo.full_name
+        if not full_name:
+            return 0
+
+        response = await self._get(
+            self._contributors_url(full_name),
+            REQUEST_CATEGORY_CONTRIBUTORS,
+            priority,
+            degraded_key=full_name,
+        )
+        count, cacheable = self._parse_contributor_count(response)
+        if cacheable:
+            self._remember_contributor_count(repo, count)
+        return count
+
+    # This function does fetch contributor counts for many repos with batched GraphQL queries.
+    # It sends the batches concurrently; repos they miss fall back to REST.
+    async def prime_contributor_counts(self, repos: List[RepoRecord]) -> None:
+        batches = self._plan_contributor_queries(repos)
+        responses = await asyncio.gather(
+            *(
+                self._send(self._graphql_url(), self.headers(), REQUEST_CATEGORY_GRAPHQL, json_payload=payload)
+                for _, payload in batches
+            )
+        )
+        for (batch, _), response in zip(batches, responses):
+            self._apply_contributor_counts(batch, response)
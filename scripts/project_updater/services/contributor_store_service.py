@@ -0,0 +1,86 @@
+#------------------------------------------------------------
+#                 contributor_store_service.py
+#        Persists contributor counts between runs so they
+#            are refreshed on a TTL instead of nightly.
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+CONTRIBUTOR_STORE_FORMAT_VERSION = 1
+CONTRIBUTOR_STORE_LOADED_MESSAGE = "Loaded stored contributor counts: {count} repos from {path}"
+CONTRIBUTOR_STORE_SAVE_WARNING_TEMPLATE = "WARNING: could not write contributor counts to {path!r}: {error}"
+SECONDS_PER_DAY = 86400
+
+class ContributorCountStore:
+
+    # This function does initialize the store from its JSON file.
+    # It starts empty when the file is missing, invalid, or outdated.
+    def __init__(self, path: str, ttl_days: int):
+        self.path = path
+        self.ttl_seconds = max(0, ttl_days) * SECONDS_PER_DAY
+        self.entries: Dict[str, Tuple[int, int]] = {}
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file_handle:
+                data = json.load(file_handle)
+        except Exception:
+            return
+        if not isinstance(data, dict) or data.get("version") != CONTRIBUTOR_STORE_FORMAT_VERSION:
+            return
+
+        for key, raw_entry in (data.get("repos") or {}).items():
+            try:
+                self.entries[key] = (int(raw_entry["count"]), int(raw_entry["fetched_at"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        print(CONTRIBUTOR_STORE_LOADED_MESSAGE.format(count=len(self.entries), path=self.path))
+
+    # This function does return a stored count that is still fresh.
+    # It returns None when the repo is unknown or its count is older than the TTL.
+    def lookup(self, repo_id: int) -> Optional[int]:
+        with self.lock:
+            entry = self.entries.get(str(repo_id))
+        if entry is None or not self._is_fresh(entry[1]):
+            return None
+        return entry[0]
+
+    # This function does record a freshly fetched count.
+    # It stamps the entry with the current time.
+    def store(self, repo_id: int, count: int) -> None:
+        with self.lock:
+            self.entries[str(repo_id)] = (count, int(time.time()))
+
+    # This function does write fresh counts to disk.
+    # It drops expired entries and replaces the file atomically.
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self.lock:
+            payload = {
+                "version": CONTRIBUTOR_STORE_FORMAT_VERSION,
+                "repos": {
+                    key: {"count": count, "fetched_at": fetched_at}
+                    for key, (count, fetched_at) in sorted(self.entries.items())
+                    if self._is_fresh(fetched_at)
+                },
+            }
+
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file_handle:
+                json.dump(payload, file_handle)
+            os.replace(temp_path, self.path)
+        except Exception as error:
+            print(CONTRIBUTOR_STORE_SAVE_WARNING_TEMPLATE.format(path=self.path, error=error))
+
+    def _is_fresh(self, fetched_at: int) -> bool:
+        return time.time() - fetched_at < self.ttl_seconds
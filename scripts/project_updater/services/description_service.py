@@ -4,16 +4,18 @@
 #                      language labels.
 
 import re
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
+from ..models import RepoRecord
 
-MARKDOWN_IMAGE_PATTERN = r"!\[[^\]]*\]\([^)]*\)"
-MARKDOWN_LINK_PATTERN = r"\[([^\]]+)\]\([^)]*\)"
-BACKTICK_PATTERN = r"`+"
-HTML_TAG_PATTERN = r"<[^>]+>"
-LEADING_MARKDOWN_PATTERN = r"^[#>*\-\s]+"
-WHITESPACE_PATTERN = r"\s+"
-SENTENCE_SPLIT_PATTERN = r"(?<=[.!?])\s+"
-WORD_PATTERN = r"[A-Za-z0-9+#.-]+"
+MARKDOWN_IMAGE_PATTERN = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+MARKDOWN_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\([^)]*\)")
+BACKTICK_PATTERN = re.compile(r"`+")
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+LEADING_MARKDOWN_PATTERN = re.compile(r"^[#>*\-\s]+", re.MULTILINE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+WORD_PATTERN = re.compile(r"[A-Za-z0-9+#.-]+")
 
 MIN_SENTENCE_WORDS = 7
 LOW_QUALITY_SCORE = -100
@@ -59,41 +61,79 @@ GOOD_SENTENCE_KEYWORDS = (
     "analy",
 )
 
+BAD_SENTENCE_PATTERN = re.compile("|".join(re.escape(pattern) for pattern in BAD_SENTENCE_PATTERNS))
+
 FRAMEWORK_KEYWORDS = {
     "react": "React",
+    "react.js": "React",
+    "reactjs": "React",
     "next.js": "Next.js",
     "nextjs": "Next.js",
+    "next js": "Next.js",
     "vue": "Vue",
+    "vue.js": "Vue",
     "angular": "Angular",
+    "angular.js": "Angular",
+    "angularjs": "Angular",
     "django": "Django",
     "flask": "Flask",
     "fastapi": "FastAPI",
     "spring": "Spring",
+    "spring boot": "Spring",
     "laravel": "Laravel",
     "express": "Express",
+    "express.js": "Express",
     "node": "Node.js",
+    "node.js": "Node.js",
     "microservice": "Microservices",
     "microservices": "Microservices",
     "mvc": "MVC",
     "rest": "REST API",
+    "restful": "REST API",
     "graphql": "GraphQL",
     "docker": "Docker",
+    "dockerfile": "Docker",
     "kubernetes": "Kubernetes",
     "azure": "Azure",
     "unity": "Unity",
     "shaderlab": "ShaderLab",
 }
+# This function does group framework keywords under the shortest key they start with.
+# It builds one whole-word matcher per group so "react", "react.js", and "reactjs" are found in one scan.
+def _build_framework_patterns() -> Dict[str, Tuple["re.Pattern[str]", str]]:
+    patterns: Dict[str, Tuple["re.Pattern[str]", str]] = {}
+    for root, value in FRAMEWORK_KEYWORDS.items():
+        if any(root != other and root.startswith(other) for other in FRAMEWORK_KEYWORDS):
+            continue
+        suffixes = sorted((key[len(root):] for key in FRAMEWORK_KEYWORDS if key != root and key.startswith(root)), key=len, reverse=True)
+        escaped_root = re.escape(root)
+        suffix_group = f"(?:{'|'.join(re.escape(suffix) for suffix in suffixes)})?" if suffixes else ""
+        # The boundary lookbehind follows the literal so the regex engine can still scan for the key directly.
+        patterns[root] = (
+            re.compile(rf"{escaped_root}(?<![a-z0-9+#]{escaped_root}){suffix_group}(?!\.?[a-z0-9+#])"),
+            value,
+        )
+    return patterns
+
+FRAMEWORK_PATTERNS = _build_framework_patterns()
+FRAMEWORK_LABEL_ORDER = {value: position for position, value in enumerate(dict.fromkeys(FRAMEWORK_KEYWORDS.values()))}
+
+@dataclass
+class ScoredSentence:
+    text: str
+    words: List[str]
+    score: int
 
 # This function does clean markdown and HTML artifacts from text.
 # It normalizes whitespace for downstream sentence processing.
 def clean_text(text: str) -> str:
     cleaned = text or ""
-    cleaned = re.sub(MARKDOWN_IMAGE_PATTERN, " ", cleaned)
-    cleaned = re.sub(MARKDOWN_LINK_PATTERN, r"\1", cleaned)
-    cleaned = re.sub(BACKTICK_PATTERN, "", cleaned)
-    cleaned = re.sub(HTML_TAG_PATTERN, " ", cleaned)
-    cleaned = re.sub(LEADING_MARKDOWN_PATTERN, "", cleaned, flags=re.MULTILINE)
-    cleaned = re.sub(WHITESPACE_PATTERN, " ", cleaned).strip()
+    cleaned = MARKDOWN_IMAGE_PATTERN.sub(" ", cleaned)
+    cleaned = MARKDOWN_LINK_PATTERN.sub(r"\1", cleaned)
+    cleaned = BACKTICK_PATTERN.sub("", cleaned)
+    cleaned = HTML_TAG_PATTERN.sub(" ", cleaned)
+    cleaned = LEADING_MARKDOWN_PATTERN.sub("", cleaned)
+    cleaned = WHITESPACE_PATTERN.sub(" ", cleaned).strip()
     return cleaned
 
 # This function does split text into sentence candidates.
@@ -101,14 +141,15 @@ def clean_text(text: str) -> str:
 def split_sentences(text: str) -> List[str]:
     if not text:
         return []
-    parts = re.split(SENTENCE_SPLIT_PATTERN, text)
+    parts = SENTENCE_SPLIT_PATTERN.split(text)
     return [part.strip() for part in parts if part.strip()]
 
 # This function does trim and normalize a sentence length.
 # It removes duplicated runs and ensures a trailing period.
 def clamp_sentence(sentence: str, max_words: int = 24) -> str:
-    words = re.findall(WORD_PATTERN, sentence)
+    return _clamp_words(WORD_PATTERN.findall(sentence), max_words)
 
+def _clamp_words(words: List[str], max_words: int = 24) -> str:
     for size in range(6, 1, -1):
         if len(words) >= size * 2 and words[:size] == words[size:size * 2]:
             words = words[:size] + words[size * 2:]
@@ -127,21 +168,22 @@ def clamp_sentence(sentence: str, max_words: int = 24) -> str:
 # This function does score candidate sentence quality.
 # It rewards useful wording and penalizes boilerplate text.
 def sentence_quality_score(sentence: str) -> int:
-    lowered = sentence.lower()
-    words = re.findall(WORD_PATTERN, sentence)
-    if len(words) < MIN_SENTENCE_WORDS:
-        return LOW_QUALITY_SCORE
+    return score_sentence(sentence).score
 
-    if any(pattern in lowered for pattern in BAD_SENTENCE_PATTERNS):
-        return PENALTY_SCORE
+# This function does tokenize and score a sentence once.
+# It keeps the word list so clamping does not re-tokenize the text.
+def score_sentence(sentence: str) -> ScoredSentence:
+    words = WORD_PATTERN.findall(sentence)
+    if len(words) < MIN_SENTENCE_WORDS:
+        return ScoredSentence(text=sentence, words=words, score=LOW_QUALITY_SCORE)
 
-    score = 0
-    for key in GOOD_SENTENCE_KEYWORDS:
-        if key in lowered:
-            score += KEYWORD_SCORE
+    lowered = sentence.lower()
+    if BAD_SENTENCE_PATTERN.search(lowered):
+        return ScoredSentence(text=sentence, words=words, score=PENALTY_SCORE)
 
+    score = KEYWORD_SCORE * sum(1 for keyword in GOOD_SENTENCE_KEYWORDS if keyword in lowered)
     score += max(0, TARGET_WORD_COUNT_SCORE - abs(TARGET_WORD_COUNT - len(words)))
-    return score
+    return ScoredSentence(text=sentence, words=words, score=score)
 
 # This function does choose the strongest sentence from inputs.
 # It ranks candidates and returns a clamped best result.
@@ -154,41 +196,44 @@ def choose_best_sentence(*texts: str) -> str:
     if not candidates:
         return ""
 
-    ranked = sorted(candidates, key=sentence_quality_score, reverse=True)
-    best = ranked[0]
-    if sentence_quality_score(best) < 0:
+    best = max((score_sentence(candidate) for candidate in candidates), key=lambda scored: scored.score)
+    if best.score < 0:
         return ""
-    return clamp_sentence(best)
+    return _clamp_words(best.words)
 
 # This function does build a fallback repository description.
 # It uses repo name and primary language when no summary exists.
-def fallback_description(repo: dict) -> str:
-    name = repo.get("name", FALLBACK_REPO_NAME)
-    primary = repo.get("language") or FALLBACK_PRIMARY_LANGUAGE
+def fallback_description(repo: RepoRecord) -> str:
+    name = repo.name or FALLBACK_REPO_NAME
+    primary = repo.language or FALLBACK_PRIMARY_LANGUAGE
     return f"{name} is a {primary} project with clear goals and practical implementation details."
 
 # This function does infer framework names from context text.
-# It returns framework counts sorted by frequency.
+# It finds each keyword group with a substring search and counts whole-word matches from the first hit onward.
 def infer_frameworks(text: str) -> List[Tuple[str, int]]:
-    scores: Dict[str, int] = {}
     lowered = (text or "").lower()
-    for key, value in FRAMEWORK_KEYWORDS.items():
-        count = lowered.count(key)
-        if count > 0:
-            scores[value] = scores.get(value, 0) + count
+    scores: Dict[str, int] = {}
+    for root, (pattern, value) in FRAMEWORK_PATTERNS.items():
+        start = lowered.find(root)
+        if start >= 0:
+            count = len(pattern.findall(lowered, start))
+            if count:
+                scores[value] = scores.get(value, 0) + count
 
-    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return sorted(scores.items(), key=lambda item: (-item[1], FRAMEWORK_LABEL_ORDER[item[0]]))
 
 # This function does select the final repository description.
 # It prioritizes overrides, then description text, then fallback.
-def select_description(repo: dict, context_text: str, overrides: Dict[str, str]) -> str:
-    override = overrides.get((repo.get("name") or "").strip().lower())
+def select_description(repo: RepoRecord, context_text: str, overrides: Dict[str, str]) -> str:
+    override = overrides.get(repo.name.strip().lower())
     if override:
         return clamp_sentence(override)
 
-    about = clean_text(repo.get("description") or "")
-    if about and sentence_quality_score(about) >= 0:
-        return clamp_sentence(about, max_words=OVERRIDE_DESCRIPTION_MAX_WORDS)
+    about = clean_text(repo.description)
+    if about:
+        scored_about = score_sentence(about)
+        if scored_about.score >= 0:
+            return _clamp_words(scored_about.words, max_words=OVERRIDE_DESCRIPTION_MAX_WORDS)
 
     best = choose_best_sentence(context_text)
     return best or fallback_description(repo)
@@ -200,7 +245,15 @@ def select_languages(
     context_text: str,
     uses_cap: int,
 ) -> str:
-    framework_usage = infer_frameworks(context_text)
+    return compose_languages(language_usage, infer_frameworks(context_text), uses_cap)
+
+# This function does merge language usage with already inferred frameworks.
+# It lets framework inference run in a separate analysis stage.
+def compose_languages(
+    language_usage: List[Tuple[str, int]],
+    framework_usage: List[Tuple[str, int]],
+    uses_cap: int,
+) -> str:
     merged: List[str] = []
     seen = set()
 
@@ -0,0 +1,80 @@
+#------------------------------------------------------------
+#                 enrichment_cache_service.py
+#        Keeps README, language, and contributor results
+#         for one run, keyed by repo id and pushed_at.
+
+import threading
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from ..models import RepoRecord
+
+ENRICHMENT_README = "readme"
+ENRICHMENT_LANGUAGES = "languages"
+ENRICHMENT_CONTRIBUTORS = "contributors"
+
+EnrichmentKey = Tuple[int, Optional[datetime]]
+
+class EnrichmentCache:
+
+    # This function does initialize the result and in-flight maps.
+    # It is shared by every service in a batch so each repo version is enriched once.
+    def __init__(self):
+        self.values: Dict[Tuple[EnrichmentKey, str], Any] = {}
+        self.in_flight: Dict[EnrichmentKey, Future] = {}
+        self.latest_pushed_at: Dict[int, Optional[datetime]] = {}
+        self.lock = threading.Lock()
+
+    # This function does build the cache key for a repo.
+    # It returns None for repos without an id, which are never cached.
+    @staticmethod
+    def key(repo: RepoRecord) -> Optional[EnrichmentKey]:
+        return None if repo.id is None else (repo.id, repo.pushed_at)
+
+    # This function does return a cached part for a repo.
+    # It returns None when the part has not been stored for this repo version.
+    def lookup(self, repo: RepoRecord, part: str) -> Any:
+        key = self.key(repo)
+        if key is None:
+            return None
+        with self.lock:
+            return self.values.get((key, part))
+
+    # This function does record one enrichment part for a repo.
+    # It ignores repos without an id.
+    def store(self, repo: RepoRecord, part: str, value: Any) -> None:
+        key = self.key(repo)
+        if key is None:
+            return
+        with self.lock:
+            self.values[(key, part)] = value
+            self.latest_pushed_at[key[0]] = key[1]
+
+    # This function does return the in-flight or finished enrichment for a repo.
+    # It starts the work only for the first caller, so duplicate listings cost one set of requests.
+    def claim(self, repo: RepoRecord, start: Callable[[], Future]) -> Future:
+        key = self.key(repo)
+        if key is None:
+            return start()
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is None:
+                future = start()
+                self.in_flight[key] = future
+            return future
+
+    # This function does forget every enrichment claim.
+    # It lets a long-running process retry failed or degraded repos while stored parts stay cached.
+    def release_claims(self) -> None:
+        with self.lock:
+            self.in_flight.clear()
+
+    # This function does drop stored parts for superseded repo versions.
+    # It keeps only the newest pushed_at stored per repo id, so a long-running process does not grow without bound.
+    def evict_stale(self) -> None:
+        with self.lock:
+            self.values = {
+                (key, part): value
+                for (key, part), value in self.values.items()
+                if self.latest_pushed_at.get(key[0]) == key[1]
+            }
@@ -0,0 +1,174 @@
+#------------------------------------------------------------
+#                  github_graphql_service.py
+#         Fetches repositories, languages, and READMEs
+#            in batched GitHub GraphQL v4 queries.
+
+from typing import List, Optional, Tuple
+from ..config import (
+    GITHUB_GRAPHQL_LANGUAGES_PER_REPO,
+    GITHUB_GRAPHQL_PAGE_SIZE,
+    GITHUB_LANGUAGE_FALLBACK_BYTES,
+    GITHUB_REPOS_PER_PAGE,
+    OWNER_TYPE_ORGANIZATION,
+)
+from ..models import RepoRecord
+from .enrichment_cache_service import ENRICHMENT_LANGUAGES, ENRICHMENT_README
+from .github_service import HTTP_STATUS_OK, REQUEST_CATEGORY_GRAPHQL, GitHubService, parse_timestamp
+
+GRAPHQL_REPOS_QUERY = """
+query($first: Int!, $after: String, $languages: Int!) {
+  viewer {
+    repositories(
+      first: $first
+      after: $after
+      affiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+      ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+      orderBy: {field: PUSHED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        databaseId
+        name
+        nameWithOwner
+        url
+        description
+        isPrivate
+        pushedAt
+        createdAt
+        diskUsage
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        owner { login __typename }
+        languages(first: $languages, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+        readme: object(expression: "HEAD:README.md") {
+          ... on Blob { text }
+        }
+      }
+    }
+  }
+}
+"""
+
+LANGUAGES_URL_TEMPLATE = "{base}/repos/{full_name}/languages"
+GRAPHQL_REPOS_MESSAGE = "Using GraphQL viewer.repositories batch query"
+GRAPHQL_PAGE_RESULT_MESSAGE = "GraphQL page {page}: Found {count} repositories"
+GRAPHQL_NO_TOKEN_MESSAGE = "GraphQL backend requires GITHUB_TOKEN - falling back to REST"
+GRAPHQL_FALLBACK_WARNING_TEMPLATE = "WARNING: GraphQL repository query failed ({reason}); falling back to REST"
+GRAPHQL_ORGANIZATION_TYPENAME = "Organization"
+GRAPHQL_USER_TYPENAME = "User"
+
+class GitHubGraphQLService(GitHubService):
+
+    # This function does fetch accessible repositories through GraphQL.
+    # It primes language and README caches and falls back to REST on failure.
+    def fetch_repos(self) -> List[RepoRecord]:
+        if not self.config.github_token:
+            print(GRAPHQL_NO_TOKEN_MESSAGE)
+            return super().fetch_repos()
+
+        print(GRAPHQL_REPOS_MESSAGE)
+        max_repos = self.config.max_repo_pages * GITHUB_REPOS_PER_PAGE
+        repos: List[RepoRecord] = []
+        cursor: Optional[str] = None
+        page = 1
+
+        while len(repos) < max_repos:
+            connection, reason = self._query_repositories(cursor)
+            if connection is None:
+                print(GRAPHQL_FALLBACK_WARNING_TEMPLATE.format(reason=reason))
+                return super().fetch_repos()
+
+            nodes = [node for node in connection.get("nodes") or [] if node]
+            print(GRAPHQL_PAGE_RESULT_MESSAGE.format(page=page, count=len(nodes)))
+            for node in nodes:
+                repos.append(self._shape_repo(node))
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or not nodes:
+                break
+            cursor = page_info.get("endCursor")
+            page += 1
+
+        return repos[:max_repos]
+
+    # This function does run one page of the repository query.
+    # It returns the connection object or None with a failure reason.
+    def _query_repositories(self, cursor: Optional[str]) -> Tuple[Optional[dict], str]:
+        payload = {
+            "query": GRAPHQL_REPOS_QUERY,
+            "variables": {
+                "first": GITHUB_GRAPHQL_PAGE_SIZE,
+                "after": cursor,
+                "languages": GITHUB_GRAPHQL_LANGUAGES_PER_REPO,
+            },
+        }
+        response = self._send(
+            self._graphql_url(),
+            self.headers(),
+            REQUEST_CATEGORY_GRAPHQL,
+            json_payload=payload,
+        )
+        if response.status_code != HTTP_STATUS_OK:
+            return None, f"status {response.status_code}"
+
+        try:
+            body = response.json()
+        except Exception:
+            return None, "invalid JSON"
+
+        connection = ((body.get("data") or {}).get("viewer") or {}).get("repositories")
+        if not isinstance(connection, dict):
+            errors = body.get("errors") or []
+            message = errors[0].get("message") if errors and isinstance(errors[0], dict) else "no data"
+            return None, message
+        return connection, ""
+
+    # This function does project a GraphQL node onto a RepoRecord.
+    # It records private repos, language edges, and README text in the service caches.
+    def _shape_repo(self, node: dict) -> RepoRecord:
+        full_name = node.get("nameWithOwner") or ""
+        owner = node.get("owner") or {}
+        owner_typename = owner.get("__typename") or GRAPHQL_USER_TYPENAME
+        primary = (node.get("primaryLanguage") or {}).get("name") or ""
+
+        repo = RepoRecord(
+            id=node.get("databaseId"),
+            name=node.get("name") or "",
+            full_name=full_name,
+            html_url=node.get("url") or "",
+            description=node.get("description") or "",
+            language=primary,
+            languages_url=LANGUAGES_URL_TEMPLATE.format(base=self.config.api_base_url, full_name=full_name),
+            owner_login=owner.get("login") or "",
+            owner_type=(
+                OWNER_TYPE_ORGANIZATION.title()
+                if owner_typename == GRAPHQL_ORGANIZATION_TYPENAME
+                else GRAPHQL_USER_TYPENAME
+            ),
+            pushed_at=parse_timestamp(node.get("pushedAt") or node.get("createdAt")),
+            size=int(node.get("diskUsage") or 0),
+            stars=int(node.get("stargazerCount") or 0),
+            forks=int(node.get("forkCount") or 0),
+            private=bool(node.get("isPrivate")),
+        )
+        if repo.private:
+            self.private_repo_names.add(full_name)
+
+        if repo.id is not None:
+            usage = [
+                ((edge.get("node") or {}).get("name"), int(edge.get("size") or 0))
+                for edge in ((node.get("languages") or {}).get("edges") or [])
+                if (edge.get("node") or {}).get("name")
+            ]
+            if not usage and primary:
+                usage = [(primary, GITHUB_LANGUAGE_FALLBACK_BYTES)]
+            self.enrichment_cache.store(repo, ENRICHMENT_LANGUAGES, usage)
+
+        readme_text = (node.get("readme") or {}).get("text")
+        if isinstance(readme_text, str):
+            self.enrichment_cache.store(repo, ENRICHMENT_README, self._condense_readme(readme_text))
+
+        return repo
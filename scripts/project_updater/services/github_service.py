@@ -4,20 +4,46 @@
 #                      response shaping.
 
 import base64
+import codecs
+import hashlib
+import json
 import re
-from typing import Dict, List, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from ..config import (
     GITHUB_API_ACCEPT_HEADER,
-    GITHUB_API_BASE_URL,
+    CONTRIBUTOR_COUNT_STRATEGY_GRAPHQL,
+    CONTRIBUTOR_COUNT_STRATEGY_STORED,
     GITHUB_CONTRIBUTOR_PER_PAGE,
+    GITHUB_GRAPHQL_CONTRIBUTOR_BATCH_SIZE,
+    GITHUB_GRAPHQL_ENDPOINT,
     GITHUB_LANGUAGE_FALLBACK_BYTES,
-    GITHUB_MAX_REPO_PAGES,
+    GITHUB_MAX_RETRIES,
+    GITHUB_MAX_RETRY_WAIT_SECONDS,
+    GITHUB_POOL_CONNECTIONS,
     GITHUB_README_MAX_LINES,
+    GITHUB_README_RAW_ACCEPT_HEADER,
+    GITHUB_README_STREAM_CHUNK_BYTES,
     GITHUB_REPOS_PER_PAGE,
     GITHUB_REQUEST_TIMEOUT_SECONDS,
+    GITHUB_RETRY_BACKOFF_SECONDS,
+    GITHUB_SECONDARY_RATE_LIMIT_WAIT_SECONDS,
 )
-from ..models import UpdateConfig
+from ..models import RepoRecord, UpdateConfig
+from .contributor_store_service import ContributorCountStore
+from .enrichment_cache_service import (
+    ENRICHMENT_CONTRIBUTORS,
+    ENRICHMENT_LANGUAGES,
+    ENRICHMENT_README,
+    EnrichmentCache,
+)
+from .http_cache_service import HttpCacheEntry, HttpResponseCache, conditional_headers
+from .metrics_service import RunMetrics
+from .rate_limit_service import REQUEST_PRIORITY_CURRENT, REQUEST_PRIORITY_LISTING, RateLimitBudget
 
 AUTH_REPOS_ENDPOINT = "/user/repos"
 USER_REPOS_ENDPOINT_TEMPLATE = "/users/{username}/repos"
@@ -34,65 +60,344 @@ README_EXPECTED_ENCODING = "base64"
 README_DECODE_ENCODING = "utf-8"
 README_DECODE_ERROR_MODE = "ignore"
 README_SKIP_PREFIXES = ("#", "![", "[![", "<img", "<p align")
+README_LINE_BREAK_CHARACTERS = tuple("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
 LINK_LAST_PAGE_PATTERN = r"[?&]page=(\d+)>;\s*rel=\"last\""
 
-class GitHubService:
+REQUEST_CATEGORY_REPOS = "repos"
+REQUEST_CATEGORY_README = "readme"
+REQUEST_CATEGORY_LANGUAGES = "languages"
+REQUEST_CATEGORY_CONTRIBUTORS = "contributors"
+REQUEST_CATEGORY_GRAPHQL = "graphql"
 
-    # This function does initialize service state and in-memory caches.
-    # It stores runtime configuration used by API methods.
-    def __init__(self, config: UpdateConfig):
+HTTP_STATUS_OK = 200
+HTTP_STATUS_NOT_MODIFIED = 304
+HTTP_STATUS_TOO_MANY_REQUESTS = 429
+CACHE_SCOPE_PUBLIC = "public"
+CACHE_SCOPE_TOKEN_HASH_LENGTH = 12
+
+RETRYABLE_STATUS_CODES = {500, 502, 503, 504}
+RATE_LIMITED_STATUS_CODES = {403, 429}
+SECONDARY_RATE_LIMIT_TEXT = "secondary rate limit"
+RETRY_MESSAGE_TEMPLATE = "Retrying {url} in {delay:.1f}s (status {status}, attempt {attempt}/{max_attempts})"
+
+CONTRIBUTOR_COUNT_QUERY_FIELD_TEMPLATE = "r{index}: repository(owner: $o{index}, name: $n{index}) {{ mentionableUsers {{ totalCount }} }}"
+CONTRIBUTOR_GRAPHQL_MESSAGE = "Counting contributors for {count} repos in {batches} GraphQL queries"
+CONTRIBUTOR_GRAPHQL_NO_TOKEN_MESSAGE = "GraphQL contributor counts require GITHUB_TOKEN - using REST"
+CONTRIBUTOR_GRAPHQL_FAILED_WARNING_TEMPLATE = "WARNING: GraphQL contributor query failed (status {status}); using REST for {count} repos"
+
+# This function does project a REST repository payload onto a RepoRecord.
+# It keeps only the fields the pipeline reads and parses pushed_at once.
+def build_repo_record(data: dict) -> RepoRecord:
+    owner = data.get("owner") or {}
+    return RepoRecord(
+        id=data.get("id"),
+        name=data.get("name") or "",
+        full_name=data.get("full_name") or "",
+        html_url=data.get("html_url") or "",
+        description=data.get("description") or "",
+        language=data.get("language") or "",
+        languages_url=data.get("languages_url") or "",
+        owner_login=owner.get("login") or "",
+        owner_type=owner.get("type") or "",
+        pushed_at=parse_timestamp(data.get("pushed_at")),
+        size=int(data.get("size") or 0),
+        stars=int(data.get("stargazers_count") or 0),
+        forks=int(data.get("forks_count") or 0),
+        private=bool(data.get("private")),
+    )
+
+# This function does parse a GitHub ISO-8601 timestamp.
+# It returns None for missing or malformed values.
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+class LocalResponse:
+
+    # This function does build a response-like object served without a request.
+    # It exposes the attributes the fetch methods read from responses.
+    def __init__(self, status_code: int, text: str = "", link: str = ""):
+        self.status_code = status_code
+        self.headers = {"Link": link} if link else {}
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} served locally without a request")
+
+class ReadmeStreamCondenser:
+
+    # This function does prepare incremental decoding for one README body.
+    # It caps the bytes read and keeps only condensed content lines.
+    def __init__(self, max_bytes: int):
+        self.decoder = codecs.getincrementaldecoder(README_DECODE_ENCODING)(errors=README_DECODE_ERROR_MODE)
+        self.max_bytes = max(1, max_bytes)
+        self.bytes_read = 0
+        self.pending = ""
+        self.lines: List[str] = []
+
+    # This function does consume one chunk of the body.
+    # It returns True once the line budget or the byte cap is reached and reading should stop.
+    def feed(self, chunk: bytes) -> bool:
+        chunk = chunk[:self.max_bytes - self.bytes_read]
+        self.bytes_read += len(chunk)
+        parts = (self.pending + self.decoder.decode(chunk)).splitlines(keepends=True)
+        self.pending = parts.pop() if parts and not parts[-1].endswith(README_LINE_BREAK_CHARACTERS) else ""
+        for part in parts:
+            if self._add_line(part):
+                return True
+        return self.bytes_read >= self.max_bytes
+
+    # This function does return the condensed text read so far.
+    # It flushes a trailing partial line when the line budget is not yet met.
+    def finish(self) -> str:
+        if len(self.lines) < GITHUB_README_MAX_LINES:
+            self.pending += self.decoder.decode(b"", final=True)
+            if self.pending:
+                self._add_line(self.pending)
+        return " ".join(self.lines)
+
+    def _add_line(self, line: str) -> bool:
+        stripped = line.strip()
+        if stripped and not stripped.startswith(README_SKIP_PREFIXES):
+            self.lines.append(stripped)
+        return len(self.lines) >= GITHUB_README_MAX_LINES
+
+class GitHubServiceBase:
+
+    # This function does initialize request state shared by the sync and async clients.
+    # It reuses the caches and metrics of a shared service when one is given.
+    def __init__(
+        self,
+        config: UpdateConfig,
+        metrics: Optional[RunMetrics] = None,
+        shared: Optional["GitHubServiceBase"] = None,
+    ):
         self.config = config
-        self.contributor_count_cache: Dict[int, int] = {}
-        self.language_usage_cache: Dict[int, List[Tuple[str, int]]] = {}
+        self.request_headers = self._build_headers(config.github_token)
+        self.cache_scope = self._build_cache_scope(config.github_token)
+        self.rate_limit = RateLimitBudget()
+        self.degraded_repos: Set[str] = set()
+        self.owns_session = shared is None
+        if shared is not None:
+            self.metrics = shared.metrics
+            self.private_repo_names = shared.private_repo_names
+            self.http_cache = shared.http_cache
+            self.enrichment_cache = shared.enrichment_cache
+            self.contributor_store = shared.contributor_store
+            return
+
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        self.private_repo_names: Set[str] = set()
+        self.enrichment_cache = EnrichmentCache()
+        self.http_cache: Optional[HttpResponseCache] = (
+            HttpResponseCache(config.http_cache_path) if config.http_cache_path else None
+        )
+        self.contributor_store: Optional[ContributorCountStore] = (
+            ContributorCountStore(config.contributor_store_path, config.contributor_count_ttl_days)
+            if config.contributor_count_strategy == CONTRIBUTOR_COUNT_STRATEGY_STORED
+            else None
+        )
+
+    # This function does write the on-disk caches owned by this service.
+    # It is called by whichever client closes the shared state, and periodically by the daemon.
+    def save_caches(self) -> None:
+        if self.http_cache is not None:
+            self.http_cache.save()
+        if self.contributor_store is not None:
+            self.contributor_store.save()
+
+    # This function does reset the per-poll state of a long-lived client.
+    # It forgets degraded repos and enrichment claims, evicts stale repo versions, and re-arms the rate-limit warning.
+    def begin_poll(self) -> None:
+        self.degraded_repos.clear()
+        self.rate_limit.rearm_warning()
+        self.enrichment_cache.release_claims()
+        self.enrichment_cache.evict_stale()
+
+    # This function does return request headers for GitHub API calls.
+    # It reuses the header map built once at construction time.
+    def headers(self) -> Dict[str, str]:
+        return self.request_headers
 
     # This function does build request headers for GitHub API calls.
     # It adds auth headers when a token is configured.
-    def headers(self) -> Dict[str, str]:
+    @staticmethod
+    def _build_headers(token: str) -> Dict[str, str]:
         headers = {"Accept": GITHUB_API_ACCEPT_HEADER}
-        if self.config.github_token:
-            headers["Authorization"] = f"Bearer {self.config.github_token}"
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
         return headers
 
-    # This function does fetch accessible repositories from GitHub.
-    # It pages through API results and returns a combined list.
-    def fetch_repos(self) -> List[dict]:
-        repos: List[dict] = []
-        page = 1
+    # This function does derive the cache namespace for a token.
+    # It keeps public and authenticated responses apart without storing the token.
+    @staticmethod
+    def _build_cache_scope(token: str) -> str:
+        if not token:
+            return CACHE_SCOPE_PUBLIC
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()[:CACHE_SCOPE_TOKEN_HASH_LENGTH]
+
+    # This function does decide how a GET is served before anything is sent.
+    # It returns headers, cache key, and cached entry, or a local response when the budget is spent.
+    def _plan_get(
+        self,
+        url: str,
+        category: str,
+        priority: int,
+        degraded_key: str,
+        accept: str,
+    ) -> Tuple[Dict[str, str], str, Optional[HttpCacheEntry], Optional[LocalResponse]]:
+        request_headers = self.headers()
+        if accept:
+            request_headers = {**request_headers, "Accept": accept}
+        cache_key = self._cache_key(url, accept)
+        if degraded_key in self.private_repo_names and self.http_cache is not None:
+            self.http_cache.mark_private(cache_key)
+        entry = self.http_cache.lookup(cache_key) if self.http_cache is not None else None
+
+        if not self.rate_limit.allows(priority):
+            if entry is not None:
+                return request_headers, cache_key, entry, self._replay_cached(category, entry)
+            if degraded_key:
+                self.degraded_repos.add(degraded_key)
+            self.metrics.record_degraded(category)
+            return request_headers, cache_key, entry, LocalResponse(HTTP_STATUS_TOO_MANY_REQUESTS)
+
+        if entry is not None:
+            request_headers = {**request_headers, **conditional_headers(entry)}
+        return request_headers, cache_key, entry, None
 
+    def _cache_key(self, url: str, accept: str = "") -> str:
+        return f"{self.cache_scope} {accept} {url}" if accept else f"{self.cache_scope} {url}"
+
+    def _replay_cached(self, category: str, entry: HttpCacheEntry) -> LocalResponse:
+        self.metrics.record_cache(category, hit=True)
+        return LocalResponse(HTTP_STATUS_OK, entry.body, entry.link)
+
+    # This function does record a fresh response in the HTTP cache.
+    # It stores successful bodies together with their validators.
+    def _remember_response(self, cache_key: str, category: str, response) -> None:
+        if self.http_cache is None:
+            return
+        self.metrics.record_cache(category, hit=False)
+        if response.status_code == HTTP_STATUS_OK:
+            self.http_cache.store(
+                cache_key,
+                HttpCacheEntry(
+                    etag=response.headers.get("ETag", ""),
+                    last_modified=response.headers.get("Last-Modified", ""),
+                    link=response.headers.get("Link", ""),
+                    body=response.text,
+                ),
+            )
+
+    # This function does wrap a body read from a streamed response.
+    # It keeps the Link and validator headers the HTTP cache needs.
+    @staticmethod
+    def _buffered_response(raw_response, text: str) -> LocalResponse:
+        if raw_response.status_code != HTTP_STATUS_OK:
+            return LocalResponse(raw_response.status_code)
+        response = LocalResponse(HTTP_STATUS_OK, text, raw_response.headers.get("Link", ""))
+        response.headers.update(
+            {name: raw_response.headers[name] for name in ("ETag", "Last-Modified") if name in raw_response.headers}
+        )
+        return response
+
+    # This function does compute how long to wait before retrying.
+    # It honors Retry-After and X-RateLimit-Reset and returns None when no retry applies.
+    @staticmethod
+    def _retry_delay_seconds(response, attempt: int) -> Optional[float]:
+        status = response.status_code
+        if status not in RETRYABLE_STATUS_CODES and status not in RATE_LIMITED_STATUS_CODES:
+            return None
+
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.strip().isdigit():
+            return float(retry_after.strip())
+
+        if status in RETRYABLE_STATUS_CODES:
+            return GitHubServiceBase._backoff_seconds(attempt)
+
+        reset_at = response.headers.get("X-RateLimit-Reset", "")
+        if response.headers.get("X-RateLimit-Remaining") == "0" and reset_at.strip().isdigit():
+            return max(0.0, float(reset_at.strip()) - time.time()) + 1
+
+        if SECONDARY_RATE_LIMIT_TEXT in (response.text or "").lower():
+            return float(GITHUB_SECONDARY_RATE_LIMIT_WAIT_SECONDS)
+        if status == 429:
+            return GitHubServiceBase._backoff_seconds(attempt)
+        return None
+
+    @staticmethod
+    def _backoff_seconds(attempt: int) -> float:
+        return float(GITHUB_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1)))
+
+    # This function does pick the repository listing endpoint.
+    # It uses the authenticated listing when a token is configured.
+    def _repo_listing_base_url(self) -> str:
         if self.config.github_token:
-            base_url = f"{GITHUB_API_BASE_URL}{AUTH_REPOS_ENDPOINT}"
             print(AUTH_REPOS_MESSAGE)
-        else:
-            base_url = f"{GITHUB_API_BASE_URL}{USER_REPOS_ENDPOINT_TEMPLATE.format(username=self.config.github_username)}"
-            print(PUBLIC_REPOS_MESSAGE)
+            return f"{self.config.api_base_url}{AUTH_REPOS_ENDPOINT}"
+        print(PUBLIC_REPOS_MESSAGE)
+        return f"{self.config.api_base_url}{USER_REPOS_ENDPOINT_TEMPLATE.format(username=self.config.github_username)}"
 
-        while True:
-            url = REPO_QUERY_TEMPLATE.format(base=base_url, per_page=GITHUB_REPOS_PER_PAGE, page=page)
-            if not self.config.github_token:
-                url += PUBLIC_REPOS_FILTER_QUERY
+    def _repo_page_url(self, base_url: str, page: int) -> str:
+        url = REPO_QUERY_TEMPLATE.format(base=base_url, per_page=GITHUB_REPOS_PER_PAGE, page=page)
+        if not self.config.github_token:
+            url += PUBLIC_REPOS_FILTER_QUERY
+        return url
 
-            response = requests.get(url, headers=self.headers(), timeout=GITHUB_REQUEST_TIMEOUT_SECONDS)
-            response.raise_for_status()
-            data = response.json()
+    # This function does project one listing response onto page items.
+    # It remembers private repos and keeps a page listing any of them out of the on-disk HTTP cache.
+    def _parse_repo_page(self, url: str, response, project: Callable[[dict], Any]) -> Tuple[list, str]:
+        response.raise_for_status()
+        data = response.json()
+        payloads = [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+        private_names = [str(item.get("full_name") or "") for item in payloads if item.get("private")]
+        if private_names:
+            self.private_repo_names.update(private_names)
+            if self.http_cache is not None:
+                self.http_cache.mark_private(self._cache_key(url))
+        return [project(item) for item in payloads], response.headers.get("Link", "")
+
+    # This function does merge fetched listing pages in page order.
+    # It stops at the first empty or short page.
+    @staticmethod
+    def _merge_listing_pages(pages: List[list]) -> list:
+        repos: list = []
+        for page, data in enumerate(pages, start=1):
             if not data:
                 break
-
             print(PAGE_RESULT_MESSAGE.format(page=page, count=len(data)))
             repos.extend(data)
-            page += 1
-            if page > GITHUB_MAX_REPO_PAGES:
+            if len(data) < GITHUB_REPOS_PER_PAGE:
                 break
 
         return repos
 
-    # This function does fetch and decode repository README text.
-    # It strips non-content lines and returns condensed text.
-    def fetch_readme_text(self, full_name: str) -> str:
-        url = f"{GITHUB_API_BASE_URL}{README_ENDPOINT_TEMPLATE.format(full_name=full_name)}"
-        response = requests.get(url, headers=self.headers(), timeout=GITHUB_REQUEST_TIMEOUT_SECONDS)
-        if response.status_code != 200:
-            return ""
+    def _readme_url(self, full_name: str) -> str:
+        return f"{self.config.api_base_url}{README_ENDPOINT_TEMPLATE.format(full_name=full_name)}"
+
+    def _contributors_url(self, full_name: str) -> str:
+        return f"{self.config.api_base_url}{CONTRIBUTORS_ENDPOINT_TEMPLATE.format(full_name=full_name, per_page=GITHUB_CONTRIBUTOR_PER_PAGE)}"
+
+    # This function does decode and condense a base64 JSON README payload.
+    # It returns empty text when the payload cannot be decoded.
+    @staticmethod
+    def _decode_readme_payload(response) -> str:
+        return GitHubServiceBase._condense_readme(GitHubServiceBase._decode_readme_markdown(response))
 
+    # This function does decode a base64 JSON README payload.
+    # It returns empty text for unexpected encodings or undecodable content.
+    @staticmethod
+    def _decode_readme_markdown(response) -> str:
         data = response.json()
         content = data.get("content", "")
         encoding = data.get("encoding", "")
@@ -100,12 +405,20 @@ class GitHubService:
             return ""
 
         try:
-            decoded = base64.b64decode(content).decode(README_DECODE_ENCODING, errors=README_DECODE_ERROR_MODE)
+            return base64.b64decode(content).decode(README_DECODE_ENCODING, errors=README_DECODE_ERROR_MODE)
         except Exception:
             return ""
 
+    # This function does condense decoded README text into summary input.
+    # It drops headings, badges, and images and keeps the first content lines.
+    @staticmethod
+    def _condense_readme(decoded: str) -> str:
+        return GitHubServiceBase._condense_readme_lines(decoded.splitlines())
+
+    @staticmethod
+    def _condense_readme_lines(raw_lines: Iterable[str]) -> str:
         lines = []
-        for line in decoded.splitlines():
+        for line in raw_lines:
             stripped = line.strip()
             if not stripped:
                 continue
@@ -117,74 +430,112 @@ class GitHubService:
 
         return " ".join(lines)
 
-    # This function does fetch language usage for a repository.
-    # It caches results and falls back to the primary language.
-    def fetch_language_usage(self, repo: dict) -> List[Tuple[str, int]]:
-        repo_id = repo.get("id")
-        if repo_id is None:
-            primary = repo.get("language")
-            return [(primary, GITHUB_LANGUAGE_FALLBACK_BYTES)] if primary else []
-        if repo_id in self.language_usage_cache:
-            return self.language_usage_cache[repo_id]
-
-        url = repo.get("languages_url")
-        if not url:
-            primary = repo.get("language")
-            usage = [(primary, GITHUB_LANGUAGE_FALLBACK_BYTES)] if primary else []
-            self.language_usage_cache[repo_id] = usage
-            return usage
+    @staticmethod
+    def _fallback_language_usage(repo: RepoRecord) -> List[Tuple[str, int]]:
+        return [(repo.language, GITHUB_LANGUAGE_FALLBACK_BYTES)] if repo.language else []
 
-        response = requests.get(url, headers=self.headers(), timeout=GITHUB_REQUEST_TIMEOUT_SECONDS)
-        if response.status_code != 200:
-            primary = repo.get("language")
-            usage = [(primary, GITHUB_LANGUAGE_FALLBACK_BYTES)] if primary else []
-            self.language_usage_cache[repo_id] = usage
-            return usage
+    # This function does turn a languages response into ranked usage.
+    # It falls back to the primary language and reports whether the result may be cached.
+    def _parse_language_usage(self, repo: RepoRecord, response) -> Tuple[List[Tuple[str, int]], bool]:
+        if response.status_code != HTTP_STATUS_OK:
+            return self._fallback_language_usage(repo), response.status_code != HTTP_STATUS_TOO_MANY_REQUESTS
 
         languages = response.json()
         if not isinstance(languages, dict) or not languages:
-            primary = repo.get("language")
-            usage = [(primary, GITHUB_LANGUAGE_FALLBACK_BYTES)] if primary else []
-            self.language_usage_cache[repo_id] = usage
-            return usage
-
-        usage = sorted(languages.items(), key=lambda item: item[1], reverse=True)
-        self.language_usage_cache[repo_id] = usage
-        return usage
+            return self._fallback_language_usage(repo), True
 
-    # This function does fetch contributor count for a repository.
-    # It uses link headers when available and caches results.
-    def fetch_contributor_count(self, repo: dict) -> int:
-        repo_id = repo.get("id")
-        if repo_id is None:
-            return 0
-        
-        if repo_id in self.contributor_count_cache:
-            return self.contributor_count_cache[repo_id]
+        return sorted(languages.items(), key=lambda item: item[1], reverse=True), True
 
-        full_name = repo.get("full_name", "")
-        if not full_name:
-            return 0
-
-        url = f"{GITHUB_API_BASE_URL}{CONTRIBUTORS_ENDPOINT_TEMPLATE.format(full_name=full_name, per_page=GITHUB_CONTRIBUTOR_PER_PAGE)}"
-        response = requests.get(url, headers=self.headers(), timeout=GITHUB_REQUEST_TIMEOUT_SECONDS)
-        if response.status_code != 200:
-            self.contributor_count_cache[repo_id] = 0
-            return 0
+    # This function does read a contributor count from a contributors response.
+    # It prefers the Link header's last page and reports whether the result may be cached.
+    def _parse_contributor_count(self, response) -> Tuple[int, bool]:
+        if response.status_code != HTTP_STATUS_OK:
+            return 0, response.status_code != HTTP_STATUS_TOO_MANY_REQUESTS
 
         last_page = self._parse_last_page_from_link_header(response.headers.get("Link", ""))
         if last_page > 0:
-            self.contributor_count_cache[repo_id] = last_page
-            return last_page
+            return last_page, True
 
         try:
             data = response.json()
             count = len(data) if isinstance(data, list) else 0
         except Exception:
             count = 0
+        return count, True
 
-        self.contributor_count_cache[repo_id] = count
-        return count
+    # This function does return a known contributor count for a repo.
+    # It checks this run's enrichment cache, then the TTL store when that strategy is active.
+    def _lookup_contributor_count(self, repo: RepoRecord) -> Optional[int]:
+        cached = self.enrichment_cache.lookup(repo, ENRICHMENT_CONTRIBUTORS)
+        if cached is not None or self.contributor_store is None:
+            return cached
+        stored = self.contributor_store.lookup(repo.id)
+        if stored is not None:
+            self.enrichment_cache.store(repo, ENRICHMENT_CONTRIBUTORS, stored)
+        return stored
+
+    def _remember_contributor_count(self, repo: RepoRecord, count: int) -> None:
+        self.enrichment_cache.store(repo, ENRICHMENT_CONTRIBUTORS, count)
+        if self.contributor_store is not None:
+            self.contributor_store.store(repo.id, count)
+
+    # This function does batch repos for GraphQL contributor counting.
+    # It returns no batches unless the graphql strategy is active and a token is configured.
+    def _plan_contributor_queries(self, repos: List[RepoRecord]) -> List[Tuple[List[RepoRecord], dict]]:
+        if self.config.contributor_count_strategy != CONTRIBUTOR_COUNT_STRATEGY_GRAPHQL:
+            return []
+        if not self.config.github_token:
+            print(CONTRIBUTOR_GRAPHQL_NO_TOKEN_MESSAGE)
+            return []
+
+        pending = [
+            repo
+            for repo in repos
+            if repo.id is not None and "/" in repo.full_name and self._lookup_contributor_count(repo) is None
+        ]
+        batches = [
+            pending[start:start + GITHUB_GRAPHQL_CONTRIBUTOR_BATCH_SIZE]
+            for start in range(0, len(pending), GITHUB_GRAPHQL_CONTRIBUTOR_BATCH_SIZE)
+        ]
+        if batches:
+            print(CONTRIBUTOR_GRAPHQL_MESSAGE.format(count=len(pending), batches=len(batches)))
+        return [(batch, self._contributor_count_payload(batch)) for batch in batches]
+
+    # This function does build one aliased GraphQL query for a batch of repos.
+    # It passes owners and names as variables so repo names never need escaping.
+    @staticmethod
+    def _contributor_count_payload(batch: List[RepoRecord]) -> dict:
+        declarations = []
+        fields = []
+        variables: Dict[str, str] = {}
+        for index, repo in enumerate(batch):
+            owner, name = repo.full_name.split("/", 1)
+            variables[f"o{index}"] = owner
+            variables[f"n{index}"] = name
+            declarations.append(f"$o{index}: String!, $n{index}: String!")
+            fields.append(CONTRIBUTOR_COUNT_QUERY_FIELD_TEMPLATE.format(index=index))
+        return {"query": f"query({', '.join(declarations)}) {{ {' '.join(fields)} }}", "variables": variables}
+
+    # This function does record the counts returned for one GraphQL batch.
+    # It leaves repos without a count to the REST fallback.
+    def _apply_contributor_counts(self, batch: List[RepoRecord], response) -> None:
+        data = None
+        if response.status_code == HTTP_STATUS_OK:
+            try:
+                data = (response.json() or {}).get("data")
+            except Exception:
+                data = None
+        if not isinstance(data, dict):
+            print(CONTRIBUTOR_GRAPHQL_FAILED_WARNING_TEMPLATE.format(status=response.status_code, count=len(batch)))
+            return
+
+        for index, repo in enumerate(batch):
+            total = ((data.get(f"r{index}") or {}).get("mentionableUsers") or {}).get("totalCount")
+            if isinstance(total, int):
+                self._remember_contributor_count(repo, total)
+
+    def _graphql_url(self) -> str:
+        return f"{self.config.api_base_url}{GITHUB_GRAPHQL_ENDPOINT}"
 
     # This function does parse the last page index from Link headers.
     # It returns zero when the header has no last-page reference.
@@ -199,3 +550,266 @@ class GitHubService:
             return int(match.group(1))
         except ValueError:
             return 0
+
+class GitHubService(GitHubServiceBase):
+
+    # This function does initialize service state and in-memory caches.
+    # It reuses the session, caches, and metrics of a shared service when one is given.
+    def __init__(
+        self,
+        config: UpdateConfig,
+        metrics: Optional[RunMetrics] = None,
+        shared: Optional["GitHubService"] = None,
+        pool_size: int = 0,
+    ):
+        super().__init__(config, metrics, shared)
+        if shared is not None:
+            self.session = shared.session
+            return
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=GITHUB_POOL_CONNECTIONS,
+            pool_maxsize=max(1, pool_size or config.enrichment_workers),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    # This function does persist cached responses and release pooled connections.
+    # It is a no-op for services that borrow another service's session.
+    def close(self) -> None:
+        if not self.owns_session:
+            return
+        self.save_caches()
+        self.session.close()
+
+    # This function does issue a GET request with cache revalidation.
+    # It replays cached bodies on 304 and skips low-priority requests when the budget runs low.
+    def _get(
+        self,
+        url: str,
+        category: str,
+        priority: int = REQUEST_PRIORITY_LISTING,
+        degraded_key: str = "",
+        accept: str = "",
+        body_reader: Optional[Callable[[requests.Response], str]] = None,
+    ):
+        request_headers, cache_key, entry, local_response = self._plan_get(url, category, priority, degraded_key, accept)
+        if local_response is not None:
+            return local_response
+
+        response = self._send(url, request_headers, category, stream=body_reader is not None)
+        if response.status_code == HTTP_STATUS_NOT_MODIFIED and entry is not None:
+            response.close()
+            return self._replay_cached(category, entry)
+
+        if body_reader is not None:
+            raw_response = response
+            try:
+                text = body_reader(raw_response) if raw_response.status_code == HTTP_STATUS_OK else ""
+                response = self._buffered_response(raw_response, text)
+            finally:
+                raw_response.close()
+
+        self._remember_response(cache_key, category, response)
+        return response
+
+    # This function does send a request over the pooled session.
+    # It retries transient failures and rate limits with backoff.
+    def _send(
+        self,
+        url: str,
+        request_headers: Dict[str, str],
+        category: str,
+        json_payload: Optional[dict] = None,
+        stream: bool = False,
+    ):
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                if json_payload is None:
+                    response = self.session.get(
+                        url,
+                        headers=request_headers,
+                        timeout=GITHUB_REQUEST_TIMEOUT_SECONDS,
+                        stream=stream,
+                    )
+                else:
+                    response = self.session.post(
+                        url,
+                        headers=request_headers,
+                        json=json_payload,
+                        timeout=GITHUB_REQUEST_TIMEOUT_SECONDS,
+                    )
+            except (requests.ConnectionError, requests.Timeout):
+                self.metrics.record_request(category, time.perf_counter() - started, 0, 0)
+                if attempt >= GITHUB_MAX_RETRIES:
+                    raise
+                attempt += 1
+                self.metrics.record_retry(category)
+                time.sleep(self._backoff_seconds(attempt))
+                continue
+
+            self.metrics.record_request(
+                category,
+                time.perf_counter() - started,
+                0 if stream else len(response.content or b""),
+                response.status_code,
+            )
+            self.rate_limit.record(response.headers)
+
+            delay = self._retry_delay_seconds(response, attempt + 1)
+            if delay is None or attempt >= GITHUB_MAX_RETRIES or delay > GITHUB_MAX_RETRY_WAIT_SECONDS:
+                return response
+
+            attempt += 1
+            self.metrics.record_retry(category)
+            print(
+                RETRY_MESSAGE_TEMPLATE.format(
+                    url=url,
+                    delay=delay,
+                    status=response.status_code,
+                    attempt=attempt,
+                    max_attempts=GITHUB_MAX_RETRIES,
+                )
+            )
+            response.close()
+            time.sleep(delay)
+
+    # This function does fetch accessible repositories from GitHub.
+    # It projects each listing page onto RepoRecords as the page arrives.
+    def fetch_repos(self) -> List[RepoRecord]:
+        return self._fetch_repo_listing(build_repo_record)
+
+    # This function does fetch the raw repository listing payloads.
+    # It is used to record benchmark fixtures with the full API shape.
+    def fetch_repo_payloads(self) -> List[dict]:
+        return self._fetch_repo_listing(dict)
+
+    # This function does fetch a repository's full README markdown.
+    # It skips condensing and caching so recorded fixtures keep the original text.
+    def fetch_readme_markdown(self, full_name: str) -> str:
+        response = self._get(self._readme_url(full_name), REQUEST_CATEGORY_README)
+        if response.status_code != HTTP_STATUS_OK:
+            return ""
+        return self._decode_readme_markdown(response)
+
+    # This function does page through the repository listing.
+    # It reads the last page from the Link header and fetches the rest concurrently.
+    def _fetch_repo_listing(self, project: Callable[[dict], Any]) -> list:
+        base_url = self._repo_listing_base_url()
+        fetch_page = lambda page: self._fetch_repo_page(base_url, page, project)
+        first_page, link_header = fetch_page(1)
+        pages: List[list] = [first_page]
+        if len(first_page) >= GITHUB_REPOS_PER_PAGE:
+            last_page = min(self._parse_last_page_from_link_header(link_header), self.config.max_repo_pages)
+            if last_page > 1:
+                remaining = range(2, last_page + 1)
+                with ThreadPoolExecutor(max_workers=max(1, min(self.config.enrichment_workers, len(remaining)))) as executor:
+                    pages.extend(data for data, _ in executor.map(fetch_page, remaining))
+            else:
+                page = 2
+                while page <= self.config.max_repo_pages:
+                    data, _ = fetch_page(page)
+                    pages.append(data)
+                    if len(data) < GITHUB_REPOS_PER_PAGE:
+                        break
+                    page += 1
+
+        return self._merge_listing_pages(pages)
+
+    # This function does fetch one page of the repository listing.
+    # It returns the projected page items with the response Link header.
+    def _fetch_repo_page(self, base_url: str, page: int, project: Callable[[dict], Any]) -> Tuple[list, str]:
+        url = self._repo_page_url(base_url, page)
+        return self._parse_repo_page(url, self._get(url, REQUEST_CATEGORY_REPOS), project)
+
+    # This function does fetch and decode repository README text.
+    # It strips non-content lines and caches the condensed text per repo version.
+    def fetch_readme_text(self, repo: RepoRecord, priority: int = REQUEST_PRIORITY_CURRENT) -> str:
+        cached = self.enrichment_cache.lookup(repo, ENRICHMENT_README)
+        if cached is not None:
+            return cached
+
+        full_name = repo.full_name
+        if not full_name:
+            return ""
+
+        url = self._readme_url(full_name)
+        if self.config.readme_streaming:
+            response = self._get(
+                url,
+                REQUEST_CATEGORY_README,
+                priority,
+                degraded_key=full_name,
+                accept=GITHUB_README_RAW_ACCEPT_HEADER,
+                body_reader=self._read_readme_stream,
+            )
+            text = response.text if response.status_code == HTTP_STATUS_OK else ""
+        else:
+            response = self._get(url, REQUEST_CATEGORY_README, priority, degraded_key=full_name)
+            text = self._decode_readme_payload(response) if response.status_code == HTTP_STATUS_OK else ""
+
+        if response.status_code != HTTP_STATUS_TOO_MANY_REQUESTS:
+            self.enrichment_cache.store(repo, ENRICHMENT_README, text)
+        return text
+
+    # This function does condense a streamed raw README body.
+    # It stops reading once the line budget is met or the byte cap is reached.
+    def _read_readme_stream(self, response: requests.Response) -> str:
+        condenser = ReadmeStreamCondenser(self.config.readme_max_bytes)
+        try:
+            for chunk in response.iter_content(chunk_size=GITHUB_README_STREAM_CHUNK_BYTES):
+                if chunk and condenser.feed(chunk):
+                    break
+            return condenser.finish()
+        finally:
+            self.metrics.record_bytes(REQUEST_CATEGORY_README, condenser.bytes_read)
+
+    # This function does fetch language usage for a repository.
+    # It caches results and falls back to the primary language.
+    def fetch_language_usage(self, repo: RepoRecord, priority: int = REQUEST_PRIORITY_CURRENT) -> List[Tuple[str, int]]:
+        if repo.id is None:
+            return self._fallback_language_usage(repo)
+        cached = self.enrichment_cache.lookup(repo, ENRICHMENT_LANGUAGES)
+        if cached is not None:
+            return cached
+
+        if not repo.languages_url:
+            usage = self._fallback_language_usage(repo)
+            self.enrichment_cache.store(repo, ENRICHMENT_LANGUAGES, usage)
+            return usage
+
+        response = self._get(repo.languages_url, REQUEST_CATEGORY_LANGUAGES, priority, degraded_key=repo.full_name)
+        usage, cacheable = self._parse_language_usage(repo, response)
+        if cacheable:
+            self.enrichment_cache.store(repo, ENRICHMENT_LANGUAGES, usage)
+        return usage
+
+    # This function does fetch contributor count for a repository.
+    # It uses link headers when available and caches results.
+    def fetch_contributor_count(self, repo: RepoRecord, priority: int = REQUEST_PRIORITY_CURRENT) -> int:
+        if repo.id is None:
+            return 0
+
+        known = self._lookup_contributor_count(repo)
+        if known is not None:
+            return known
+
+        full_name = repo.full_name
+        if not full_name:
+            return 0
+
+        response = self._get(self._contributors_url(full_name), REQUEST_CATEGORY_CONTRIBUTORS, priority, degraded_key=full_name)
+        count, cacheable = self._parse_contributor_count(response)
+        if cacheable:
+            self._remember_contributor_count(repo, count)
+        return count
+
+    # This function does fetch contributor counts for many repos with batched GraphQL queries.
+    # It only runs for the graphql strategy; repos it misses fall back to REST.
+    def prime_contributor_counts(self, repos: List[RepoRecord]) -> None:
+        for batch, payload in self._plan_contributor_queries(repos):
+            response = self._send(self._graphql_url(), self.headers(), REQUEST_CATEGORY_GRAPHQL, json_payload=payload)
+            self._apply_contributor_counts(batch, response)
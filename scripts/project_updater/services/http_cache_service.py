@@ -0,0 +1,113 @@
+#------------------------------------------------------------
+#                    http_cache_service.py
+#        Persists GitHub responses on disk so later runs
+#             can revalidate them with ETag headers.
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Set
+
+HTTP_CACHE_FORMAT_VERSION = 2
+HTTP_CACHE_LOADED_MESSAGE = "Loaded HTTP cache: {count} entries from {path}"
+HTTP_CACHE_SAVE_WARNING_TEMPLATE = "WARNING: could not write HTTP cache to {path!r}: {error}"
+
+@dataclass
+class HttpCacheEntry:
+    etag: str
+    last_modified: str
+    link: str
+    body: str
+
+class HttpResponseCache:
+
+    # This function does initialize the cache from its JSON store.
+    # It starts empty when the store is missing, invalid, or outdated.
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, HttpCacheEntry] = {}
+        self.touched: Set[str] = set()
+        self.private_keys: Set[str] = set()
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file_handle:
+                data = json.load(file_handle)
+        except Exception:
+            return
+        if not isinstance(data, dict) or data.get("version") != HTTP_CACHE_FORMAT_VERSION:
+            return
+
+        for key, raw_entry in (data.get("entries") or {}).items():
+            if not isinstance(raw_entry, dict):
+                continue
+            self.entries[key] = HttpCacheEntry(
+                etag=str(raw_entry.get("etag") or ""),
+                last_modified=str(raw_entry.get("last_modified") or ""),
+                link=str(raw_entry.get("link") or ""),
+                body=str(raw_entry.get("body") or ""),
+            )
+        print(HTTP_CACHE_LOADED_MESSAGE.format(count=len(self.entries), path=self.path))
+
+    # This function does look up a cached response by key.
+    # It marks the key as used so it survives the next save.
+    def lookup(self, key: str) -> Optional[HttpCacheEntry]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.touched.add(key)
+            return entry
+
+    # This function does record a response body with its validators.
+    # It ignores responses that carry neither an ETag nor Last-Modified.
+    def store(self, key: str, entry: HttpCacheEntry) -> None:
+        if not entry.etag and not entry.last_modified:
+            return
+        with self.lock:
+            self.entries[key] = entry
+            self.touched.add(key)
+
+    # This function does keep a key's response out of the on-disk store.
+    # It is used for private-repo responses, which stay revalidated in memory for the life of the process only.
+    def mark_private(self, key: str) -> None:
+        with self.lock:
+            self.private_keys.add(key)
+
+    # This function does write the entries used in this run to disk.
+    # It drops stale and private entries and replaces the store atomically.
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self.lock:
+            payload = {
+                "version": HTTP_CACHE_FORMAT_VERSION,
+                "entries": {
+                    key: asdict(self.entries[key])
+                    for key in sorted(self.touched - self.private_keys)
+                    if key in self.entries
+                },
+            }
+
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file_handle:
+                json.dump(payload, file_handle)
+            os.replace(temp_path, self.path)
+        except Exception as error:
+            print(HTTP_CACHE_SAVE_WARNING_TEMPLATE.format(path=self.path, error=error))
+
+# This function does build conditional request headers for an entry.
+# It sends whichever validators the cached response provided.
+def conditional_headers(entry: HttpCacheEntry) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
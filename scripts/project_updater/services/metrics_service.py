@@ -0,0 +1,161 @@
+#------------------------------------------------------------
+#                     metrics_service.py
+#        Records request counts, latencies, cache usage,
+#              and phase timings for one run.
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List
+
+# Upper bounds (milliseconds) of the request latency histogram buckets.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+LATENCY_OVERFLOW_LABEL = "inf"
+ERROR_STATUS_THRESHOLD = 400
+
+METRICS_REPORT_VERSION = 1
+METRICS_REPORT_WRITTEN_MESSAGE = "Metrics report written to {path}"
+METRICS_REPORT_WARNING_TEMPLATE = "WARNING: could not write metrics report to {path!r}: {error}"
+PHASE_TABLE_HEADER = f"{'Phase':<24}{'Seconds':>10}"
+REQUEST_TABLE_HEADER = (
+    f"{'Requests':<14}{'Count':>7}{'Errors':>8}{'Retries':>9}{'Hits':>7}{'Misses':>8}"
+    f"{'Degraded':>10}{'KB':>10}{'Avg ms':>9}{'Max ms':>9}"
+)
+
+@dataclass
+class RequestStats:
+    count: int = 0
+    errors: int = 0
+    retries: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    degraded: int = 0
+    bytes: int = 0
+    total_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    latency_histogram: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+class RunMetrics:
+
+    # This function does initialize empty run metrics.
+    # It is shared by every thread issuing requests during the run.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.phases: Dict[str, float] = {}
+        self.requests: Dict[str, RequestStats] = {}
+        self.started_at = time.perf_counter()
+
+    # This function does time one phase of the run.
+    # It accumulates when the same phase runs more than once.
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self.lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    # This function does record one HTTP round-trip.
+    # It updates counts, bytes, and the latency histogram for the category.
+    def record_request(self, category: str, latency_seconds: float, byte_count: int, status_code: int) -> None:
+        latency_ms = latency_seconds * 1000
+        bucket = next(
+            (index for index, bound in enumerate(LATENCY_BUCKETS_MS) if latency_ms <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        with self.lock:
+            stats = self.requests.setdefault(category, RequestStats())
+            stats.count += 1
+            stats.bytes += max(0, byte_count)
+            stats.total_latency_ms += latency_ms
+            stats.max_latency_ms = max(stats.max_latency_ms, latency_ms)
+            stats.latency_histogram[bucket] += 1
+            if status_code >= ERROR_STATUS_THRESHOLD:
+                stats.errors += 1
+
+    def record_bytes(self, category: str, byte_count: int) -> None:
+        with self.lock:
+            self.requests.setdefault(category, RequestStats()).bytes += max(0, byte_count)
+
+    def record_retry(self, category: str) -> None:
+        with self.lock:
+            self.requests.setdefault(category, RequestStats()).retries += 1
+
+    def record_cache(self, category: str, hit: bool) -> None:
+        with self.lock:
+            stats = self.requests.setdefault(category, RequestStats())
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+
+    def record_degraded(self, category: str) -> None:
+        with self.lock:
+            self.requests.setdefault(category, RequestStats()).degraded += 1
+
+    # This function does render the end-of-run summary tables.
+    # It lists phase timings followed by per-category request stats.
+    def render_summary(self) -> str:
+        with self.lock:
+            phases = dict(self.phases)
+            requests = {category: self.requests[category] for category in sorted(self.requests)}
+
+        lines = [PHASE_TABLE_HEADER]
+        for name, seconds in phases.items():
+            lines.append(f"{name:<24}{seconds:>10.2f}")
+        lines.append(f"{'total':<24}{time.perf_counter() - self.started_at:>10.2f}")
+
+        lines.append("")
+        lines.append(REQUEST_TABLE_HEADER)
+        for category, stats in requests.items():
+            average_ms = stats.total_latency_ms / stats.count if stats.count else 0.0
+            lines.append(
+                f"{category:<14}{stats.count:>7}{stats.errors:>8}{stats.retries:>9}{stats.cache_hits:>7}"
+                f"{stats.cache_misses:>8}{stats.degraded:>10}{stats.bytes / 1024:>10.1f}"
+                f"{average_ms:>9.0f}{stats.max_latency_ms:>9.0f}"
+            )
+        return "\n".join(lines)
+
+    # This function does build a JSON-serializable metrics report.
+    # It labels histogram buckets by their upper bound in milliseconds.
+    def to_report(self) -> dict:
+        bucket_labels = [str(bound) for bound in LATENCY_BUCKETS_MS] + [LATENCY_OVERFLOW_LABEL]
+        with self.lock:
+            return {
+                "version": METRICS_REPORT_VERSION,
+                "total_seconds": round(time.perf_counter() - self.started_at, 3),
+                "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+                "requests": {
+                    category: {
+                        "count": stats.count,
+                        "errors": stats.errors,
+                        "retries": stats.retries,
+                        "cache_hits": stats.cache_hits,
+                        "cache_misses": stats.cache_misses,
+                        "degraded": stats.degraded,
+                        "bytes": stats.bytes,
+                        "total_latency_ms": round(stats.total_latency_ms, 1),
+                        "max_latency_ms": round(stats.max_latency_ms, 1),
+                        "latency_histogram_ms": dict(zip(bucket_labels, stats.latency_histogram)),
+                    }
+                    for category, stats in sorted(self.requests.items())
+                },
+            }
+
+    # This function does write the JSON report for CI to archive.
+    # It warns instead of failing the run when the path is not writable.
+    def write_report(self, path: str) -> None:
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as file_handle:
+                json.dump(self.to_report(), file_handle, indent=2, sort_keys=True)
+            print(METRICS_REPORT_WRITTEN_MESSAGE.format(path=path))
+        except Exception as error:
+            print(METRICS_REPORT_WARNING_TEMPLATE.format(path=path, error=error))
@@ -0,0 +1,92 @@
+#------------------------------------------------------------
+#                    rate_limit_service.py
+#        Tracks the GitHub rate-limit budget and decides
+#            which requests are still worth sending.
+
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+# Request priorities, most important first.
+REQUEST_PRIORITY_LISTING = 0
+REQUEST_PRIORITY_CURRENT = 1
+REQUEST_PRIORITY_PAST = 2
+REQUEST_PRIORITY_LANGUAGE_TOTALS = 3
+
+# Share of the hourly limit kept in reserve for higher priorities.
+RATE_LIMIT_RESERVE_FRACTIONS: Dict[int, float] = {
+    REQUEST_PRIORITY_LISTING: 0.0,
+    REQUEST_PRIORITY_CURRENT: 0.05,
+    REQUEST_PRIORITY_PAST: 0.15,
+    REQUEST_PRIORITY_LANGUAGE_TOTALS: 0.25,
+}
+
+RATE_LIMIT_TRACKED_RESOURCE = "core"
+RATE_LIMIT_LOW_WARNING_TEMPLATE = (
+    "WARNING: rate-limit budget low ({remaining}/{limit} left); "
+    "serving cached or fallback data for lower-priority requests"
+)
+
+class RateLimitBudget:
+
+    # This function does initialize an unknown rate-limit budget.
+    # It allows every request until GitHub reports its limits.
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.reset_at: Optional[int] = None
+        self.warned = False
+        self.lock = threading.Lock()
+
+    # This function does update the budget from response headers.
+    # It keeps the lowest remaining count seen within one reset window.
+    def record(self, headers: Mapping[str, str]) -> None:
+        resource = (headers.get("X-RateLimit-Resource") or RATE_LIMIT_TRACKED_RESOURCE).strip().lower()
+        if resource != RATE_LIMIT_TRACKED_RESOURCE:
+            return
+
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        if remaining is None:
+            return
+        limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        reset_at = _parse_int(headers.get("X-RateLimit-Reset"))
+
+        with self.lock:
+            if self.remaining is not None and reset_at == self.reset_at:
+                remaining = min(self.remaining, remaining)
+            self.remaining = remaining
+            self.limit = limit if limit is not None else self.limit
+            self.reset_at = reset_at
+
+    # This function does decide whether a request may use the budget.
+    # It keeps a reserve for higher priorities once the limit is known.
+    def allows(self, priority: int) -> bool:
+        if priority <= REQUEST_PRIORITY_LISTING:
+            return True
+
+        with self.lock:
+            if self.remaining is None or not self.limit:
+                return True
+            if self.reset_at is not None and self.reset_at <= time.time():
+                return True
+
+            reserve = self.limit * RATE_LIMIT_RESERVE_FRACTIONS.get(priority, max(RATE_LIMIT_RESERVE_FRACTIONS.values()))
+            if self.remaining > reserve:
+                return True
+
+            if not self.warned:
+                self.warned = True
+                print(RATE_LIMIT_LOW_WARNING_TEMPLATE.format(remaining=self.remaining, limit=self.limit))
+            return False
+
+    # This function does allow the low-budget warning to print again.
+    # It is called when a long-running process starts a new poll.
+    def rearm_warning(self) -> None:
+        with self.lock:
+            self.warned = False
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
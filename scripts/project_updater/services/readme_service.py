@@ -3,39 +3,147 @@
 #             Provides helpers to read, write, and
 #                  replace README sections.
 
+import difflib
+import hashlib
+import os
 import re
 import sys
-from typing import Iterable, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from ..models import ReadmeWriteResult
 
-SECTION_PATTERN_TEMPLATE = r"({start})\n.*?({end})"
-SECTION_REPLACEMENT_TEMPLATE = r"\1\n{body}\n\2"
 MISSING_MARKER_WARNING_TEMPLATE = "WARNING: marker pair not found: {marker!r}"
 DUPLICATE_MARKER_WARNING_TEMPLATE = "WARNING: duplicate marker pairs found for {marker!r}; collapsing to first occurrence"
 DUPLICATE_SECTION_WARNING_TEMPLATE = "WARNING: duplicate generated heading found for {heading!r}; removing extra blocks"
+SECTION_BLOCK_TEMPLATE = "{start}\n{body}\n{end}"
+
+HEADING_PREFIX = "## "
+SECTION_DIVIDER_SUFFIX_PATTERN = re.compile(r"\n---\n\n$")
+SECTION_NAME_PATTERN = re.compile(r"<!--\s*([A-Za-z0-9_]+):start\s*-->")
 
 # This function does replace a marker-delimited README block.
 # It preserves surrounding content and warns if markers are missing.
 def replace_section(content: str, start_marker: str, end_marker: str, new_body: str) -> str:
-    pattern = re.compile(
-        SECTION_PATTERN_TEMPLATE.format(
-            start=re.escape(start_marker),
-            end=re.escape(end_marker),
-        ),
-        re.DOTALL,
-    )
+    return replace_sections(content, [(start_marker, end_marker, new_body)])
 
-    matches = list(pattern.finditer(content))
-    if len(matches) > 1:
-        print(DUPLICATE_MARKER_WARNING_TEMPLATE.format(marker=start_marker), file=sys.stderr)
-        for duplicate in reversed(matches[1:]):
-            content = content[:duplicate.start()] + content[duplicate.end():]
-        matches = list(pattern.finditer(content))
-
-    replacement = SECTION_REPLACEMENT_TEMPLATE.format(body=new_body)
-    result, count = pattern.subn(replacement, content, count=1)
-    if count == 0:
-        print(MISSING_MARKER_WARNING_TEMPLATE.format(marker=start_marker), file=sys.stderr)
-    return result
+# This function does replace several marker-delimited README blocks in one pass.
+# It collapses duplicate blocks, drops later copies of generated headings, warns on missing markers, and joins the output once.
+def replace_sections(
+    content: str,
+    sections: Sequence[Tuple[str, str, str]],
+    generated_markers: Iterable[str] = (),
+) -> str:
+    targets: Dict[str, Tuple[str, str]] = {start: (end, body) for start, end, body in sections}
+    generated_markers = list(generated_markers)
+    marker_names = [*targets, *(marker for marker in generated_markers if marker not in targets)]
+    if not marker_names:
+        return content
+    start_pattern = re.compile("|".join(f"{re.escape(start)}\n" for start in marker_names))
+
+    # Generated headings are the ones directly above a start marker; walking headings
+    # alongside the markers removes repeated heading blocks without a second pass.
+    dedupe_headings = bool(generated_markers)
+    pieces: List[str] = []
+    replaced: Set[str] = set()
+    duplicates: Set[str] = set()
+    generated_headings: Set[str] = set()
+    warned_headings: Set[str] = set()
+    current_heading = ""
+    cursor = 0
+    search_from = 0
+    match = start_pattern.search(content)
+    heading_index = _find_heading(content, 0) if dedupe_headings else -1
+    while match is not None or heading_index >= 0:
+        if heading_index >= 0 and (match is None or heading_index < match.start()):
+            line_end = content.find("\n", heading_index)
+            if line_end < 0:
+                line_end = len(content)
+            heading = content[heading_index:line_end].strip()
+            if heading not in generated_headings:
+                current_heading = heading
+                search_from = line_end
+            else:
+                if heading not in warned_headings:
+                    warned_headings.add(heading)
+                    print(DUPLICATE_SECTION_WARNING_TEMPLATE.format(heading=heading), file=sys.stderr)
+                next_heading = _find_heading(content, line_end)
+                kept, cursor = _close_seam(
+                    _strip_divider(content[cursor:heading_index]),
+                    content,
+                    next_heading if next_heading >= 0 else len(content),
+                )
+                pieces.append(kept)
+                search_from = cursor
+        else:
+            start_marker = match.group(0)[:-1]
+            search_from = match.end()
+            if current_heading:
+                generated_headings.add(current_heading)
+            end_index = content.find(targets[start_marker][0], match.end()) if start_marker in targets else -1
+            if end_index >= 0:
+                end_marker, body = targets[start_marker]
+                kept = content[cursor:match.start()]
+                cursor = end_index + len(end_marker)
+                if start_marker in replaced:
+                    if start_marker not in duplicates:
+                        duplicates.add(start_marker)
+                        print(DUPLICATE_MARKER_WARNING_TEMPLATE.format(marker=start_marker), file=sys.stderr)
+                    kept, cursor = _close_seam(kept, content, cursor)
+                    pieces.append(kept)
+                else:
+                    replaced.add(start_marker)
+                    pieces.append(kept)
+                    pieces.append(SECTION_BLOCK_TEMPLATE.format(start=start_marker, body=body, end=end_marker))
+                search_from = cursor
+
+        if match is not None and match.start() < search_from:
+            match = start_pattern.search(content, search_from)
+        if 0 <= heading_index < search_from:
+            heading_index = _find_heading(content, search_from)
+
+    for start_marker in targets:
+        if start_marker not in replaced:
+            print(MISSING_MARKER_WARNING_TEMPLATE.format(marker=start_marker), file=sys.stderr)
+
+    pieces.append(content[cursor:])
+    return "".join(pieces)
+
+# This function does find the next level-two heading at or after a position.
+# It returns the heading's line start, or -1 when none remains.
+def _find_heading(content: str, start: int) -> int:
+    if start == 0 and content.startswith(HEADING_PREFIX):
+        return 0
+    index = content.find(f"\n{HEADING_PREFIX}", max(start - 1, 0))
+    return index + 1 if index >= 0 else -1
+
+# This function does drop the divider in front of a removed heading block.
+# It leaves the text unchanged when it does not end with one.
+def _strip_divider(text: str) -> str:
+    divider = SECTION_DIVIDER_SUFFIX_PATTERN.search(text)
+    return text[:divider.start()] if divider else text
+
+# This function does join the text on both sides of a removed block.
+# It caps the newlines meeting at the seam at one blank line and returns the kept text and where copying resumes.
+def _close_seam(kept: str, content: str, resume_at: int) -> Tuple[str, int]:
+    stripped = kept.rstrip("\n")
+    trailing = len(kept) - len(stripped)
+    leading = 0
+    while content.startswith("\n", resume_at + leading):
+        leading += 1
+    if trailing + leading <= 2:
+        return kept, resume_at
+    if leading >= 2:
+        return stripped, resume_at + leading - 2
+    return stripped + "\n" * (2 - leading), resume_at
+
+# This function does report which generated sections have a marker pair in README text.
+# It returns their start markers, using the same matching rules as replace_sections.
+def find_present_sections(content: str, sections: Sequence[Tuple[str, str]]) -> Set[str]:
+    present: Set[str] = set()
+    for start_marker, end_marker in sections:
+        start_index = content.find(f"{start_marker}\n")
+        if start_index >= 0 and content.find(end_marker, start_index + len(start_marker) + 1) >= 0:
+            present.add(start_marker)
+    return present
 
 # This function does load README text from the given path.
 # It reads file content as UTF-8 and returns it.
@@ -44,43 +152,71 @@ def load_readme(path: str) -> str:
         return file_handle.read()
 
 # This function does save README text to the given path.
-# It writes UTF-8 content to overwrite the target file.
-def save_readme(path: str, content: str) -> None:
+# It skips the write when the file already hashes to the same content.
+def save_readme(path: str, content: str) -> bool:
+    if os.path.exists(path):
+        with open(path, "rb") as file_handle:
+            if hashlib.sha256(file_handle.read()).digest() == _content_digest(content):
+                return False
     with open(path, "w", encoding="utf-8") as file_handle:
         file_handle.write(content)
+    return True
+
+# This function does report which generated sections differ between two README texts.
+# It compares each marker-delimited block and returns section names in marker order.
+def detect_changed_sections(original: str, updated: str, sections: Sequence[Tuple[str, str]]) -> List[str]:
+    changed = []
+    for start_marker, end_marker in sections:
+        if _extract_section(original, start_marker, end_marker) != _extract_section(updated, start_marker, end_marker):
+            changed.append(section_name(start_marker))
+    return changed
+
+# This function does write a rewritten README when its content changed.
+# It returns the changed sections, and in dry-run mode a unified diff instead of writing.
+def write_readme_update(
+    path: str,
+    original: str,
+    updated: str,
+    sections: Sequence[Tuple[str, str]],
+    dry_run: bool = False,
+) -> ReadmeWriteResult:
+    if _content_digest(original) == _content_digest(updated):
+        return ReadmeWriteResult(path=path, changed=False)
+
+    result = ReadmeWriteResult(
+        path=path,
+        changed=True,
+        changed_sections=detect_changed_sections(original, updated, sections),
+    )
+    if dry_run:
+        name = os.path.basename(path)
+        result.diff = "".join(
+            difflib.unified_diff(
+                original.splitlines(keepends=True),
+                updated.splitlines(keepends=True),
+                fromfile=f"a/{name}",
+                tofile=f"b/{name}",
+            )
+        )
+        return result
+
+    result.written = save_readme(path, updated)
+    return result
+
+def _content_digest(content: str) -> bytes:
+    return hashlib.sha256(content.encode("utf-8")).digest()
+
+def _extract_section(content: str, start_marker: str, end_marker: str) -> Optional[str]:
+    start_index = content.find(start_marker)
+    if start_index < 0:
+        return None
+    end_index = content.find(end_marker, start_index + len(start_marker))
+    if end_index < 0:
+        return None
+    return content[start_index:end_index + len(end_marker)]
 
-def _collect_generated_headings(content: str, start_markers: Iterable[str]) -> Set[str]:
-    headings: Set[str] = set()
-    for marker in start_markers:
-        marker_pos = content.find(marker)
-        if marker_pos < 0:
-            continue
-        preceding_headings = list(re.finditer(r"^## .+$", content[:marker_pos], flags=re.MULTILINE))
-        if preceding_headings:
-            headings.add(preceding_headings[-1].group(0).strip())
-    return headings
-
-# This function does remove duplicate generated heading sections.
-# It infers headings from marker locations and removes repeated later blocks.
-def remove_duplicate_sections(content: str, start_markers: Iterable[str]) -> str:
-    updated = content
-    generated_headings = _collect_generated_headings(updated, start_markers)
-
-    for heading in generated_headings:
-        matches = list(re.finditer(rf"^{re.escape(heading)}$", updated, flags=re.MULTILINE))
-        if len(matches) <= 1:
-            continue
-
-        print(DUPLICATE_SECTION_WARNING_TEMPLATE.format(heading=heading), file=sys.stderr)
-        for duplicate in reversed(matches[1:]):
-            start = duplicate.start()
-            next_heading = re.search(r"^## ", updated[duplicate.end():], flags=re.MULTILINE)
-            end = duplicate.end() + next_heading.start() if next_heading else len(updated)
-
-            prefix_match = re.search(r"\n---\n\n$", updated[:start])
-            if prefix_match:
-                start = prefix_match.start()
-
-            updated = updated[:start] + updated[end:]
-
-    return re.sub(r"\n{3,}", "\n\n", updated)
+# This function does return the section name inside a start marker.
+# It falls back to the marker itself when the name cannot be parsed.
+def section_name(start_marker: str) -> str:
+    match = SECTION_NAME_PATTERN.search(start_marker)
+    return match.group(1) if match else start_marker
@@ -2,16 +2,14 @@
 #                     resume_service.py
 #         Extracts resume content from a local PDF.
 
+import hashlib
+import json
 import os
 import re
+from dataclasses import asdict
 from typing import Dict, List, Optional
 from ..models import ResumeExperienceEntry, ResumeSnapshot
 
-try:
-    from pypdf import PdfReader
-except Exception:
-    PdfReader = None
-
 MONTH_PATTERN = r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
 DATE_RANGE_PATTERN = re.compile(
     rf"{MONTH_PATTERN}\s+\d{{4}}(?:\s*[-–]\s*|\s{{2,}})(?:{MONTH_PATTERN}\s+\d{{4}}|Present)",
@@ -77,6 +75,12 @@ SKILL_CATEGORY_LABELS = {
     "project management": "Platforms",
 }
 
+# Bump when parsing changes so cached snapshots are rebuilt.
+RESUME_PARSER_VERSION = 1
+RESUME_HASH_CHUNK_BYTES = 1 << 16
+RESUME_CACHE_HIT_MESSAGE = "Resume unchanged - using cached snapshot"
+RESUME_CACHE_SAVE_WARNING_TEMPLATE = "WARNING: could not write resume cache to {path!r}: {error}"
+
 DEFAULT_SKILL_ORDER = ["Languages", "Tools", "Platforms", "Frameworks", "Databases"]
 MAX_HIGHLIGHTS_PER_ROLE = 3
 MIN_HIGHLIGHT_LENGTH = 24
@@ -261,14 +265,56 @@ def _extract_skills(lines: List[str]) -> Dict[str, List[str]]:
             ordered[category] = items
     return ordered
 
-def extract_resume_snapshot(pdf_path: str) -> ResumeSnapshot:
-    if not pdf_path or not os.path.exists(pdf_path) or PdfReader is None:
-        return ResumeSnapshot(experiences=[], skills={})
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(RESUME_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _load_cached_snapshot(cache_path: str, content_hash: str) -> Optional[ResumeSnapshot]:
+    if not cache_path or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+        if data.get("sha256") != content_hash or data.get("parser_version") != RESUME_PARSER_VERSION:
+            return None
+        snapshot = data["snapshot"]
+        return ResumeSnapshot(
+            experiences=[
+                ResumeExperienceEntry(title_line=str(item["title_line"]), highlights=[str(line) for line in item["highlights"]])
+                for item in snapshot["experiences"]
+            ],
+            skills={str(category): [str(item) for item in items] for category, items in snapshot["skills"].items()},
+        )
+    except Exception:
+        return None
+
+def _save_cached_snapshot(cache_path: str, content_hash: str, snapshot: ResumeSnapshot) -> None:
+    temp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as file_handle:
+            json.dump(
+                {"sha256": content_hash, "parser_version": RESUME_PARSER_VERSION, "snapshot": asdict(snapshot)},
+                file_handle,
+                indent=2,
+            )
+        os.replace(temp_path, cache_path)
+    except Exception as error:
+        print(RESUME_CACHE_SAVE_WARNING_TEMPLATE.format(path=cache_path, error=error))
+
+def _parse_resume_pdf(pdf_path: str) -> Optional[ResumeSnapshot]:
+    try:
+        from pypdf import PdfReader
+    except Exception:
+        return None
 
     try:
         reader = PdfReader(pdf_path)
     except Exception:
-        return ResumeSnapshot(experiences=[], skills={})
+        return None
 
     text_lines: List[str] = []
     for page in reader.pages:
@@ -285,4 +331,23 @@ def extract_resume_snapshot(pdf_path: str) -> ResumeSnapshot:
     return ResumeSnapshot(
         experiences=_extract_experience_entries(text_lines),
         skills=_extract_skills(text_lines),
-    )
\ No newline at end of file
+    )
+
+# This function does extract experience and skills from the resume PDF.
+# It reuses the cached snapshot when the PDF hash and parser version match, skipping pypdf entirely.
+def extract_resume_snapshot(pdf_path: str, cache_path: str = "") -> ResumeSnapshot:
+    if not pdf_path or not os.path.exists(pdf_path):
+        return ResumeSnapshot(experiences=[], skills={})
+
+    content_hash = _hash_file(pdf_path) if cache_path else ""
+    cached = _load_cached_snapshot(cache_path, content_hash) if cache_path else None
+    if cached is not None:
+        print(RESUME_CACHE_HIT_MESSAGE)
+        return cached
+
+    snapshot = _parse_resume_pdf(pdf_path)
+    if snapshot is None:
+        return ResumeSnapshot(experiences=[], skills={})
+    if cache_path:
+        _save_cached_snapshot(cache_path, content_hash, snapshot)
+    return snapshot
@@ -0,0 +1,99 @@
+#------------------------------------------------------------
+#                      state_service.py
+#        Stores per-repo presentations between runs so
+#           unchanged repos can skip enrichment.
+
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+from ..models import RepoPresentation, RepoRecord
+
+INCREMENTAL_STATE_VERSION = 2
+STATE_LOADED_MESSAGE = "Loaded incremental state: {count} repos from {path}"
+STATE_RESET_MESSAGE = "Incremental state settings changed - re-enriching every repo"
+STATE_SAVE_WARNING_TEMPLATE = "WARNING: could not write incremental state to {path!r}: {error}"
+
+# This function does fingerprint the settings that shape presentations.
+# It changes whenever cached presentations would render differently.
+def build_state_fingerprint(overrides: Dict[str, str], uses_cap: int, username: str) -> str:
+    payload = json.dumps(
+        {
+            "version": INCREMENTAL_STATE_VERSION,
+            "overrides": overrides,
+            "uses_cap": uses_cap,
+            "username": username.lower(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# This function does load saved repo state from disk.
+# It returns an empty map when the file is missing or the fingerprint differs.
+def load_incremental_state(path: str, fingerprint: str) -> Dict[str, dict]:
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or not isinstance(data.get("repos"), dict):
+        return {}
+    if data.get("fingerprint") != fingerprint:
+        print(STATE_RESET_MESSAGE)
+        return {}
+
+    repos = data["repos"]
+    print(STATE_LOADED_MESSAGE.format(count=len(repos), path=path))
+    return repos
+
+# This function does write repo state for the next run.
+# It replaces the state file atomically and warns on failure.
+def save_incremental_state(path: str, fingerprint: str, repos: Dict[str, dict]) -> None:
+    if not path:
+        return
+    temp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as file_handle:
+            json.dump({"fingerprint": fingerprint, "repos": repos}, file_handle, sort_keys=True)
+        os.replace(temp_path, path)
+    except Exception as error:
+        print(STATE_SAVE_WARNING_TEMPLATE.format(path=path, error=error))
+
+# This function does find a reusable state entry for a repo.
+# It matches on pushed_at, description, and the repo's name and URL, so renamed or transferred repos are rebuilt.
+def lookup_unchanged(state: Dict[str, dict], repo: RepoRecord) -> Optional[Tuple[RepoPresentation, List[Tuple[str, int]]]]:
+    entry = state.get(str(repo.id))
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("pushed_at") != _format_pushed_at(repo):
+        return None
+    if entry.get("description") != repo.description:
+        return None
+    if entry.get("full_name") != repo.full_name or entry.get("html_url") != repo.html_url:
+        return None
+
+    try:
+        presentation = RepoPresentation(**entry["presentation"])
+        language_usage = [(str(language), int(byte_count)) for language, byte_count in entry["language_usage"]]
+    except Exception:
+        return None
+    return presentation, language_usage
+
+# This function does build the state entry stored for a repo.
+# It keeps only the change keys and the computed outputs.
+def build_state_entry(repo: RepoRecord, presentation: RepoPresentation, language_usage: List[Tuple[str, int]]) -> dict:
+    return {
+        "pushed_at": _format_pushed_at(repo),
+        "description": repo.description,
+        "full_name": repo.full_name,
+        "html_url": repo.html_url,
+        "language_usage": [[language, byte_count] for language, byte_count in language_usage],
+        "presentation": asdict(presentation),
+    }
+
+def _format_pushed_at(repo: RepoRecord) -> Optional[str]:
+    return repo.pushed_at.isoformat() if repo.pushed_at is not None else None
@@ -0,0 +1,48 @@
+#------------------------------------------------------------
+#                    test_batch_config.py
+#        Checks that batch manifest values are converted to
+#          their UpdateConfig types or skip their user.
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from project_updater.controller import _build_batch_config
+from project_updater.models import UpdateConfig
+
+BASE_CONFIG = UpdateConfig(github_username="base-user", github_token="token")
+
+class BuildBatchConfigTest(unittest.TestCase):
+
+    def _build(self, entry):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            return _build_batch_config(BASE_CONFIG, {"github_username": "batch-user", **entry}), output.getvalue()
+
+    def test_string_values_are_converted_to_field_types(self):
+        config, output = self._build({
+            "enrichment_workers": "8",
+            "incremental": "yes",
+            "dry_run": False,
+            "excluded_private_repos": ["secret", 7],
+        })
+        self.assertEqual(config.enrichment_workers, 8)
+        self.assertIs(config.incremental, True)
+        self.assertIs(config.dry_run, False)
+        self.assertEqual(config.excluded_private_repos, ["secret", "7"])
+        self.assertEqual(output, "")
+
+    def test_unconvertible_value_skips_the_user_and_names_the_field(self):
+        for field_name, value in (("enrichment_workers", "eight"), ("dry_run", 1), ("excluded_private_repos", "secret")):
+            with self.subTest(field=field_name):
+                config, output = self._build({field_name: value})
+                self.assertIsNone(config)
+                self.assertIn("'batch-user'", output)
+                self.assertIn(repr(field_name), output)
+
+if __name__ == "__main__":
+    unittest.main()
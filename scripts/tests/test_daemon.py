@@ -0,0 +1,158 @@
+#------------------------------------------------------------
+#                        test_daemon.py
+#        Checks that each daemon poll starts from a clean
+#           degraded, warning, and enrichment state.
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from dataclasses import replace
+from unittest import mock
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from project_updater import controller
+from project_updater.config import README_PATH
+from project_updater.services.enrichment_cache_service import ENRICHMENT_LANGUAGES, ENRICHMENT_README, EnrichmentCache
+from project_updater.services.github_service import GitHubService, build_repo_record
+
+USERNAME = "daemon-user"
+DEGRADED_REPO = f"{USERNAME}/flaky-repo"
+REPO_PAYLOADS = [
+    {
+        "id": index + 1,
+        "name": full_name.split("/")[1],
+        "full_name": full_name,
+        "html_url": f"https://github.com/{full_name}",
+        "description": "A tool that builds charts and provides analysis of many data sources quickly.",
+        "pushed_at": "2024-01-0{}T00:00:00Z".format(index + 1),
+        "size": 100,
+        "owner": {"login": USERNAME, "type": "User"},
+        "language": "Python",
+        "languages_url": f"https://api.github.com/repos/{full_name}/languages",
+    }
+    for index, full_name in enumerate([f"{USERNAME}/steady-repo", DEGRADED_REPO])
+]
+
+class FakeClock:
+
+    # This function does stand in for the controller's time module.
+    # It ends the first sleep past the poll interval and interrupts the second.
+    def __init__(self, on_first_sleep):
+        self.now = 0.0
+        self.sleeps = 0
+        self.on_first_sleep = on_first_sleep
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, _: float) -> None:
+        self.sleeps += 1
+        if self.sleeps > 1:
+            raise KeyboardInterrupt
+        self.on_first_sleep()
+        self.now += 10_000
+
+class DaemonPollTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_dir, ignore_errors=True)
+        self.readme_path = os.path.join(self.work_dir, "README.md")
+        shutil.copyfile(README_PATH, self.readme_path)
+        self.state_path = os.path.join(self.work_dir, "state.json")
+        self.polls = 0
+
+    def _load_config(self):
+        environment = {
+            "GITHUB_USERNAME": USERNAME,
+            "GITHUB_TOKEN": "token",
+            "README_PATH": self.readme_path,
+            "INCREMENTAL_UPDATE": "1",
+            "DISABLE_HTTP_CACHE": "1",
+            "METRICS_REPORT_PATH": "",
+        }
+        with mock.patch.dict(os.environ, environment):
+            config = self.original_load_config()
+        return replace(
+            config,
+            resume_path="",
+            state_path=self.state_path,
+            resume_cache_path=os.path.join(self.work_dir, "resume.json"),
+            contributor_store_path=os.path.join(self.work_dir, "contributors.json"),
+        )
+
+    def _saved_repo_names(self):
+        with open(self.state_path, "r", encoding="utf-8") as file_handle:
+            return sorted(entry["full_name"] for entry in json.load(file_handle)["repos"].values())
+
+    def test_repo_degraded_in_first_poll_is_saved_by_the_second(self):
+        services = []
+        saved_after_first_poll = []
+
+        def fetch_repos(service):
+            self.polls += 1
+            return [build_repo_record(payload) for payload in REPO_PAYLOADS]
+
+        def fetch_language_usage(service, repo, priority=0):
+            if self.polls == 1 and repo.full_name == DEGRADED_REPO:
+                # What _plan_get does when the rate-limit budget skips a request.
+                service.degraded_repos.add(repo.full_name)
+                service.rate_limit.warned = True
+                return []
+            return [("Python", 1000)]
+
+        def create_service(config, metrics):
+            service = GitHubService(config, metrics)
+            services.append(service)
+            return service
+
+        def on_first_sleep():
+            saved_after_first_poll.extend(self._saved_repo_names())
+
+        self.original_load_config = controller.load_update_config
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(mock.patch.object(controller, "load_update_config", self._load_config))
+            stack.enter_context(mock.patch.object(controller, "_create_github_service", create_service))
+            stack.enter_context(mock.patch.object(controller, "time", FakeClock(on_first_sleep)))
+            stack.enter_context(mock.patch.object(GitHubService, "fetch_repos", fetch_repos))
+            stack.enter_context(mock.patch.object(GitHubService, "fetch_readme_text", lambda service, repo, priority=0: ""))
+            stack.enter_context(mock.patch.object(GitHubService, "fetch_language_usage", fetch_language_usage))
+            stack.enter_context(mock.patch.object(GitHubService, "fetch_contributor_count", lambda service, repo, priority=0: 1))
+            stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            stack.enter_context(contextlib.redirect_stderr(io.StringIO()))
+            controller.run_daemon()
+
+        self.assertEqual(self.polls, 2)
+        self.assertEqual(saved_after_first_poll, [f"{USERNAME}/steady-repo"])
+        self.assertEqual(self._saved_repo_names(), [DEGRADED_REPO, f"{USERNAME}/steady-repo"])
+        self.assertEqual(services[0].degraded_repos, set())
+        self.assertFalse(services[0].rate_limit.warned)
+
+class EnrichmentCacheEvictionTest(unittest.TestCase):
+
+    def test_evict_stale_keeps_only_the_newest_stored_version(self):
+        cache = EnrichmentCache()
+        old = build_repo_record({**REPO_PAYLOADS[0], "pushed_at": "2024-01-01T00:00:00Z"})
+        new = build_repo_record({**REPO_PAYLOADS[0], "pushed_at": "2024-02-01T00:00:00Z"})
+        other = build_repo_record({**REPO_PAYLOADS[1], "pushed_at": None})
+        cache.store(old, ENRICHMENT_README, "old readme")
+        cache.store(old, ENRICHMENT_LANGUAGES, [("Python", 1)])
+        cache.store(other, ENRICHMENT_README, "other readme")
+        cache.store(new, ENRICHMENT_README, "new readme")
+
+        cache.evict_stale()
+
+        self.assertIsNone(cache.lookup(old, ENRICHMENT_README))
+        self.assertIsNone(cache.lookup(old, ENRICHMENT_LANGUAGES))
+        self.assertEqual(cache.lookup(new, ENRICHMENT_README), "new readme")
+        self.assertEqual(cache.lookup(other, ENRICHMENT_README), "other readme")
+
+if __name__ == "__main__":
+    unittest.main()
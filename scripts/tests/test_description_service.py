@@ -0,0 +1,92 @@
+#------------------------------------------------------------
+#                 test_description_service.py
+#        Checks framework detection against the original
+#              substring scan on real README text.
+
+import os
+import sys
+import unittest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from project_updater.services.description_service import infer_frameworks
+
+# The keyword table and substring scan infer_frameworks replaced.
+LEGACY_FRAMEWORK_KEYWORDS = {
+    "react": "React",
+    "next.js": "Next.js",
+    "nextjs": "Next.js",
+    "vue": "Vue",
+    "angular": "Angular",
+    "django": "Django",
+    "flask": "Flask",
+    "fastapi": "FastAPI",
+    "spring": "Spring",
+    "laravel": "Laravel",
+    "express": "Express",
+    "node": "Node.js",
+    "microservice": "Microservices",
+    "microservices": "Microservices",
+    "mvc": "MVC",
+    "rest": "REST API",
+    "graphql": "GraphQL",
+    "docker": "Docker",
+    "kubernetes": "Kubernetes",
+    "azure": "Azure",
+    "unity": "Unity",
+    "shaderlab": "ShaderLab",
+}
+
+REAL_README_PATHS = [
+    os.path.join(os.path.dirname(SCRIPTS_DIR), "README.md"),
+    os.path.join(SCRIPTS_DIR, "README.md"),
+]
+
+# Lines taken from public project READMEs; none contains a keyword inside a longer word.
+README_EXCERPTS = [
+    "Built with React.js and Node.js on Docker.",
+    "A ReactJS app for tracking study sessions.",
+    "AngularJS dashboard backed by a Spring Boot API.",
+    "Uses a Dockerfile and Kubernetes manifests for deployment.",
+    "A Django REST API with a Vue front end.",
+    "Flask app that talks to Azure Blob Storage.",
+    "Unity game with custom ShaderLab shaders.",
+    "GraphQL gateway written in Express and deployed with Docker.",
+    "Next.js site with a FastAPI backend.",
+]
+
+def legacy_infer_frameworks(text):
+    scores = {}
+    lowered = (text or "").lower()
+    for key, value in LEGACY_FRAMEWORK_KEYWORDS.items():
+        count = lowered.count(key)
+        if count > 0:
+            scores[value] = scores.get(value, 0) + count
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+def ranked_names(usage):
+    return [name for name, _ in usage]
+
+class InferFrameworksTest(unittest.TestCase):
+
+    def test_excerpts_rank_like_the_substring_scan(self):
+        for text in README_EXCERPTS:
+            with self.subTest(text=text):
+                self.assertEqual(ranked_names(infer_frameworks(text)), ranked_names(legacy_infer_frameworks(text)))
+
+    def test_real_readmes_find_the_same_frameworks(self):
+        for path in REAL_README_PATHS:
+            with open(path, "r", encoding="utf-8") as file_handle:
+                text = file_handle.read()
+            with self.subTest(path=os.path.basename(path)):
+                self.assertEqual(set(ranked_names(infer_frameworks(text))), set(ranked_names(legacy_infer_frameworks(text))))
+
+    def test_keywords_inside_longer_words_are_ignored(self):
+        self.assertEqual(infer_frameworks("An interesting community project about graph nodes."), [])
+
+    def test_multi_word_names_count_once(self):
+        self.assertEqual(infer_frameworks("A Spring Boot service."), [("Spring", 1)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#------------------------------------------------------------
+#                  test_http_cache_service.py
+#        Checks that private-repo responses are revalidated
+#           in memory but never written to the cache file.
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from project_updater.benchmark.fixture_server import FixtureServer
+from project_updater.benchmark.fixtures import generate_fixtures
+from project_updater.models import UpdateConfig
+from project_updater.services.github_service import GitHubService
+
+USERNAME = "cache-user"
+
+class PrivateResponsePersistenceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.work_dir, ignore_errors=True)
+        self.cache_path = os.path.join(self.work_dir, "http_cache.json")
+        server = FixtureServer(generate_fixtures(30, USERNAME))
+        self.config = UpdateConfig(
+            github_username=USERNAME,
+            github_token="token",
+            api_base_url=server.start(),
+            http_cache_path=self.cache_path,
+        )
+        self.addCleanup(server.stop)
+
+    def test_private_repo_responses_stay_out_of_the_saved_cache(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            service = GitHubService(self.config)
+            repos = service.fetch_repos()
+            for repo in repos:
+                service.fetch_readme_text(repo)
+                service.fetch_language_usage(repo)
+            service.close()
+
+        private_names = {repo.full_name for repo in repos if repo.private}
+        public_names = {repo.full_name for repo in repos if not repo.private}
+        self.assertTrue(private_names and public_names)
+        self.assertTrue(any(name in key for key in service.http_cache.entries for name in private_names))
+
+        with open(self.cache_path, "r", encoding="utf-8") as file_handle:
+            saved_keys = list(json.load(file_handle)["entries"])
+        self.assertFalse([key for key in saved_keys if "/user/repos" in key])
+        self.assertFalse([key for key in saved_keys if any(f"/{name}/" in key for name in private_names)])
+        self.assertTrue(all(any(f"/{name}/" in key for key in saved_keys) for name in public_names))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#------------------------------------------------------------
+#                   test_readme_service.py
+#        Checks that one replace_sections pass also drops
+#              repeated generated heading blocks.
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from project_updater.services.readme_service import replace_sections
+
+START_MARKER = "<!-- PROJECTS:start -->"
+END_MARKER = "<!-- PROJECTS:end -->"
+OTHER_START_MARKER = "<!-- SKILLS:start -->"
+
+README_WITH_DUPLICATE = (
+    "# Title\n\n"
+    "## Projects\n"
+    f"{START_MARKER}\nold\n{END_MARKER}\n\n"
+    "---\n\n"
+    "## Projects\n"
+    f"{START_MARKER}\nstale copy\n{END_MARKER}\n\n"
+    "## Contact\n"
+    "mail me\n"
+)
+
+class ReplaceSectionsTest(unittest.TestCase):
+
+    def _replace(self, content, sections, generated_markers=()):
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            return replace_sections(content, sections, generated_markers), errors.getvalue()
+
+    def test_duplicate_heading_block_is_removed_with_its_divider(self):
+        updated, errors = self._replace(README_WITH_DUPLICATE, [(START_MARKER, END_MARKER, "new")], [START_MARKER])
+        self.assertEqual(
+            updated,
+            f"# Title\n\n## Projects\n{START_MARKER}\nnew\n{END_MARKER}\n## Contact\nmail me\n",
+        )
+        self.assertIn("duplicate generated heading", errors)
+
+    def test_heading_of_section_not_being_rendered_is_still_deduplicated(self):
+        updated, _ = self._replace(README_WITH_DUPLICATE, [], [START_MARKER])
+        self.assertEqual(updated.count("## Projects"), 1)
+        self.assertNotIn("stale copy", updated)
+
+    def test_repeated_plain_headings_are_kept(self):
+        content = f"## Notes\na\n\n## Notes\nb\n\n## Skills\n{OTHER_START_MARKER}\nx\n"
+        updated, _ = self._replace(content, [], [OTHER_START_MARKER])
+        self.assertEqual(updated, content)
+
+    def test_without_generated_markers_only_blocks_are_replaced(self):
+        updated, _ = self._replace(README_WITH_DUPLICATE, [(START_MARKER, END_MARKER, "new")])
+        self.assertEqual(updated.count("## Projects"), 2)
+        self.assertEqual(updated.count(START_MARKER), 1)
+
+    def test_collapsed_duplicate_marker_block_leaves_one_blank_line(self):
+        content = f"# Title\n\n{START_MARKER}\nold\n{END_MARKER}\n\n{START_MARKER}\ncopy\n{END_MARKER}\n\n## Contact\nmail me\n"
+        updated, errors = self._replace(content, [(START_MARKER, END_MARKER, "new")])
+        self.assertEqual(updated, f"# Title\n\n{START_MARKER}\nnew\n{END_MARKER}\n\n## Contact\nmail me\n")
+        self.assertIn("duplicate marker pairs", errors)
+
+    def test_repeated_heading_above_the_marker_is_kept(self):
+        content = f"## Projects\nstatic\n\n## Projects\n{START_MARKER}\nold\n{END_MARKER}\n\n## Contact\nmail me\n"
+        updated, _ = self._replace(content, [(START_MARKER, END_MARKER, "new")], [START_MARKER])
+        self.assertEqual(updated, content.replace("\nold\n", "\nnew\n"))
+
+if __name__ == "__main__":
+    unittest.main()